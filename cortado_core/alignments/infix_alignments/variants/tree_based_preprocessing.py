@@ -23,6 +23,7 @@ from cortado_core.alignments.infix_alignments import utils as infix_utils
 from cortado_core.process_tree_utils.miscellaneous import is_tau_leaf
 from cortado_core.process_tree_utils.to_petri_net_transition_bordered import (
     apply as pt_to_petri_net,
+    structural_fingerprint,
 )
 
 
@@ -37,29 +38,48 @@ def calculate_optimal_infix_alignment(
     reduce_tree=False,
     copy_tree=True,
     parameters=None,
+    use_extended_net_cache=True,
 ) -> pm4py_typing.AlignmentResult:
-    if copy_tree:
-        process_tree = copy.deepcopy(process_tree)
-
     start = time.time()
 
     try:
-        # reduce the tree always for the not naive approach
-        (
-            net,
-            im,
-            fm,
-            n_added_tau_transitions,
-            unmodified_net_getter,
-        ) = build_extended_petri_net_for_infix_alignments(
-            trace,
-            process_tree,
-            naive,
-            reduce_tree=reduce_tree,
-            use_for_suffix_alignments=False,
-            timeout=timeout,
-            use_cortado_tree_converter=use_cortado_tree_converter,
-        )
+        if use_extended_net_cache:
+            (
+                net,
+                im,
+                fm,
+                n_added_tau_transitions,
+                unmodified_net_getter,
+            ) = extended_net_cache.apply(
+                trace,
+                process_tree,
+                naive,
+                reduce_tree=reduce_tree,
+                use_for_suffix_alignments=False,
+                timeout=timeout,
+                use_cortado_tree_converter=use_cortado_tree_converter,
+                copy_tree=copy_tree,
+            )
+        else:
+            if copy_tree:
+                process_tree = copy.deepcopy(process_tree)
+
+            # reduce the tree always for the not naive approach
+            (
+                net,
+                im,
+                fm,
+                n_added_tau_transitions,
+                unmodified_net_getter,
+            ) = build_extended_petri_net_for_infix_alignments(
+                trace,
+                process_tree,
+                naive,
+                reduce_tree=reduce_tree,
+                use_for_suffix_alignments=False,
+                timeout=timeout,
+                use_cortado_tree_converter=use_cortado_tree_converter,
+            )
     except TimeoutError:
         return {"timeout": True}
 
@@ -113,6 +133,48 @@ def build_extended_petri_net_for_infix_alignments(
     timeout: int,
     use_cortado_tree_converter=False,
 ) -> Tuple[PetriNet, Marking, Marking, int, Any]:
+    (
+        net,
+        new_im,
+        fm,
+        im,
+        n_added_tau_transitions,
+        added_transitions,
+    ) = _build_extended_petri_net(
+        trace,
+        process_tree,
+        naive,
+        reduce_tree,
+        use_for_suffix_alignments,
+        timeout,
+        use_cortado_tree_converter,
+    )
+
+    return (
+        net,
+        new_im,
+        fm,
+        n_added_tau_transitions,
+        lambda: __get_unmodified_net(net, im, fm, added_transitions),
+    )
+
+
+def __get_unmodified_net(net, im, fm, added_transitions):
+    for t in added_transitions:
+        petri_utils.remove_transition(net, t)
+
+    return net, im, fm
+
+
+def _build_extended_petri_net(
+    trace: Trace,
+    process_tree: ProcessTree,
+    naive: bool,
+    reduce_tree: bool,
+    use_for_suffix_alignments: bool,
+    timeout: int,
+    use_cortado_tree_converter: bool,
+) -> Tuple[PetriNet, Marking, Marking, Marking, int, List[PetriNet.Transition]]:
     all_leaf_nodes = search_leaf_nodes_in_tree(process_tree)
     trace_activities = set([e["concept:name"] for e in trace])
     matching_leaf_nodes = get_matching_leaf_nodes(trace_activities, all_leaf_nodes)
@@ -141,20 +203,115 @@ def build_extended_petri_net_for_infix_alignments(
 
     __revert_renaming(net, process_tree, renaming_func)
 
-    return (
-        net,
-        new_im,
-        fm,
-        n_added_tau_transitions,
-        lambda: __get_unmodified_net(net, im, fm, added_transitions),
+    return net, new_im, fm, im, n_added_tau_transitions, added_transitions
+
+
+class ExtendedPetriNetCache:
+    """
+    Least recently used cache of the extended Petri nets of infix and suffix alignments. The extended net
+    only depends on the tree and on the activities of the trace that occur in the tree, hence, it is keyed
+    by the structural fingerprint of the tree, this activity set and the options of the construction.
+    Instead of removing the added transitions after the alignment, the unmodified net is a second net
+    sharing the places and the original transitions with the extended net. Cached nets are shared by all
+    alignments and must not be modified.
+    """
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__entries: collections.OrderedDict[Tuple, Tuple] = (
+            collections.OrderedDict()
+        )
+
+    def apply(
+        self,
+        trace: Trace,
+        process_tree: ProcessTree,
+        naive: bool,
+        reduce_tree: bool,
+        use_for_suffix_alignments: bool,
+        timeout: int,
+        use_cortado_tree_converter=False,
+        copy_tree=True,
+    ) -> Tuple[PetriNet, Marking, Marking, int, Any]:
+        tree_labels = {
+            leaf.label
+            for leaf in search_leaf_nodes_in_tree(process_tree)
+            if leaf.label is not None
+        }
+        key = (
+            structural_fingerprint(process_tree),
+            frozenset(
+                e["concept:name"] for e in trace if e["concept:name"] in tree_labels
+            ),
+            naive,
+            reduce_tree,
+            use_for_suffix_alignments,
+            use_cortado_tree_converter,
+            copy_tree,
+        )
+
+        entry = self.__entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.__entries.move_to_end(key)
+        else:
+            self.misses += 1
+            if copy_tree:
+                process_tree = copy.deepcopy(process_tree)
+            net, new_im, fm, im, n_added, added_transitions = _build_extended_petri_net(
+                trace,
+                process_tree,
+                naive,
+                reduce_tree,
+                use_for_suffix_alignments,
+                timeout,
+                use_cortado_tree_converter,
+            )
+            entry = (
+                net,
+                new_im,
+                fm,
+                n_added,
+                _unmodified_net_view(net, im, fm, added_transitions),
+            )
+            self.__entries[key] = entry
+            if len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+        net, new_im, fm, n_added, unmodified_net = entry
+        return net, new_im, fm, n_added, lambda: unmodified_net
+
+    def clear(self):
+        self.__entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+def _unmodified_net_view(
+    net: PetriNet,
+    im: Marking,
+    fm: Marking,
+    added_transitions: List[PetriNet.Transition],
+) -> Tuple[PetriNet, Marking, Marking]:
+    added_transitions = set(added_transitions)
+    unmodified_net = PetriNet(net.name)
+    unmodified_net.places.update(net.places)
+    unmodified_net.transitions.update(net.transitions - added_transitions)
+    unmodified_net.arcs.update(
+        a
+        for a in net.arcs
+        if a.source not in added_transitions and a.target not in added_transitions
     )
 
+    return unmodified_net, im, fm
 
-def __get_unmodified_net(net, im, fm, added_transitions):
-    for t in added_transitions:
-        petri_utils.remove_transition(net, t)
 
-    return net, im, fm
+extended_net_cache = ExtendedPetriNetCache()
 
 
 def __add_tau_transition_from_new_initial_to_final_place(
@@ -1,5 +1,6 @@
 import sys
 from copy import copy
+from typing import Iterable, List
 
 from pm4py.objects.petri_net.utils import align_utils
 from pm4py.util.xes_constants import DEFAULT_NAME_KEY
@@ -15,17 +16,23 @@ from pm4py.util import typing as pm4pyTyping
 from pm4py.objects.conversion.process_tree import converter as pt_converter
 
 from cortado_core.process_tree_utils.to_petri_net_transition_bordered import (
-    apply as pt_to_petri_net,
+    apply_cached as pt_to_petri_net,
 )
+from cortado_core.alignments.prefix_alignments.incremental import PrefixAlignmentTrie
 from cortado_core.alignments.prefix_alignments.variants import (
     dijkstra_no_heuristics,
     a_star,
+    dijkstra_array_markings,
+    a_star_array_markings,
 )
 
 
 class Variants(Enum):
     VERSION_DIJKSTRA_NO_HEURISTICS = dijkstra_no_heuristics
     VERSION_A_STAR = a_star
+    # opt-in variants storing markings as vectors instead of Marking objects
+    VERSION_DIJKSTRA_ARRAY_MARKINGS = dijkstra_array_markings
+    VERSION_A_STAR_ARRAY_MARKINGS = a_star_array_markings
 
 
 class Parameters(Enum):
@@ -47,13 +54,21 @@ class Parameters(Enum):
     BEST_WORST_COST_INTERNAL = "best_worst_cost_internal"
     FITNESS_ROUND_DIGITS = "fitness_round_digits"
     PARAM_ENFORCE_FIRST_TAU_MOVE = "enforce_first_tau_move"
+    MAX_STATES = "max_states"
 
 
 DEFAULT_VARIANT = Variants.VERSION_A_STAR
 VERSION_DIJKSTRA_NO_HEURISTICS = Variants.VERSION_DIJKSTRA_NO_HEURISTICS
 VERSION_A_STAR = Variants.VERSION_A_STAR
+VERSION_DIJKSTRA_ARRAY_MARKINGS = Variants.VERSION_DIJKSTRA_ARRAY_MARKINGS
+VERSION_A_STAR_ARRAY_MARKINGS = Variants.VERSION_A_STAR_ARRAY_MARKINGS
 
-VERSIONS = {Variants.VERSION_DIJKSTRA_NO_HEURISTICS, Variants.VERSION_A_STAR}
+VERSIONS = {
+    Variants.VERSION_DIJKSTRA_NO_HEURISTICS,
+    Variants.VERSION_A_STAR,
+    Variants.VERSION_DIJKSTRA_ARRAY_MARKINGS,
+    Variants.VERSION_A_STAR_ARRAY_MARKINGS,
+}
 
 
 def calculate_optimal_prefix_alignment(
@@ -87,6 +102,37 @@ def calculate_optimal_prefix_alignment(
     return alignment
 
 
+def calculate_optimal_prefix_alignments(
+    traces: Iterable[Trace],
+    process_tree: ProcessTree,
+    timeout: int = sys.maxsize,
+    use_cortado_tree_converter=False,
+    parameters=None,
+) -> List[pm4pyTyping.AlignmentResult]:
+    """
+    Computes the prefix alignments of many traces with an incremental dijkstra search, traces sharing a
+    prefix continue the search of the prefix (see incremental.PrefixAlignmentTrie)
+    """
+    if use_cortado_tree_converter:
+        net, im, fm = pt_to_petri_net(process_tree)
+    else:
+        net, im, fm = pt_converter.apply(process_tree)
+
+    params = {
+        Parameters.PARAM_MAX_ALIGN_TIME_TRACE: timeout,
+    }
+    trie = PrefixAlignmentTrie(net, im, fm, add_to_parameters(params, parameters))
+
+    alignments = []
+    for trace in traces:
+        alignment = __add_fitness(trie.align(trace), trace)
+        if alignment is not None:
+            alignment["net"] = (net, im, fm)
+        alignments.append(alignment)
+
+    return alignments
+
+
 def __get_prefix_alignment_variant(use_dijkstra: bool):
     if use_dijkstra:
         return VERSION_DIJKSTRA_NO_HEURISTICS
@@ -151,6 +197,39 @@ def apply_trace(
         trace, petri_net, initial_marking, final_marking, parameters=parameters
     )
 
+    return __add_fitness(ali, trace)
+
+
+def apply_traces(
+    traces,
+    petri_net,
+    initial_marking,
+    final_marking,
+    parameters=None,
+):
+    """
+    Computes the prefix alignments of many traces against the same model using the a_star variant. The
+    model part of the synchronous product is prepared once (see a_star.PreparedModel), only the trace part
+    is built per trace.
+    Parameters are the same as for apply_trace.
+    """
+    if parameters is None:
+        parameters = copy({PARAMETER_CONSTANT_ACTIVITY_KEY: DEFAULT_NAME_KEY})
+
+    prepared_model = a_star.PreparedModel(
+        petri_net, initial_marking, final_marking, parameters=parameters
+    )
+
+    return [
+        __add_fitness(
+            a_star.apply_prepared(trace, prepared_model, parameters=copy(parameters)),
+            trace,
+        )
+        for trace in traces
+    ]
+
+
+def __add_fitness(ali, trace):
     if ali is None:
         return None
 
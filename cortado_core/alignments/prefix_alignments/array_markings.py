@@ -0,0 +1,48 @@
+from typing import List
+
+import numpy as np
+from pm4py.objects.petri_net.obj import Marking, PetriNet
+
+
+class IndexedSynchronousProduct:
+    """
+    Synchronous product whose places and transitions are mapped to integer indices. Markings are NumPy
+    vectors of token counts, i.e., checking which transitions are enabled and firing transitions are vector
+    operations, and closed sets store the bytes of the vectors instead of hashing Marking objects.
+    The transitions must be decorated with their sub and add markings (decorate_transitions_prepostset).
+    """
+
+    def __init__(
+        self, places: List[PetriNet.Place], transitions: List[PetriNet.Transition]
+    ):
+        self.places = places
+        self.transitions = transitions
+        self.place_indices = {p: i for i, p in enumerate(places)}
+
+        self.pre = np.zeros((len(transitions), len(places)), dtype=np.int32)
+        self.effect = np.zeros((len(transitions), len(places)), dtype=np.int32)
+        for i, t in enumerate(transitions):
+            for p, n in t.sub_marking.items():
+                self.pre[i, self.place_indices[p]] = n
+            for p, n in t.add_marking.items():
+                self.effect[i, self.place_indices[p]] = n
+
+    def encode(self, marking: Marking) -> np.ndarray:
+        vector = np.zeros(len(self.places), dtype=np.int32)
+        for p, n in marking.items():
+            vector[self.place_indices[p]] = n
+
+        return vector
+
+    def decode(self, vector: np.ndarray) -> Marking:
+        return Marking({self.places[i]: int(vector[i]) for i in np.flatnonzero(vector)})
+
+    def enabled_transitions(self, vector: np.ndarray) -> np.ndarray:
+        return np.flatnonzero((self.pre <= vector).all(axis=1))
+
+    def fire(self, vector: np.ndarray, transition: int) -> np.ndarray:
+        return vector + self.effect[transition]
+
+
+def marking_key(vector: np.ndarray) -> bytes:
+    return vector.tobytes()
@@ -0,0 +1,243 @@
+import heapq
+import sys
+import time
+from copy import copy
+from typing import Any, Dict, Iterable, List, Optional
+
+from pm4py.objects.log.obj import Trace
+from pm4py.objects.petri_net.obj import Marking, PetriNet
+from pm4py.objects.petri_net.utils import align_utils as utils
+from pm4py.objects.petri_net.utils.petri_utils import (
+    decorate_places_preset_trans,
+    decorate_transitions_prepostset,
+)
+from pm4py.util import exec_utils, typing
+from pm4py.util.xes_constants import DEFAULT_NAME_KEY
+
+from cortado_core.alignments.prefix_alignments.variants.a_star import (
+    standard_model_cost_functions,
+)
+from cortado_core.alignments.prefix_alignments.variants.dijkstra_no_heuristics import (
+    Parameters,
+)
+
+
+class IncrementalPrefixAlignment:
+    """
+    Dijkstra search for the optimal prefix alignment of a growing trace. The states are pairs of a model
+    marking and the number of consumed events, i.e., the synchronous product is explored implicitly.
+    Appending an event only adds arcs leaving states that consumed all previous events. These states are
+    never expanded before the event is known, hence, the open and closed sets of the previous prefix stay
+    valid and the search continues from its frontier instead of restarting.
+    The moves of the alignments equal the ones of the dijkstra_no_heuristics variant.
+    """
+
+    def __init__(
+        self,
+        petri_net: PetriNet,
+        initial_marking: Marking,
+        final_marking: Marking,
+        parameters: Optional[Dict[Any, Any]] = None,
+    ):
+        if parameters is None:
+            parameters = {}
+
+        self.activity_key = exec_utils.get_param_value(
+            Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY
+        )
+        self.ret_tuple_as_trans_desc = exec_utils.get_param_value(
+            Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE, parameters, False
+        )
+        self.max_align_time_trace = exec_utils.get_param_value(
+            Parameters.PARAM_MAX_ALIGN_TIME_TRACE, parameters, sys.maxsize
+        )
+        self.model_cost_function = exec_utils.get_param_value(
+            Parameters.PARAM_MODEL_COST_FUNCTION, parameters, None
+        )
+        self.sync_cost_function = exec_utils.get_param_value(
+            Parameters.PARAM_SYNC_COST_FUNCTION, parameters, None
+        )
+        if self.model_cost_function is None or self.sync_cost_function is None:
+            (
+                self.model_cost_function,
+                self.sync_cost_function,
+            ) = standard_model_cost_functions(petri_net)
+
+        decorate_transitions_prepostset(petri_net)
+        decorate_places_preset_trans(petri_net)
+        self.trans_empty_preset = [
+            t for t in petri_net.transitions if len(t.in_arcs) == 0
+        ]
+
+        self.activities: List[str] = []
+        self.visited = 0
+        self.queued = 0
+        self.traversed = 0
+
+        self.__open = [
+            utils.DijkstraSearchTuple(0, (initial_marking, 0), None, None, 0)
+        ]
+        self.__closed = set()
+        self.__goal: Optional[utils.DijkstraSearchTuple] = None
+
+    def copy(self) -> "IncrementalPrefixAlignment":
+        """
+        Copies the search state, the search states themselves are immutable and shared
+        """
+        other = copy(self)
+        other.activities = list(self.activities)
+        other.__open = list(self.__open)
+        other.__closed = set(self.__closed)
+
+        return other
+
+    def append(self, activity: str):
+        if self.__goal is not None:
+            # the goal of the previous prefix was not expanded, it is the best state to continue with
+            heapq.heappush(self.__open, self.__goal)
+            self.__goal = None
+
+        self.activities.append(activity)
+
+    def extend(self, trace: Iterable):
+        for event in trace:
+            self.append(event[self.activity_key])
+
+    def align(self) -> Optional[typing.AlignmentResult]:
+        """
+        Returns the optimal prefix alignment of the events appended so far, or None if the time limit is
+        exceeded. The search can be continued by calling align again.
+        """
+        if self.__goal is None:
+            self.__goal = self.__search()
+            if self.__goal is None:
+                return None
+
+        return self.__reconstruct_alignment(self.__goal)
+
+    def __search(self) -> Optional[utils.DijkstraSearchTuple]:
+        start_time = time.time()
+        n_events = len(self.activities)
+
+        while len(self.__open) > 0:
+            if (time.time() - start_time) > self.max_align_time_trace:
+                return None
+
+            curr = heapq.heappop(self.__open)
+            if curr.m in self.__closed:
+                continue
+
+            marking, consumed_events = curr.m
+            if consumed_events == n_events:
+                return curr
+
+            self.__closed.add(curr.m)
+            self.visited += 1
+
+            enabled_trans = set(self.trans_empty_preset)
+            for p in marking:
+                for t in p.ass_trans:
+                    if t.sub_marking <= marking:
+                        enabled_trans.add(t)
+
+            activity = self.activities[consumed_events]
+            # named like the transitions of trace nets
+            trace_transition = "t_" + activity + "_" + str(consumed_events)
+            self.__queue(
+                curr,
+                (marking, consumed_events + 1),
+                utils.STD_MODEL_LOG_MOVE_COST,
+                ((trace_transition, utils.SKIP), (activity, utils.SKIP)),
+            )
+
+            for t in enabled_trans:
+                new_marking = utils.add_markings(marking, t.add_marking)
+                self.__queue(
+                    curr,
+                    (new_marking, consumed_events),
+                    self.model_cost_function[t],
+                    ((utils.SKIP, t.name), (utils.SKIP, t.label)),
+                )
+                if t.label == activity:
+                    self.__queue(
+                        curr,
+                        (new_marking, consumed_events + 1),
+                        self.sync_cost_function[t],
+                        ((trace_transition, t.name), (activity, t.label)),
+                    )
+
+        return None
+
+    def __queue(self, curr, state, cost, move):
+        self.traversed += 1
+        if state in self.__closed:
+            return
+
+        self.queued += 1
+        heapq.heappush(
+            self.__open,
+            utils.DijkstraSearchTuple(curr.g + cost, state, curr, move, curr.l + 1),
+        )
+
+    def __reconstruct_alignment(self, state) -> typing.AlignmentResult:
+        cost = state.g
+        alignment = []
+        while state.p is not None:
+            name, label = state.t
+            alignment.append((name, label) if self.ret_tuple_as_trans_desc else label)
+            state = state.p
+        alignment.reverse()
+
+        return {
+            "alignment": alignment,
+            "cost": cost,
+            "visited_states": self.visited,
+            "queued_states": self.queued,
+            "traversed_arcs": self.traversed,
+            "lp_solved": 0,
+        }
+
+
+class PrefixAlignmentTrie:
+    """
+    Trie of the already aligned traces. Every node holds the search of the prefix it represents, aligning
+    a trace continues the search of its longest already aligned prefix, i.e., traces sharing a prefix
+    share the search effort for it. The searches of all nodes are kept in memory.
+    """
+
+    def __init__(
+        self,
+        petri_net: PetriNet,
+        initial_marking: Marking,
+        final_marking: Marking,
+        parameters: Optional[Dict[Any, Any]] = None,
+    ):
+        self.root = PrefixAlignmentTrieNode(
+            IncrementalPrefixAlignment(
+                petri_net, initial_marking, final_marking, parameters
+            )
+        )
+        self.activity_key = self.root.search.activity_key
+
+    def align(self, trace: Trace) -> Optional[typing.AlignmentResult]:
+        node = self.root
+        for event in trace:
+            activity = event[self.activity_key]
+            child = node.children.get(activity)
+            if child is None:
+                # align the prefix first, its frontier is shared by all extensions
+                if node.search.align() is None:
+                    return None
+                search = node.search.copy()
+                search.append(activity)
+                child = PrefixAlignmentTrieNode(search)
+                node.children[activity] = child
+            node = child
+
+        return node.search.align()
+
+
+class PrefixAlignmentTrieNode:
+    def __init__(self, search: IncrementalPrefixAlignment):
+        self.search = search
+        self.children: Dict[str, PrefixAlignmentTrieNode] = {}
@@ -3,3 +3,63 @@ from pm4py.objects.petri_net.utils import align_utils
 
 def __place_from_spn_belongs_to_trace_net_part(place):
     return place.name[1] == align_utils.SKIP
+
+
+def __produced_trace_place(log_move):
+    # moves of prepared models have no arcs, their effect is only stored in their markings
+    return next(
+        p
+        for p, n in log_move.add_marking.items()
+        if n > 0 and __place_from_spn_belongs_to_trace_net_part(p)
+    )
+
+
+def complete_with_log_moves(
+    states, initial_marking, consuming_transitions, cost_function, skip
+):
+    """
+    Completes the search state whose completion by log moves, i.e., not aligning the remaining events, is the
+    cheapest and returns the completed state. Used to return an approximate prefix alignment once a search
+    exceeds its state limit, the returned state is a goal state of the synchronous product.
+    """
+    place = next(
+        p for p in initial_marking if __place_from_spn_belongs_to_trace_net_part(p)
+    )
+    log_moves = {}
+    while True:
+        t = next(
+            (
+                t
+                for t in consuming_transitions[place]
+                if align_utils.__is_log_move(t, skip)
+            ),
+            None,
+        )
+        if t is None:
+            break
+        log_moves[place] = t
+        place = __produced_trace_place(t)
+
+    remaining_costs = {place: 0}
+    for p, t in reversed(list(log_moves.items())):
+        remaining_costs[p] = remaining_costs[place] + cost_function[t]
+        place = p
+
+    def trace_place(state):
+        return next(p for p in state.m if __place_from_spn_belongs_to_trace_net_part(p))
+
+    state = min(states, key=lambda s: s.g + remaining_costs[trace_place(s)])
+    marking = state.m
+    place = trace_place(state)
+    # the search tuples of the a star variant do not store the length of the path
+    length = getattr(state, "l", 0)
+    while place in log_moves:
+        t = log_moves[place]
+        marking = align_utils.add_markings(marking, t.add_marking)
+        length += 1
+        state = align_utils.DijkstraSearchTuple(
+            state.g + cost_function[t], marking, state, t, length
+        )
+        place = __produced_trace_place(t)
+
+    return state
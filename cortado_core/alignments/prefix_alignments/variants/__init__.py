@@ -1,4 +1,6 @@
 from cortado_core.alignments.prefix_alignments.variants import (
     dijkstra_no_heuristics,
     a_star,
+    dijkstra_array_markings,
+    a_star_array_markings,
 )
@@ -9,6 +9,7 @@ import numpy as np
 from ortools.linear_solver import pywraplp
 
 from pm4py.objects.log import obj as log_implementation
+from pm4py.objects.petri_net import properties
 from pm4py.objects.petri_net.utils import align_utils as utils
 from pm4py.objects.petri_net.utils.synchronous_product import (
     construct_cost_aware,
@@ -23,7 +24,7 @@ from pm4py.util import exec_utils
 from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
 from pm4py.util.lp import solver as lp_solver
 from pm4py.util.xes_constants import DEFAULT_NAME_KEY
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, List, Union
 from pm4py.objects.log.obj import Trace
 from pm4py.objects.petri_net.obj import PetriNet, Marking
 from pm4py.util import typing
@@ -31,6 +32,12 @@ from pm4py.objects.petri_net.utils.incidence_matrix import (
     construct as inc_mat_construct,
 )
 
+from cortado_core.alignments.prefix_alignments import utils as prefix_utils
+from cortado_core.alignments.prefix_alignments.array_markings import (
+    IndexedSynchronousProduct,
+    marking_key,
+)
+
 
 class Parameters(Enum):
     PARAM_TRACE_COST_FUNCTION = "trace_cost_function"
@@ -46,6 +53,10 @@ class Parameters(Enum):
     ACTIVITY_KEY = PARAMETER_CONSTANT_ACTIVITY_KEY
     VARIANTS_IDX = "variants_idx"
     RETURN_SYNC_COST_FUNCTION = "return_sync_cost_function"
+    WARM_STARTED_LP = "warm_started_lp"
+    LP_REUSE_BASIS = "lp_reuse_basis"
+    ARRAY_MARKINGS = "array_markings"
+    MAX_STATES = "max_states"
 
 
 PARAM_TRACE_COST_FUNCTION = Parameters.PARAM_TRACE_COST_FUNCTION.value
@@ -85,15 +96,55 @@ def apply(
     if parameters is None:
         parameters = {}
 
+    model_cost_function = exec_utils.get_param_value(
+        Parameters.PARAM_MODEL_COST_FUNCTION, parameters, None
+    )
+
+    if model_cost_function is None:
+        model_cost_function, sync_cost_function = standard_model_cost_functions(
+            petri_net
+        )
+        parameters[Parameters.PARAM_MODEL_COST_FUNCTION] = model_cost_function
+        parameters[Parameters.PARAM_SYNC_COST_FUNCTION] = sync_cost_function
+
+    trace_net, trace_im, trace_fm = __construct_trace_net(trace, parameters)
+
+    alignment = apply_trace_net(
+        petri_net,
+        initial_marking,
+        final_marking,
+        trace_net,
+        trace_im,
+        trace_fm,
+        parameters,
+    )
+
+    return alignment
+
+
+def standard_model_cost_functions(petri_net: PetriNet):
+    """
+    Returns the standard model move and synchronous move costs of the transitions of a net
+    """
+    model_cost_function = dict()
+    sync_cost_function = dict()
+    for t in petri_net.transitions:
+        if t.label is not None:
+            model_cost_function[t] = utils.STD_MODEL_LOG_MOVE_COST
+            sync_cost_function[t] = utils.STD_SYNC_COST
+        else:
+            model_cost_function[t] = utils.STD_TAU_COST
+
+    return model_cost_function, sync_cost_function
+
+
+def __construct_trace_net(trace: Trace, parameters: Dict[Union[str, Parameters], Any]):
     activity_key = exec_utils.get_param_value(
         Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY
     )
     trace_cost_function = exec_utils.get_param_value(
         Parameters.PARAM_TRACE_COST_FUNCTION, parameters, None
     )
-    model_cost_function = exec_utils.get_param_value(
-        Parameters.PARAM_MODEL_COST_FUNCTION, parameters, None
-    )
     trace_net_constr_function = exec_utils.get_param_value(
         Parameters.TRACE_NET_CONSTR_FUNCTION, parameters, None
     )
@@ -107,19 +158,6 @@ def apply(
         trace_cost_function = list(map(lambda e: utils.STD_MODEL_LOG_MOVE_COST, trace))
         parameters[Parameters.PARAM_TRACE_COST_FUNCTION] = trace_cost_function
 
-    if model_cost_function is None:
-        # reset variables value
-        model_cost_function = dict()
-        sync_cost_function = dict()
-        for t in petri_net.transitions:
-            if t.label is not None:
-                model_cost_function[t] = utils.STD_MODEL_LOG_MOVE_COST
-                sync_cost_function[t] = utils.STD_SYNC_COST
-            else:
-                model_cost_function[t] = utils.STD_TAU_COST
-        parameters[Parameters.PARAM_MODEL_COST_FUNCTION] = model_cost_function
-        parameters[Parameters.PARAM_SYNC_COST_FUNCTION] = sync_cost_function
-
     if trace_net_constr_function is not None:
         # keep the possibility to pass TRACE_NET_CONSTR_FUNCTION in this old version
         trace_net, trace_im, trace_fm = trace_net_constr_function(
@@ -135,17 +173,7 @@ def apply(
             trace, trace_cost_function, activity_key=activity_key
         )
 
-    alignment = apply_trace_net(
-        petri_net,
-        initial_marking,
-        final_marking,
-        trace_net,
-        trace_im,
-        trace_fm,
-        parameters,
-    )
-
-    return alignment
+    return trace_net, trace_im, trace_fm
 
 
 def apply_trace_net(
@@ -252,6 +280,16 @@ def apply_trace_net(
         utils.SKIP,
         ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
         max_align_time_trace=max_align_time_trace,
+        warm_started_lp=exec_utils.get_param_value(
+            Parameters.WARM_STARTED_LP, parameters, True
+        ),
+        lp_reuse_basis=exec_utils.get_param_value(
+            Parameters.LP_REUSE_BASIS, parameters, True
+        ),
+        array_markings=exec_utils.get_param_value(
+            Parameters.ARRAY_MARKINGS, parameters, False
+        ),
+        max_states=exec_utils.get_param_value(Parameters.MAX_STATES, parameters, None),
     )
 
     return_sync_cost = exec_utils.get_param_value(
@@ -264,6 +302,291 @@ def apply_trace_net(
     return alignment
 
 
+class PreparedModel:
+    """
+    Model part of the synchronous product of a net, i.e., the model places, the model moves decorated with
+    their sub and add markings, the model part of the incidence matrix, and the costs. It is computed once
+    for aligning many traces against the same net, per trace only the trace net part is added (see
+    apply_prepared). The prepared objects are not modified by alignment computations.
+    """
+
+    def __init__(
+        self,
+        petri_net: PetriNet,
+        initial_marking: Marking,
+        final_marking: Marking,
+        parameters: Optional[Dict[Union[str, Parameters], Any]] = None,
+    ):
+        """
+        :param parameters: optional model and sync cost functions (Parameters.PARAM_MODEL_COST_FUNCTION,
+        Parameters.PARAM_SYNC_COST_FUNCTION), the standard costs are used otherwise
+        """
+        if parameters is None:
+            parameters = {}
+
+        model_cost_function = exec_utils.get_param_value(
+            Parameters.PARAM_MODEL_COST_FUNCTION, parameters, None
+        )
+        sync_cost_function = exec_utils.get_param_value(
+            Parameters.PARAM_SYNC_COST_FUNCTION, parameters, None
+        )
+        if model_cost_function is None or sync_cost_function is None:
+            model_cost_function, sync_cost_function = standard_model_cost_functions(
+                petri_net
+            )
+
+        self.petri_net = petri_net
+        self.transitions = list(petri_net.transitions)
+
+        place_map = {}
+        for p in petri_net.places:
+            place_map[p] = PetriNet.Place((utils.SKIP, p.name))
+        self.places = list(place_map.values())
+        self.place_indices = {p: i for i, p in enumerate(self.places)}
+
+        self.model_moves = []
+        self.model_costs = []
+        self.sync_costs = []
+        self.transitions_by_label: Dict[Any, List[int]] = {}
+        self.incidence = np.zeros((len(self.places), len(self.transitions)))
+        for i, t in enumerate(self.transitions):
+            move = PetriNet.Transition((utils.SKIP, t.name), (utils.SKIP, t.label))
+            move.sub_marking = Marking()
+            move.add_marking = Marking()
+            for arc in t.in_arcs:
+                place = place_map[arc.source]
+                move.sub_marking[place] = arc.weight
+                move.add_marking[place] -= arc.weight
+                self.incidence[self.place_indices[place], i] -= arc.weight
+            for arc in t.out_arcs:
+                place = place_map[arc.target]
+                move.add_marking[place] += arc.weight
+                self.incidence[self.place_indices[place], i] += arc.weight
+
+            self.model_moves.append(move)
+            self.model_costs.append(model_cost_function[t])
+            self.sync_costs.append(sync_cost_function.get(t))
+            if t.label is not None:
+                self.transitions_by_label.setdefault(t.label, []).append(i)
+
+        self.consuming_transitions: Dict[PetriNet.Place, List] = {
+            p: [] for p in self.places
+        }
+        for move in self.model_moves:
+            for place in move.sub_marking:
+                self.consuming_transitions[place].append(move)
+        self.moves_with_empty_preset = [
+            move for move in self.model_moves if len(move.sub_marking) == 0
+        ]
+
+        self.initial_marking = Marking(
+            {place_map[p]: n for p, n in initial_marking.items()}
+        )
+        self.final_marking = Marking(
+            {place_map[p]: n for p, n in final_marking.items()}
+        )
+
+
+class SynchronousProductIndices:
+    """
+    Indices of the places and transitions of a synchronous product built from a PreparedModel, it replaces
+    the incidence matrix of pm4py in the search
+    """
+
+    def __init__(self, places: List, transitions: List, a_matrix: np.ndarray):
+        self.places = {p: i for i, p in enumerate(places)}
+        self.transitions = {t: i for i, t in enumerate(transitions)}
+        self.a_matrix = a_matrix
+
+    def encode_marking(self, marking: Marking) -> List[int]:
+        x = [0] * len(self.places)
+        for p, n in marking.items():
+            x[self.places[p]] = n
+        return x
+
+
+def apply_prepared(
+    trace: Trace,
+    prepared_model: PreparedModel,
+    parameters: Optional[Dict[Union[str, Parameters], Any]] = None,
+) -> typing.AlignmentResult:
+    """
+    Counterpart of apply for a PreparedModel, the cost functions of the model are the ones of the prepared
+    model. Supports the same trace related parameters as apply.
+    """
+    if parameters is None:
+        parameters = {}
+
+    start_time = time.time()
+    trace_net, trace_im, trace_fm = __construct_trace_net(trace, parameters)
+    trace_net_costs = exec_utils.get_param_value(
+        Parameters.PARAM_TRACE_NET_COSTS, parameters, None
+    )
+    if trace_net_costs is None:
+        trace_net_costs = {
+            t: utils.STD_MODEL_LOG_MOVE_COST for t in trace_net.transitions
+        }
+
+    (
+        ini,
+        fin,
+        cost_function,
+        heuristic_matrices,
+        consuming_transitions,
+        trans_empty_preset,
+    ) = __extend_prepared_model(
+        prepared_model, trace_net, trace_im, trace_fm, trace_net_costs
+    )
+
+    return __search_decorated(
+        ini,
+        fin,
+        cost_function,
+        heuristic_matrices,
+        consuming_transitions,
+        trans_empty_preset,
+        utils.SKIP,
+        start_time,
+        ret_tuple_as_trans_desc=exec_utils.get_param_value(
+            Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE, parameters, False
+        ),
+        max_align_time_trace=exec_utils.get_param_value(
+            Parameters.PARAM_MAX_ALIGN_TIME_TRACE, parameters, sys.maxsize
+        ),
+        warm_started_lp=exec_utils.get_param_value(
+            Parameters.WARM_STARTED_LP, parameters, True
+        ),
+        lp_reuse_basis=exec_utils.get_param_value(
+            Parameters.LP_REUSE_BASIS, parameters, True
+        ),
+        array_markings=exec_utils.get_param_value(
+            Parameters.ARRAY_MARKINGS, parameters, False
+        ),
+        max_states=exec_utils.get_param_value(Parameters.MAX_STATES, parameters, None),
+    )
+
+
+def __extend_prepared_model(
+    prepared_model: PreparedModel, trace_net, trace_im, trace_fm, trace_net_costs
+):
+    """
+    Adds the trace net part, i.e., the log moves and the synchronous moves, to a prepared model. The rows of
+    the incidence matrix are the model places followed by the trace places, its columns are the model
+    moves followed by the log moves and the synchronous moves.
+    """
+    trace_places = list(trace_net.places)
+    trace_transitions = list(trace_net.transitions)
+
+    place_map = {}
+    for p in trace_places:
+        place = PetriNet.Place((p.name, utils.SKIP))
+        if properties.TRACE_NET_PLACE_INDEX in p.properties:
+            place.properties[properties.TRACE_NET_PLACE_INDEX] = p.properties[
+                properties.TRACE_NET_PLACE_INDEX
+            ]
+        place_map[p] = place
+    places = prepared_model.places + list(place_map.values())
+    n_model_places = len(prepared_model.places)
+    trace_place_indices = {p: i for i, p in enumerate(trace_places)}
+
+    trace_incidence = np.zeros((len(trace_places), len(trace_transitions)))
+    log_moves = []
+    sync_moves = []
+    # pairs of indices of the trace transition and the model transition of the synchronous moves
+    sync_indices = []
+    cost_function = dict(zip(prepared_model.model_moves, prepared_model.model_costs))
+    for i, t in enumerate(trace_transitions):
+        sub_marking = Marking()
+        add_marking = Marking()
+        for arc in t.in_arcs:
+            sub_marking[place_map[arc.source]] = arc.weight
+            add_marking[place_map[arc.source]] -= arc.weight
+            trace_incidence[trace_place_indices[arc.source], i] -= arc.weight
+        for arc in t.out_arcs:
+            add_marking[place_map[arc.target]] += arc.weight
+            trace_incidence[trace_place_indices[arc.target], i] += arc.weight
+
+        move = PetriNet.Transition((t.name, utils.SKIP), (t.label, utils.SKIP))
+        if properties.TRACE_NET_TRANS_INDEX in t.properties:
+            move.properties[properties.TRACE_NET_TRANS_INDEX] = t.properties[
+                properties.TRACE_NET_TRANS_INDEX
+            ]
+        move.sub_marking = sub_marking
+        move.add_marking = add_marking
+        log_moves.append(move)
+        cost_function[move] = trace_net_costs[t]
+
+        for j in prepared_model.transitions_by_label.get(t.label, []):
+            model_transition = prepared_model.transitions[j]
+            model_move = prepared_model.model_moves[j]
+            sync = PetriNet.Transition(
+                (t.name, model_transition.name), (t.label, model_transition.label)
+            )
+            sync.properties.update(t.properties)
+            sync.properties.update(model_transition.properties)
+            sync.sub_marking = Marking(sub_marking)
+            sync.sub_marking.update(model_move.sub_marking)
+            sync.add_marking = Marking(add_marking)
+            sync.add_marking.update(model_move.add_marking)
+            sync_moves.append(sync)
+            sync_indices.append((i, j))
+            cost_function[sync] = prepared_model.sync_costs[j]
+
+    transitions = prepared_model.model_moves + log_moves + sync_moves
+    n_model_moves = len(prepared_model.model_moves)
+    n_log_moves = len(log_moves)
+    a_matrix = np.zeros((len(places), len(transitions)))
+    a_matrix[:n_model_places, :n_model_moves] = prepared_model.incidence
+    a_matrix[n_model_places:, n_model_moves : n_model_moves + n_log_moves] = (
+        trace_incidence
+    )
+    if len(sync_indices) > 0:
+        trace_columns, model_columns = zip(*sync_indices)
+        a_matrix[:n_model_places, n_model_moves + n_log_moves :] = (
+            prepared_model.incidence[:, model_columns]
+        )
+        a_matrix[n_model_places:, n_model_moves + n_log_moves :] = trace_incidence[
+            :, trace_columns
+        ]
+
+    consuming_transitions = {
+        p: list(moves) for p, moves in prepared_model.consuming_transitions.items()
+    }
+    for p in place_map.values():
+        consuming_transitions[p] = []
+    for t in log_moves + sync_moves:
+        for p in t.sub_marking:
+            consuming_transitions[p].append(t)
+    trans_empty_preset = set(prepared_model.moves_with_empty_preset)
+    trans_empty_preset.update(t for t in log_moves if len(t.sub_marking) == 0)
+
+    ini = Marking(prepared_model.initial_marking)
+    for p, n in trace_im.items():
+        ini[place_map[p]] = n
+    fin = Marking(prepared_model.final_marking)
+    for p, n in trace_fm.items():
+        fin[place_map[p]] = n
+
+    incidence_matrix = SynchronousProductIndices(places, transitions, a_matrix)
+    heuristic_matrices = (
+        np.asmatrix(a_matrix),
+        [cost_function[t] for t in transitions],
+        incidence_matrix,
+        incidence_matrix.encode_marking(fin),
+        list(range(n_model_places, len(places))),
+        list(range(n_model_places)),
+    )
+
+    return (
+        ini,
+        fin,
+        cost_function,
+        heuristic_matrices,
+        consuming_transitions,
+        trans_empty_preset,
+    )
+
+
 def apply_sync_prod(
     sync_prod,
     initial_marking,
@@ -272,6 +595,10 @@ def apply_sync_prod(
     skip,
     ret_tuple_as_trans_desc=False,
     max_align_time_trace=sys.maxsize,
+    warm_started_lp=True,
+    lp_reuse_basis=True,
+    array_markings=False,
+    max_states=None,
 ):
     """
     Performs the basic alignment search on top of the synchronous product net, given a cost function and skip-symbol
@@ -283,11 +610,19 @@ def apply_sync_prod(
     final_marking: :class:`pm4py.objects.petri.net.Marking` final marking in the synchronous product net
     cost_function: :class:`dict` cost function mapping transitions to the synchronous product net
     skip: :class:`Any` symbol to use for skips in the alignment
+    warm_started_lp: :class:`bool` solve the heuristic with a persistent GLOP instance (WarmStartedLPHeuristic)
+    instead of solving a new LP per marking
+    lp_reuse_basis: :class:`bool` start GLOP from the basis of the previous solution
+    array_markings: :class:`bool` store markings as vectors in the search (see IndexedSynchronousProduct)
+    max_states: :class:`int` bound of the number of open and closed search states. Once it is exceeded, the
+    search stops and returns an approximate alignment that completes the cheapest state by log moves, flagged
+    by **approximate**, **pruned_states** holds the number of discarded open states. Only supported for
+    markings stored as Marking objects
 
     Returns
     -------
-    dictionary : :class:`dict` with keys **alignment**, **cost**, **visited_states**, **queued_states**
-    and **traversed_arcs**
+    dictionary : :class:`dict` with keys **alignment**, **cost**, **visited_states**, **queued_states**,
+    **traversed_arcs**, **lp_solved** and **lp_time**
     """
     return __search(
         sync_prod,
@@ -297,6 +632,10 @@ def apply_sync_prod(
         skip,
         ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
         max_align_time_trace=max_align_time_trace,
+        warm_started_lp=warm_started_lp,
+        lp_reuse_basis=lp_reuse_basis,
+        array_markings=array_markings,
+        max_states=max_states,
     )
 
 
@@ -308,22 +647,111 @@ def __search(
     skip,
     ret_tuple_as_trans_desc=False,
     max_align_time_trace=sys.maxsize,
+    warm_started_lp=True,
+    lp_reuse_basis=True,
+    array_markings=False,
+    max_states=None,
 ):
     start_time = time.time()
 
     decorate_transitions_prepostset(sync_net)
     decorate_places_preset_trans(sync_net)
 
+    heuristic_matrices = __compute_heuristic_matrices(sync_net, ini, fin, cost_function)
+    trans_empty_preset = set(t for t in sync_net.transitions if len(t.in_arcs) == 0)
+    consuming_transitions = {p: p.ass_trans for p in sync_net.places}
+
+    return __search_decorated(
+        ini,
+        fin,
+        cost_function,
+        heuristic_matrices,
+        consuming_transitions,
+        trans_empty_preset,
+        skip,
+        start_time,
+        ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
+        max_align_time_trace=max_align_time_trace,
+        warm_started_lp=warm_started_lp,
+        lp_reuse_basis=lp_reuse_basis,
+        array_markings=array_markings,
+        max_states=max_states,
+    )
+
+
+def __search_decorated(
+    ini,
+    fin,
+    cost_function,
+    heuristic_matrices,
+    consuming_transitions,
+    trans_empty_preset,
+    skip,
+    start_time,
+    ret_tuple_as_trans_desc=False,
+    max_align_time_trace=sys.maxsize,
+    warm_started_lp=True,
+    lp_reuse_basis=True,
+    array_markings=False,
+    max_states=None,
+):
+    """
+    A* search on a synchronous product whose transitions are decorated with their sub and add markings, the
+    transitions consuming from a place are given by consuming_transitions
+    """
     (
         a_matrix,
-        g_matrix,
-        h_cvx,
         cost_vec,
         incidence_matrix,
         fin_vec,
         trace_net_filter,
         model_filter,
-    ) = __compute_heuristic_matrices(sync_net, ini, fin, cost_function)
+    ) = heuristic_matrices
+    cost_vec = [x * 1.0 for x in cost_vec]
+
+    if warm_started_lp:
+        compute_heuristic = WarmStartedLPHeuristic(
+            a_matrix,
+            cost_vec,
+            incidence_matrix,
+            fin_vec,
+            trace_net_filter,
+            model_filter,
+            reuse_basis=lp_reuse_basis,
+        ).compute
+    else:
+        a_matrix_new, g_matrix, h_cvx, cost_vec_lp = __compute_constraint_matrices(
+            a_matrix, cost_vec, trace_net_filter, model_filter
+        )
+
+        def compute_heuristic(marking):
+            return __compute_exact_heuristic_new_version(
+                a_matrix_new,
+                h_cvx,
+                g_matrix,
+                cost_vec_lp,
+                incidence_matrix,
+                marking,
+                fin_vec,
+                trace_net_filter,
+                model_filter,
+            )
+
+    if array_markings:
+        return __search_array_markings(
+            ini,
+            fin,
+            cost_function,
+            cost_vec,
+            incidence_matrix,
+            compute_heuristic,
+            consuming_transitions,
+            skip,
+            start_time,
+            ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
+            max_align_time_trace=max_align_time_trace,
+            max_states=max_states,
+        )
 
     final_place_trace_net = None
 
@@ -335,18 +763,9 @@ def __search(
 
     closed = set()
 
-    h, x = __compute_exact_heuristic_new_version(
-        sync_net,
-        a_matrix,
-        h_cvx,
-        g_matrix,
-        cost_vec,
-        incidence_matrix,
-        ini,
-        fin_vec,
-        trace_net_filter,
-        model_filter,
-    )
+    lp_start_time = time.time()
+    h, x = compute_heuristic(ini)
+    lp_time = time.time() - lp_start_time
     ini_state = utils.SearchTuple(0 + h, 0, h, ini, None, None, x, True)
     open_set = [ini_state]
     heapq.heapify(open_set)
@@ -355,8 +774,6 @@ def __search(
     traversed = 0
     lp_solved = 1
 
-    trans_empty_preset = set(t for t in sync_net.transitions if len(t.in_arcs) == 0)
-
     while not len(open_set) == 0:
         if (time.time() - start_time) > max_align_time_trace:
             return None
@@ -375,18 +792,9 @@ def __search(
                 current_marking = curr.m
                 continue
 
-            h, x = __compute_exact_heuristic_new_version(
-                sync_net,
-                a_matrix,
-                h_cvx,
-                g_matrix,
-                cost_vec,
-                incidence_matrix,
-                current_marking,
-                fin_vec,
-                trace_net_filter,
-                model_filter,
-            )
+            lp_start_time = time.time()
+            h, x = compute_heuristic(current_marking)
+            lp_time += time.time() - lp_start_time
             lp_solved += 1
 
             # 11/10/19: shall not a state for which we compute the exact heuristics be
@@ -412,7 +820,7 @@ def __search(
         # (underestimation of the remaining cost) is 0. Low-hanging fruits
         if curr.h < 0.01:
             if final_place_trace_net in current_marking:
-                return utils.__reconstruct_alignment(
+                alignment = utils.__reconstruct_alignment(
                     curr,
                     visited,
                     queued,
@@ -420,13 +828,31 @@ def __search(
                     ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
                     lp_solved=lp_solved,
                 )
+                alignment["lp_time"] = lp_time
+                return alignment
+
+        if max_states is not None and len(closed) + len(open_set) >= max_states:
+            alignment = __approximate_alignment(
+                ini,
+                open_set + [curr],
+                consuming_transitions,
+                cost_function,
+                skip,
+                visited,
+                queued,
+                traversed,
+                ret_tuple_as_trans_desc,
+                lp_solved,
+            )
+            alignment["lp_time"] = lp_time
+            return alignment
 
         closed.add(current_marking)
         visited += 1
 
         enabled_trans = copy(trans_empty_preset)
         for p in current_marking:
-            for t in p.ass_trans:
+            for t in consuming_transitions[p]:
                 if t.sub_marking <= current_marking:
                     enabled_trans.add(t)
 
@@ -457,6 +883,176 @@ def __search(
             heapq.heappush(open_set, tp)
 
 
+def __approximate_alignment(
+    ini,
+    states,
+    consuming_transitions,
+    cost_function,
+    skip,
+    visited,
+    queued,
+    traversed,
+    ret_tuple_as_trans_desc,
+    lp_solved,
+):
+    state = prefix_utils.complete_with_log_moves(
+        states, ini, consuming_transitions, cost_function, skip
+    )
+    alignment = utils.__reconstruct_alignment(
+        state,
+        visited,
+        queued,
+        traversed,
+        ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
+        lp_solved=lp_solved,
+    )
+    alignment["approximate"] = True
+    alignment["pruned_states"] = len(states) - 1
+
+    return alignment
+
+
+def __search_array_markings(
+    ini,
+    fin,
+    cost_function,
+    cost_vec,
+    incidence_matrix,
+    compute_heuristic,
+    consuming_transitions,
+    skip,
+    start_time,
+    ret_tuple_as_trans_desc=False,
+    max_align_time_trace=sys.maxsize,
+    max_states=None,
+):
+    """
+    Counterpart of __search_decorated storing the markings of the search states as vectors, the places and
+    transitions are indexed like in the incidence matrix
+    """
+    net = IndexedSynchronousProduct(
+        sorted(incidence_matrix.places, key=incidence_matrix.places.get),
+        sorted(incidence_matrix.transitions, key=incidence_matrix.transitions.get),
+    )
+    costs = [cost_function[t] for t in net.transitions]
+    visitable = [
+        not (utils.__is_log_move(t, skip) and utils.__is_model_move(t, skip))
+        for t in net.transitions
+    ]
+
+    final_place_trace_net = None
+    for final_place in fin:
+        if __place_from_spn_belongs_to_trace_net_part(final_place):
+            final_place_trace_net = net.place_indices[final_place]
+
+    assert final_place_trace_net is not None
+
+    closed = set()
+
+    lp_start_time = time.time()
+    h, x = compute_heuristic(ini)
+    lp_time = time.time() - lp_start_time
+    ini_state = utils.SearchTuple(0 + h, 0, h, net.encode(ini), None, None, x, True)
+    open_set = [ini_state]
+    visited = 0
+    queued = 0
+    traversed = 0
+    lp_solved = 1
+
+    while not len(open_set) == 0:
+        if (time.time() - start_time) > max_align_time_trace:
+            return None
+
+        curr = heapq.heappop(open_set)
+        current_key = marking_key(curr.m)
+
+        while not curr.trust:
+            if (time.time() - start_time) > max_align_time_trace:
+                return None
+
+            if current_key in closed:
+                curr = heapq.heappop(open_set)
+                current_key = marking_key(curr.m)
+                continue
+
+            lp_start_time = time.time()
+            h, x = compute_heuristic(net.decode(curr.m))
+            lp_time += time.time() - lp_start_time
+            lp_solved += 1
+
+            tp = utils.SearchTuple(
+                curr.g + h, curr.g, h, curr.m, curr.p, curr.t, x, True
+            )
+            curr = heapq.heappushpop(open_set, tp)
+            current_key = marking_key(curr.m)
+
+        if curr.h > lp_solver.MAX_ALLOWED_HEURISTICS:
+            continue
+
+        if current_key in closed:
+            continue
+
+        if curr.h < 0.01 and curr.m[final_place_trace_net] > 0:
+            alignment = utils.__reconstruct_alignment(
+                curr,
+                visited,
+                queued,
+                traversed,
+                ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
+                lp_solved=lp_solved,
+            )
+            alignment["lp_time"] = lp_time
+            return alignment
+
+        if max_states is not None and len(closed) + len(open_set) >= max_states:
+            # only the markings of the remaining states are decoded for the completion
+            states = [
+                utils.SearchTuple(
+                    s.f, s.g, s.h, net.decode(s.m), s.p, s.t, s.x, s.trust
+                )
+                for s in open_set + [curr]
+            ]
+            alignment = __approximate_alignment(
+                ini,
+                states,
+                consuming_transitions,
+                cost_function,
+                skip,
+                visited,
+                queued,
+                traversed,
+                ret_tuple_as_trans_desc,
+                lp_solved,
+            )
+            alignment["lp_time"] = lp_time
+            return alignment
+
+        closed.add(current_key)
+        visited += 1
+
+        for t in net.enabled_transitions(curr.m).tolist():
+            if not visitable[t]:
+                continue
+
+            traversed += 1
+            new_marking = net.fire(curr.m, t)
+
+            if marking_key(new_marking) in closed:
+                continue
+            g = curr.g + costs[t]
+
+            queued += 1
+            x_prime = curr.x.copy()
+            x_prime[t] -= 1
+            h = max(0, curr.h - cost_vec[t])
+            trustable = utils.__trust_solution(x_prime)
+
+            tp = utils.SearchTuple(
+                g + h, g, h, new_marking, curr, net.transitions[t], x_prime, trustable
+            )
+            heapq.heappush(open_set, tp)
+
+
 def __compute_heuristic_matrices(sync_net, ini, fin, cost_function):
     incidence_matrix = inc_mat_construct(sync_net)
     ini_vec, fin_vec, cost_vec = utils.__vectorize_initial_final_cost(
@@ -464,8 +1060,6 @@ def __compute_heuristic_matrices(sync_net, ini, fin, cost_function):
     )
 
     a_matrix = np.asmatrix(incidence_matrix.a_matrix).astype(np.float64)
-    g_matrix = -np.eye(len(sync_net.transitions))
-    cost_vec = [x * 1.0 for x in cost_vec]
 
     trace_net_filter = []
     model_filter = []
@@ -475,6 +1069,20 @@ def __compute_heuristic_matrices(sync_net, ini, fin, cost_function):
         else:
             model_filter.append(incidence_matrix.places[place])
 
+    return (
+        a_matrix,
+        cost_vec,
+        incidence_matrix,
+        fin_vec,
+        trace_net_filter,
+        model_filter,
+    )
+
+
+def __compute_constraint_matrices(a_matrix, cost_vec, trace_net_filter, model_filter):
+    g_matrix = -np.eye(a_matrix.shape[1])
+    cost_vec = [x * 1.0 for x in cost_vec]
+
     # Ax = b constraints only for the trace net part, we do not care if the model part reaches its final marking
     a_matrix_new = a_matrix[trace_net_filter]
     # Ax <= b constraints for the model part. Because we have marking[model_filter] + incidence[model_filter] * x >= 0
@@ -483,7 +1091,7 @@ def __compute_heuristic_matrices(sync_net, ini, fin, cost_function):
     g_matrix = np.vstack([g_matrix, -a_matrix[model_filter]])
     # note that we do not add the b part of the Ax <= b constraints for the model part here. We have to do this for
     # each marking because the b part is marking[model_filter]. See function __compute_exact_heuristic_new_version.
-    h_cvx = np.asmatrix(np.zeros(len(sync_net.transitions))).transpose()
+    h_cvx = np.asmatrix(np.zeros(a_matrix.shape[1])).transpose()
 
     if lp_solver.CVXOPT in lp_solver.DEFAULT_LP_SOLVER_VARIANT:
         from cvxopt import matrix
@@ -493,20 +1101,90 @@ def __compute_heuristic_matrices(sync_net, ini, fin, cost_function):
         h_cvx = matrix(h_cvx)
         cost_vec = matrix(cost_vec)
 
-    return (
-        a_matrix_new,
-        g_matrix,
-        h_cvx,
+    return a_matrix_new, g_matrix, h_cvx, cost_vec
+
+
+class WarmStartedLPHeuristic:
+    """
+    Exact heuristic of the prefix alignment search solved by a persistent GLOP instance. The LP is the same
+    as in __compute_exact_heuristic_new_version, only the bounds of its constraints depend on the marking,
+    i.e., re-solving only changes the right-hand side and GLOP starts from the basis of the previous
+    solution (unless reuse_basis is False).
+    """
+
+    def __init__(
+        self,
+        a_matrix,
         cost_vec,
         incidence_matrix,
         fin_vec,
         trace_net_filter,
         model_filter,
-    )
+        reuse_basis: bool = True,
+    ):
+        self.incidence_matrix = incidence_matrix
+        self.fin_vec = fin_vec
+        self.solver = pywraplp.Solver.CreateSolver("GLOP")
+        self.solver_parameters = pywraplp.MPSolverParameters()
+        self.solver_parameters.SetIntegerParam(
+            pywraplp.MPSolverParameters.INCREMENTALITY,
+            (
+                pywraplp.MPSolverParameters.INCREMENTALITY_ON
+                if reuse_basis
+                else pywraplp.MPSolverParameters.INCREMENTALITY_OFF
+            ),
+        )
+        infinity = self.solver.infinity()
+        a_matrix = np.asarray(a_matrix, dtype=np.float64)
+
+        self.variables = [
+            self.solver.NumVar(0, infinity, str(i)) for i in range(a_matrix.shape[1])
+        ]
+        objective = self.solver.Objective()
+        for variable, cost in zip(self.variables, cost_vec):
+            objective.SetCoefficient(variable, cost)
+        objective.SetMinimization()
+
+        # Ax = b for the trace net part, marking + Ax >= 0 for the model part (see __compute_constraint_matrices)
+        self.constraints = []
+        for place in trace_net_filter:
+            self.constraints.append((place, True, self.__add_row(a_matrix[place])))
+        for place in model_filter:
+            self.constraints.append((place, False, self.__add_row(a_matrix[place])))
+        self.marking_vector = None
+
+    def compute(self, marking: Marking):
+        m_vec = self.incidence_matrix.encode_marking(marking)
+        for place, is_trace_net_place, constraint in self.constraints:
+            if self.marking_vector is not None and (
+                self.marking_vector[place] == m_vec[place]
+            ):
+                continue
+            if is_trace_net_place:
+                bound = self.fin_vec[place] - m_vec[place]
+                constraint.SetBounds(bound, bound)
+            else:
+                constraint.SetLb(-m_vec[place])
+        self.marking_vector = m_vec
+
+        if self.solver.Solve(self.solver_parameters) != pywraplp.Solver.OPTIMAL:
+            return sys.maxsize, [0.0] * len(self.variables)
+
+        return self.solver.Objective().Value(), [
+            variable.solution_value() for variable in self.variables
+        ]
+
+    def __add_row(self, row):
+        constraint = self.solver.Constraint(
+            -self.solver.infinity(), self.solver.infinity()
+        )
+        for i in np.flatnonzero(row):
+            constraint.SetCoefficient(self.variables[i], float(row[i]))
+
+        return constraint
 
 
 def __compute_exact_heuristic_new_version(
-    sync_net,
     a_matrix,
     h_cvx,
     g_matrix,
@@ -550,7 +1228,7 @@ def __compute_exact_heuristic_new_version(
     )
 
     prim_obj = prim_obj if prim_obj is not None else sys.maxsize
-    points = points if points is not None else [0.0] * len(sync_net.transitions)
+    points = points if points is not None else [0.0] * len(incidence_matrix.transitions)
 
     return prim_obj, points
 
@@ -0,0 +1,28 @@
+from copy import copy
+from typing import Any, Dict, Optional, Union
+
+from pm4py.objects.log.obj import Trace
+from pm4py.objects.petri_net.obj import Marking, PetriNet
+from pm4py.util import typing
+
+from cortado_core.alignments.prefix_alignments.variants import a_star
+from cortado_core.alignments.prefix_alignments.variants.a_star import Parameters
+
+
+def apply(
+    trace: Trace,
+    petri_net: PetriNet,
+    initial_marking: Marking,
+    final_marking: Marking,
+    parameters: Optional[Dict[Union[str, Parameters], Any]] = None,
+) -> typing.AlignmentResult:
+    """
+    Variant of a_star that stores the markings of the search states as vectors, see
+    array_markings.IndexedSynchronousProduct. Supports the same parameters as a_star.apply.
+    """
+    parameters = copy(parameters) if parameters is not None else {}
+    parameters[Parameters.ARRAY_MARKINGS] = True
+
+    return a_star.apply(
+        trace, petri_net, initial_marking, final_marking, parameters=parameters
+    )
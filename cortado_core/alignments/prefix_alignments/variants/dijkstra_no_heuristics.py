@@ -22,6 +22,10 @@ from pm4py.objects.log.obj import Trace
 from pm4py.objects.petri_net.obj import PetriNet, Marking
 from pm4py.util import typing
 from cortado_core.alignments.prefix_alignments import utils as prefix_utils
+from cortado_core.alignments.prefix_alignments.array_markings import (
+    IndexedSynchronousProduct,
+    marking_key,
+)
 
 
 class Parameters(Enum):
@@ -38,6 +42,8 @@ class Parameters(Enum):
     ACTIVITY_KEY = PARAMETER_CONSTANT_ACTIVITY_KEY
     VARIANTS_IDX = "variants_idx"
     PARAM_ENFORCE_FIRST_TAU_MOVE = "enforce_first_tau_move"
+    ARRAY_MARKINGS = "array_markings"
+    MAX_STATES = "max_states"
 
 
 def apply(
@@ -242,6 +248,10 @@ def apply_trace_net(
         ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
         max_align_time_trace=max_align_time_trace,
         enforce_first_tau_move=enforce_first_tau_move,
+        array_markings=exec_utils.get_param_value(
+            Parameters.ARRAY_MARKINGS, parameters, False
+        ),
+        max_states=exec_utils.get_param_value(Parameters.MAX_STATES, parameters, None),
     )
 
 
@@ -254,7 +264,15 @@ def apply_sync_prod(
     ret_tuple_as_trans_desc=False,
     max_align_time_trace=sys.maxsize,
     enforce_first_tau_move=False,
+    array_markings=False,
+    max_states=None,
 ):
+    """
+    max_states bounds the number of open and closed search states. Once it is exceeded, the search stops and
+    returns an approximate alignment that completes the cheapest state by log moves, it is flagged by
+    **approximate** and **pruned_states** holds the number of discarded open states. Only supported for
+    markings stored as Marking objects.
+    """
     return __search(
         sync_prod,
         initial_marking,
@@ -264,6 +282,8 @@ def apply_sync_prod(
         ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
         max_align_time_trace=max_align_time_trace,
         enforce_first_tau_move=enforce_first_tau_move,
+        array_markings=array_markings,
+        max_states=max_states,
     )
 
 
@@ -276,6 +296,8 @@ def __search(
     ret_tuple_as_trans_desc=False,
     max_align_time_trace=sys.maxsize,
     enforce_first_tau_move=False,
+    array_markings=False,
+    max_states=None,
 ):
     start_time = time.time()
 
@@ -291,6 +313,20 @@ def __search(
     decorate_transitions_prepostset(sync_net)
     decorate_places_preset_trans(sync_net)
 
+    if array_markings:
+        return __search_array_markings(
+            sync_net,
+            ini,
+            final_place_trace_net,
+            cost_function,
+            skip,
+            start_time,
+            ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
+            max_align_time_trace=max_align_time_trace,
+            enforce_first_tau_move=enforce_first_tau_move,
+            max_states=max_states,
+        )
+
     closed = set()
 
     ini_state = utils.DijkstraSearchTuple(0, ini, None, None, 0)
@@ -323,6 +359,19 @@ def __search(
                 ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
             )
 
+        if max_states is not None and len(closed) + len(open_set) >= max_states:
+            return __approximate_alignment(
+                sync_net,
+                ini,
+                open_set + [curr],
+                cost_function,
+                skip,
+                visited,
+                queued,
+                traversed,
+                ret_tuple_as_trans_desc,
+            )
+
         closed.add(current_marking)
         visited += 1
 
@@ -362,3 +411,133 @@ def __search(
             heapq.heappush(open_set, tp)
 
         is_first_move = False
+
+
+def __approximate_alignment(
+    sync_net,
+    ini,
+    states,
+    cost_function,
+    skip,
+    visited,
+    queued,
+    traversed,
+    ret_tuple_as_trans_desc,
+):
+    state = prefix_utils.complete_with_log_moves(
+        states,
+        ini,
+        {p: p.ass_trans for p in sync_net.places},
+        cost_function,
+        skip,
+    )
+    alignment = utils.__reconstruct_alignment(
+        state,
+        visited,
+        queued,
+        traversed,
+        ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
+    )
+    alignment["approximate"] = True
+    alignment["pruned_states"] = len(states) - 1
+
+    return alignment
+
+
+def __search_array_markings(
+    sync_net,
+    ini,
+    final_place_trace_net,
+    cost_function,
+    skip,
+    start_time,
+    ret_tuple_as_trans_desc=False,
+    max_align_time_trace=sys.maxsize,
+    enforce_first_tau_move=False,
+    max_states=None,
+):
+    """
+    Counterpart of __search storing the markings of the search states as vectors
+    """
+    net = IndexedSynchronousProduct(list(sync_net.places), list(sync_net.transitions))
+    costs = [cost_function[t] for t in net.transitions]
+    model_moves = [utils.__is_model_move(t, skip) for t in net.transitions]
+    visitable = [
+        not (utils.__is_log_move(t, skip) and model_move)
+        for t, model_move in zip(net.transitions, model_moves)
+    ]
+    final_place_trace_net = net.place_indices[final_place_trace_net]
+    is_first_move = enforce_first_tau_move
+
+    closed = set()
+
+    ini_state = utils.DijkstraSearchTuple(0, net.encode(ini), None, None, 0)
+    open_set = [ini_state]
+    visited = 0
+    queued = 0
+    traversed = 0
+
+    while not len(open_set) == 0:
+        if (time.time() - start_time) > max_align_time_trace:
+            return None
+
+        curr = heapq.heappop(open_set)
+
+        current_key = marking_key(curr.m)
+        if current_key in closed:
+            continue
+
+        # check if final marking of the trace net part is marked
+        if curr.m[final_place_trace_net] > 0:
+            return utils.__reconstruct_alignment(
+                curr,
+                visited,
+                queued,
+                traversed,
+                ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
+            )
+
+        if max_states is not None and len(closed) + len(open_set) >= max_states:
+            # only the markings of the remaining states are decoded for the completion
+            states = [
+                utils.DijkstraSearchTuple(s.g, net.decode(s.m), s.p, s.t, s.l)
+                for s in open_set + [curr]
+            ]
+            return __approximate_alignment(
+                sync_net,
+                ini,
+                states,
+                cost_function,
+                skip,
+                visited,
+                queued,
+                traversed,
+                ret_tuple_as_trans_desc,
+            )
+
+        closed.add(current_key)
+        visited += 1
+
+        for t in net.enabled_transitions(curr.m).tolist():
+            if not visitable[t]:
+                continue
+
+            # for infix alignments, the first move has to be a model move
+            if is_first_move and not model_moves[t]:
+                continue
+
+            traversed += 1
+            new_marking = net.fire(curr.m, t)
+
+            if marking_key(new_marking) in closed:
+                continue
+
+            queued += 1
+
+            tp = utils.DijkstraSearchTuple(
+                curr.g + costs[t], new_marking, curr, net.transitions[t], curr.l + 1
+            )
+
+            heapq.heappush(open_set, tp)
+
+        is_first_move = False
@@ -9,6 +9,7 @@ from pm4py.algo.conformance.alignments.petri_net import algorithm as alignments
 from cortado_core.alignments.infix_alignments import utils as infix_utils
 from cortado_core.alignments.infix_alignments.variants.tree_based_preprocessing import (
     build_extended_petri_net_for_infix_alignments,
+    extended_net_cache,
 )
 from cortado_core.alignments.infix_alignments.variants.baseline_approach import (
     build_extended_petri_net_for_infix_alignments as build_extended_petri_net_for_infix_alignments_baseline,
@@ -29,14 +30,32 @@ def calculate_optimal_suffix_alignment(
     use_cortado_tree_converter=True,
     copy_tree=True,
     parameters=None,
+    use_extended_net_cache=True,
 ) -> pm4py_typing.AlignmentResult:
-    if copy_tree:
-        process_tree = copy.deepcopy(process_tree)
-
     start = time.time()
 
     try:
-        if variant == VARIANT_BASELINE_APPROACH:
+        if variant != VARIANT_BASELINE_APPROACH and use_extended_net_cache:
+            # never reduce the tree, because this can lead to incorrect suffix alignments
+            (
+                net,
+                im,
+                fm,
+                n_added_tau_transitions,
+                unmodified_net_getter,
+            ) = extended_net_cache.apply(
+                trace,
+                process_tree,
+                naive,
+                False,
+                True,
+                timeout,
+                use_cortado_tree_converter=use_cortado_tree_converter,
+                copy_tree=copy_tree,
+            )
+        elif variant == VARIANT_BASELINE_APPROACH:
+            if copy_tree:
+                process_tree = copy.deepcopy(process_tree)
             (
                 net,
                 im,
@@ -51,6 +70,9 @@ def calculate_optimal_suffix_alignment(
                 use_cortado_tree_converter=use_cortado_tree_converter,
             )
         else:
+            if copy_tree:
+                process_tree = copy.deepcopy(process_tree)
+
             # never reduce the tree, because this can lead to incorrect suffix alignments
             (
                 net,
@@ -252,6 +252,7 @@ def __calculate_alignments(net, im, variants_with_count):
     result = []
     parameters = __get_parameters_with_model_cost_function_for_net(net)
 
+    # the traces are grouped by their variants already, i.e., every activity sequence is aligned only once
     for variant, count, orig_positions in variants_with_count:
         trace = variant_to_trace(variant)
         alignment = calculate_alignments(
@@ -15,9 +15,9 @@ from cortado_core.process_tree_utils.miscellaneous import (
 from cortado_core.process_tree_utils.to_petri_net_transition_bordered import (
     apply as pt_to_petri_net,
 )
+from cortado_core.utils.alignment_service import calculate_alignments_typed_traces
 from cortado_core.utils.alignment_utils import (
     alignment_contains_deviation,
-    calculate_alignment_typed_trace,
     is_sync_move,
     alignment_step_represents_no_deviation,
 )
@@ -38,8 +38,7 @@ def project_log(
 
     # assumption: log is replayable on process tree without deviations
     alignments = []
-    for trace in log:
-        alignment = calculate_alignment_typed_trace(pt, trace)
+    for trace, alignment in zip(log, calculate_alignments_typed_traces(pt, log)):
         if trace.infix_type != InfixType.NOT_AN_INFIX:
             alignment = generate_full_alignment_based_on_infix_alignment(
                 trace.infix_type, alignment
@@ -1,5 +1,7 @@
+import dataclasses
 import logging
 import multiprocessing.pool
+import time
 import multiprocessing.pool
 from typing import List, Tuple, Optional, Union
 
@@ -19,6 +21,7 @@ from cortado_core.process_tree_utils.miscellaneous import (
     get_number_nodes,
     is_leaf_node,
     get_index_of_pt_in_children_list,
+    is_subtree,
 )
 from cortado_core.process_tree_utils.reduction import (
     apply_reduction_rules,
@@ -26,16 +29,21 @@ from cortado_core.process_tree_utils.reduction import (
 )
 from cortado_core.process_tree_utils.to_petri_net_transition_bordered import (
     apply as pt_to_petri_net,
+    conversion_cache,
 )
 from cortado_core.utils.alignment_utils import (
     is_log_move,
     alignment_step_represents_no_deviation,
     is_sync_move,
     get_first_deviation,
-    calculate_alignment_typed_trace,
+)
+from cortado_core.utils.alignment_service import (
+    calculate_alignment_typed_trace_cached,
+    calculate_alignments_typed_traces,
 )
 from cortado_core.utils.deviation_solvers import (
     DeviationType,
+    EnclosedDeviationSolverTrace,
     get_deviation_solver,
     Deviation,
 )
@@ -45,7 +53,12 @@ from cortado_core.utils.start_and_end_activities import (
     add_artificial_start_end_activity_to_typed_trace,
     add_artificial_start_end_activity_to_typed_log,
 )
-from cortado_core.utils.sublog_utils import calculate_infix_postfix_prefix_alignment
+from cortado_core.utils.sublog_utils import (
+    SublogIndex,
+    calculate_fitting_prefix_sublogs,
+    calculate_infix_postfix_prefix_alignment,
+    calculate_sublog_for_lca_of_traces,
+)
 from cortado_core.utils.trace import TypedTrace
 from cortado_core.utils.visualize_petri_net import visualize_petri_net
 
@@ -63,6 +76,7 @@ def add_trace_to_pt_language(
     add_artificial_start_end=True,
     pool: Optional[multiprocessing.pool.Pool] = None,
     only_first_matching_alignment=True,
+    statistics: Optional[List["RepairIterationStatistics"]] = None,
 ) -> ProcessTree:
     """
     Checks if a given trace can be replayed on the given process tree. If not, the tree will be altered to accept the
@@ -73,6 +87,7 @@ def add_trace_to_pt_language(
     :param try_pulling_lca_down:
     :param add_artificial_start_end:
     :param pool: Pool to parallelize alignment computations
+    :param statistics: if given, the statistics of every iteration of the repair loop are appended
     :return: process tree that accepts the given log and trace
     """
 
@@ -89,9 +104,283 @@ def add_trace_to_pt_language(
         try_pulling_lca_down=try_pulling_lca_down,
         add_artificial_start_end=add_artificial_start_end,
         pool=pool,
+        statistics=statistics,
     )
 
 
+@dataclasses.dataclass
+class RepairIterationStatistics:
+    """
+    Durations in seconds of the phases of one iteration of the repair loop
+    """
+
+    normalization: float = 0.0
+    # conversion of the tree into a petri net, it is done by the alignment calculation on a cache miss
+    conversion: float = 0.0
+    alignment: float = 0.0
+    repair: float = 0.0
+    # number of nodes that were normalized, i.e., the size of the subtrees modified by the previous repair
+    normalized_nodes: int = 0
+
+    @property
+    def total(self) -> float:
+        return self.normalization + self.conversion + self.alignment + self.repair
+
+
+class ModifiedSubtreeTracker:
+    """
+    Tracks the nodes of a process tree that is repaired in place. Only the subtrees that were modified since the
+    last normalization are normalized, i.e., their loops are reduced to two children and their new nodes get ids
+    that are unique in the tree. The ids of all other nodes are kept. The tracked nodes are referenced, hence, the
+    python ids of removed nodes are not reused while the tracker exists.
+    """
+
+    def __init__(self):
+        self.__nodes: dict[int, tuple[ProcessTree, int]] = {}
+        self.__next_id = 0
+
+    def normalize(self, pt: ProcessTree) -> int:
+        """
+        Normalizes the modified subtrees of pt and returns the number of normalized nodes
+        """
+        modified_subtrees = []
+        stack = [pt]
+        while stack:
+            node = stack.pop()
+            entry = self.__nodes.get(id(node))
+            if entry is None or entry[0] is not node or entry[1] != len(node.children):
+                modified_subtrees.append(node)
+            else:
+                stack.extend(node.children)
+
+        normalized_nodes = 0
+        for subtree in modified_subtrees:
+            # necessary, because pt_to_petri_net method is only implemented for 2-loops
+            reduce_loops_with_more_than_two_children(subtree)
+            normalized_nodes += self.__register(subtree)
+
+        return normalized_nodes
+
+    def __register(self, pt: ProcessTree) -> int:
+        n_nodes = 0
+        stack = [pt]
+        while stack:
+            node = stack.pop()
+            entry = self.__nodes.get(id(node))
+            if entry is None or entry[0] is not node:
+                node.id = self.__next_id
+                self.__next_id += 1
+            self.__nodes[id(node)] = (node, len(node.children))
+            stack.extend(node.children)
+            n_nodes += 1
+
+        return n_nodes
+
+
+@dataclasses.dataclass
+class TraceInsertionReport:
+    # round of add_traces_to_pt_language in which the trace fitted the process tree
+    fitting_round: int = 0
+    # number of repairs of deviations of the trace
+    repairs: int = 0
+
+    @property
+    def fitted_initially(self) -> bool:
+        return self.fitting_round == 1
+
+
+def add_traces_to_pt_language(
+    pt: ProcessTree,
+    log: Union[EventLog, List[TypedTrace]],
+    traces: List[Union[Trace, TypedTrace]],
+    try_pulling_lca_down=False,
+    add_artificial_start_end=True,
+    pool: Optional[multiprocessing.pool.Pool] = None,
+    statistics: Optional[List[RepairIterationStatistics]] = None,
+) -> tuple[ProcessTree, List[TraceInsertionReport]]:
+    """
+    Batch counterpart of add_trace_to_pt_language. In every round, all traces that do not fit yet are aligned
+    once and their first deviations are grouped by their lca. Each lca is rediscovered once using the traces to add
+    of all deviations in its group, lcas nested in the lca of another group are repaired in a later round.
+    Deviations of full traces that are not enclosed and deviations of infixes/postfixes/prefixes are repaired one
+    per round as in add_trace_to_pt_language.
+    :param pt: process tree to update
+    :param log: event log or list of typed traces, accepted by pt
+    :param traces: traces that should be accepted by pt in the end
+    :param try_pulling_lca_down:
+    :param add_artificial_start_end:
+    :param pool: Pool to parallelize alignment computations
+    :param statistics: if given, the statistics of every round are appended
+    :return: process tree that accepts the given log and traces, report for every trace
+    """
+    if isinstance(log, EventLog):
+        log = __add_typing_information_to_event_log(log)
+
+    traces = [
+        TypedTrace(trace, InfixType.NOT_AN_INFIX) if isinstance(trace, Trace) else trace
+        for trace in traces
+    ]
+    reports = [TraceInsertionReport() for _ in traces]
+
+    art_nodes_added = add_artificial_start_end or any(
+        t.infix_type == InfixType.PREFIX or t.infix_type == InfixType.POSTFIX
+        for t in traces
+    )
+    if art_nodes_added:
+        pt = add_artificial_start_and_end_to_pt(pt)
+        traces = add_artificial_start_end_activity_to_typed_log(traces)
+        log = add_artificial_start_end_activity_to_typed_log(log)
+
+    log = list(log)
+    sublog_index = SublogIndex(log, pool)
+    tracker = ModifiedSubtreeTracker()
+    pending = list(range(len(traces)))
+    repair_round = 0
+    while len(pending) > 0:
+        repair_round += 1
+        iteration_statistics = RepairIterationStatistics()
+        start = time.perf_counter()
+        iteration_statistics.normalized_nodes = tracker.normalize(pt)
+        iteration_statistics.normalization = __lap(start)
+
+        start = time.perf_counter()
+        conversion_start = conversion_cache.seconds
+        alignments = calculate_alignments_typed_traces(pt, [traces[i] for i in pending])
+        deviations = []
+        fitting_traces = []
+        for i, alignment in zip(pending, alignments):
+            if alignment["cost"] >= STD_MODEL_LOG_MOVE_COST:
+                deviations.append((i, get_deviation(alignment)))
+            else:
+                reports[i].fitting_round = repair_round
+                fitting_traces.append(traces[i])
+
+        __split_conversion_from_alignment(
+            iteration_statistics, __lap(start), conversion_start
+        )
+
+        start = time.perf_counter()
+        log.extend(fitting_traces)
+        sublog_index.add_traces(pt, fitting_traces)
+        pending = [i for i, _ in deviations]
+        if len(deviations) > 0:
+            pt = __repair_deviations(
+                pt,
+                log,
+                traces,
+                deviations,
+                reports,
+                try_pulling_lca_down,
+                pool,
+                sublog_index,
+            )
+        iteration_statistics.repair = __lap(start)
+        if statistics is not None:
+            statistics.append(iteration_statistics)
+
+    if art_nodes_added:
+        pt = remove_artificial_start_and_end_activity_leaves_from_pt(pt)
+    else:
+        apply_reduction_rules(pt)
+
+    return pt, reports
+
+
+def __lap(start: float) -> float:
+    return time.perf_counter() - start
+
+
+def __split_conversion_from_alignment(
+    iteration_statistics: RepairIterationStatistics,
+    duration: float,
+    conversion_start: float,
+):
+    # the tree is converted by the alignment calculation itself, unless its alignments are cached
+    iteration_statistics.conversion = conversion_cache.seconds - conversion_start
+    iteration_statistics.alignment = duration - iteration_statistics.conversion
+
+
+def __repair_deviations(
+    pt: ProcessTree,
+    log: List[TypedTrace],
+    traces: List[TypedTrace],
+    deviations: List[tuple[int, Deviation]],
+    reports: List[TraceInsertionReport],
+    try_pulling_lca_down: bool,
+    pool: Optional[multiprocessing.pool.Pool],
+    sublog_index: SublogIndex,
+) -> ProcessTree:
+    enclosed_deviations = [
+        (i, deviation)
+        for i, deviation in deviations
+        if deviation.type == DeviationType.ENCLOSED
+        and traces[i].infix_type == InfixType.NOT_AN_INFIX
+    ]
+    if len(enclosed_deviations) == 0:
+        i, deviation = deviations[0]
+        reports[i].repairs += 1
+        return __repair_process_tree(
+            pt,
+            log,
+            deviation.alignment,
+            try_pulling_lca_down,
+            pool,
+            traces[i].infix_type,
+            sublog_index,
+        )
+
+    groups: dict[int, tuple[ProcessTree, list[tuple[int, Deviation]]]] = {}
+    process_tree_modified = False
+    for i, deviation in enclosed_deviations:
+        lca, lca_pulled_down = EnclosedDeviationSolverTrace.find_lca(
+            deviation, try_pulling_lca_down, sublog_index
+        )
+        if lca_pulled_down:
+            process_tree_modified = True
+        else:
+            groups.setdefault(id(lca), (lca, []))[1].append((i, deviation))
+
+    if process_tree_modified:
+        # process tree was modified, recalculation of the alignments is needed
+        return pt
+
+    lcas = [lca for lca, _ in groups.values()]
+    fitting_prefix_sublogs = calculate_fitting_prefix_sublogs(
+        [
+            (d.alignment, d.deviation_index, InfixType.NOT_AN_INFIX)
+            for _, d in enclosed_deviations
+        ]
+    )
+    # all sublogs are calculated before the first rediscovery, since rediscovered nodes have no ids until the next
+    # normalization and every rediscovery changes the projections of the sublog index
+    sublogs = []
+    for lca, group in groups.values():
+        if any(other is not lca and is_subtree(other, lca) for other in lcas):
+            continue
+
+        traces_to_add = [
+            EnclosedDeviationSolverTrace.get_trace_to_add_of_lca(deviation, lca)
+            for _, deviation in group
+        ]
+        sublog = calculate_sublog_for_lca_of_traces(
+            pt,
+            log,
+            lca,
+            traces_to_add,
+            fitting_prefix_sublogs,
+            pool,
+            sublog_index,
+        )
+        sublogs.append((lca, sublog))
+        for i, _ in group:
+            reports[i].repairs += 1
+
+    for lca, sublog in sublogs:
+        pt = sublog_index.rediscover_subtree(lca, sublog)
+
+    return pt
+
+
 def __add_typing_information_to_event_log(log: EventLog):
     return [TypedTrace(trace, InfixType.NOT_AN_INFIX) for trace in log]
 
@@ -122,27 +411,49 @@ def __add_trace_to_pt_language(
     try_pulling_lca_down=False,
     add_artificial_start_end=True,
     pool: Optional[multiprocessing.pool.Pool] = None,
+    statistics: Optional[List[RepairIterationStatistics]] = None,
 ) -> ProcessTree:
     pt, trace, log, art_nodes_added = __add_artificial_start_end_activities(
         pt, trace, log, add_artificial_start_end
     )
 
+    # the projections of the log are reused by all repairs for this trace
+    sublog_index = SublogIndex(log, pool)
+    # only the subtrees modified by a repair are normalized again, the ids of the other nodes stay the same
+    tracker = ModifiedSubtreeTracker()
     deviation = True
     while deviation:
-        # necessary, because pt_to_petri_net method is only implemented for 2-loops
-        reduce_loops_with_more_than_two_children(pt)
+        iteration_statistics = RepairIterationStatistics()
+        start = time.perf_counter()
+        iteration_statistics.normalized_nodes = tracker.normalize(pt)
+        iteration_statistics.normalization = __lap(start)
 
         if DEBUG:
             tree_vis.view(tree_vis.apply(pt, parameters={"format": "svg"}))
-        set_preorder_ids_in_tree(pt)
-        alignment = calculate_alignment_typed_trace(pt, trace)
+        start = time.perf_counter()
+        conversion_start = conversion_cache.seconds
+        alignment = calculate_alignment_typed_trace_cached(pt, trace)
+        __split_conversion_from_alignment(
+            iteration_statistics, __lap(start), conversion_start
+        )
+
+        start = time.perf_counter()
         if alignment["cost"] >= STD_MODEL_LOG_MOVE_COST:
             # deviation found
             pt = __repair_process_tree(
-                pt, log, alignment, try_pulling_lca_down, pool, trace.infix_type
+                pt,
+                log,
+                alignment,
+                try_pulling_lca_down,
+                pool,
+                trace.infix_type,
+                sublog_index,
             )
         else:
             deviation = False
+        iteration_statistics.repair = __lap(start)
+        if statistics is not None:
+            statistics.append(iteration_statistics)
 
     if art_nodes_added:
         pt = remove_artificial_start_and_end_activity_leaves_from_pt(pt)
@@ -159,11 +470,14 @@ def __repair_process_tree(
     try_pulling_lca_down: bool,
     pool: Optional[multiprocessing.pool.Pool],
     infix_type: InfixType,
+    sublog_index: Optional[SublogIndex] = None,
 ) -> ProcessTree:
     logging.debug("repair_process_tree()")
 
     deviation = get_deviation(alignment)
-    solver = get_deviation_solver(deviation, infix_type, try_pulling_lca_down, pool)
+    solver = get_deviation_solver(
+        deviation, infix_type, try_pulling_lca_down, pool, sublog_index
+    )
     return solver.solve(deviation, pt_root, log)
 
 
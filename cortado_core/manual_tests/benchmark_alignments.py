@@ -0,0 +1,277 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+from pm4py.algo.conformance.alignments.petri_net import algorithm as alignments
+from pm4py.algo.simulation.tree_generator import algorithm as tree_generator
+from pm4py.objects.conversion.process_tree import converter as pt_converter
+from pm4py.objects.log.obj import Event, Trace
+from pm4py.objects.process_tree.obj import Operator, ProcessTree
+
+from cortado_core.alignments.infix_alignments.algorithm import (
+    VARIANT_BASELINE_APPROACH,
+    VARIANT_TREE_BASED_PREPROCESSING,
+    calculate_optimal_infix_alignment,
+)
+from cortado_core.alignments.prefix_alignments import algorithm as prefix_alignments
+from cortado_core.alignments.suffix_alignments.algorithm import (
+    calculate_optimal_suffix_alignment,
+)
+
+STATISTICS = ["visited_states", "queued_states", "traversed_arcs", "lp_solved"]
+
+
+def generate_tree(n_activities: int, parallel: float) -> ProcessTree:
+    """
+    Generates a tree with n_activities visible activities, parallel is the probability of a parallel operator,
+    the remaining probability is split evenly between sequence, choice and loop operators
+    """
+    other = (1 - parallel) / 3
+    return tree_generator.apply(
+        variant=tree_generator.Variants.PTANDLOGGENERATOR,
+        parameters={
+            "mode": n_activities,
+            "min": n_activities,
+            "max": n_activities,
+            "sequence": other,
+            "choice": other,
+            "parallel": parallel,
+            "loop": other,
+            "silent": 0.1,
+        },
+    )
+
+
+def play_out(tree: ProcessTree, rng: random.Random) -> List[str]:
+    """
+    Plays out the tree using the given random generator, unlike the playout of pm4py, the result only depends
+    on the seed of the generator. Loops repeat with probability 0.5.
+    """
+    if tree.operator is None:
+        return [] if tree.label is None else [tree.label]
+
+    if tree.operator == Operator.SEQUENCE:
+        return [a for child in tree.children for a in play_out(child, rng)]
+    if tree.operator == Operator.XOR:
+        return play_out(rng.choice(tree.children), rng)
+    if tree.operator == Operator.LOOP:
+        activities = play_out(tree.children[0], rng)
+        while rng.random() < 0.5:
+            activities += play_out(rng.choice(tree.children[1:]), rng)
+            activities += play_out(tree.children[0], rng)
+        return activities
+
+    children = tree.children
+    if tree.operator == Operator.OR:
+        children = [c for c in children if rng.random() < 0.5] or [rng.choice(children)]
+    # random interleaving of the children
+    branches = [play_out(child, rng) for child in children]
+    slots = [i for i, branch in enumerate(branches) for _ in branch]
+    rng.shuffle(slots)
+    positions = [0] * len(branches)
+    activities = []
+    for i in slots:
+        activities.append(branches[i][positions[i]])
+        positions[i] += 1
+
+    return activities
+
+
+def generate_traces(
+    tree: ProcessTree, n_traces: int, noise: float, rng: random.Random
+) -> List[Trace]:
+    """
+    Plays out the tree and applies noise, every event is removed, swapped with its predecessor or followed by an
+    activity of the tree with probability noise / 3 each
+    """
+    log = [play_out(tree, rng) for _ in range(n_traces)]
+    activities = sorted({a for events in log for a in events})
+
+    traces = []
+    for events in log:
+        noisy_events = []
+        for activity in events:
+            r = rng.random()
+            if r < noise / 3:
+                continue
+            noisy_events.append(activity)
+            if r < 2 * noise / 3 and len(noisy_events) > 1:
+                noisy_events[-2], noisy_events[-1] = noisy_events[-1], noisy_events[-2]
+            elif r < noise and activities:
+                noisy_events.append(rng.choice(activities))
+        traces.append(Trace([Event({"concept:name": a}) for a in noisy_events]))
+
+    return traces
+
+
+def infixes(traces: List[Trace], rng: random.Random, postfix: bool) -> List[Trace]:
+    result = []
+    for trace in traces:
+        start = rng.randint(0, len(trace))
+        end = len(trace) if postfix else rng.randint(start, len(trace))
+        result.append(Trace(trace[start:end]))
+
+    return result
+
+
+def measure(
+    name: str,
+    align: Callable[[Trace], Dict],
+    traces: List[Trace],
+) -> Dict:
+    statistics = dict.fromkeys(STATISTICS, 0)
+    timeouts = 0
+    cost = 0
+
+    start = time.perf_counter()
+    for trace in traces:
+        alignment = align(trace)
+        if alignment is None or alignment.get("timeout", False):
+            timeouts += 1
+            continue
+        cost += alignment["cost"]
+        for key in STATISTICS:
+            statistics[key] += alignment.get(key, 0)
+    duration = time.perf_counter() - start
+
+    return {
+        "alignment": name,
+        "traces": len(traces),
+        "seconds": duration,
+        "seconds_per_trace": duration / len(traces) if traces else 0,
+        "timeouts": timeouts,
+        "cost": cost,
+        **statistics,
+    }
+
+
+def benchmark_tree(
+    tree: ProcessTree, traces: List[Trace], rng: random.Random, timeout: float
+) -> List[Dict]:
+    net, im, fm = pt_converter.apply(tree)
+    prefixes = [Trace(t[: rng.randint(0, len(t))]) for t in traces]
+    proper_infixes = infixes(traces, rng, postfix=False)
+    postfixes = infixes(traces, rng, postfix=True)
+    parameters = {prefix_alignments.Parameters.PARAM_MAX_ALIGN_TIME_TRACE: timeout}
+
+    return [
+        measure(
+            "full_a_star",
+            lambda t: alignments.apply_trace(
+                t,
+                net,
+                im,
+                fm,
+                variant=alignments.Variants.VERSION_STATE_EQUATION_A_STAR,
+                parameters=parameters,
+            ),
+            traces,
+        ),
+        measure(
+            "prefix_a_star",
+            lambda t: prefix_alignments.apply_trace(
+                t,
+                net,
+                im,
+                fm,
+                variant=prefix_alignments.VERSION_A_STAR,
+                parameters=dict(parameters),
+            ),
+            prefixes,
+        ),
+        measure(
+            "prefix_dijkstra",
+            lambda t: prefix_alignments.apply_trace(
+                t,
+                net,
+                im,
+                fm,
+                variant=prefix_alignments.VERSION_DIJKSTRA_NO_HEURISTICS,
+                parameters=dict(parameters),
+            ),
+            prefixes,
+        ),
+        measure(
+            "suffix_tree_based_preprocessing",
+            lambda t: calculate_optimal_suffix_alignment(
+                t, tree, naive=False, timeout=timeout
+            ),
+            postfixes,
+        ),
+        measure(
+            "infix_baseline",
+            lambda t: calculate_optimal_infix_alignment(
+                t, tree, VARIANT_BASELINE_APPROACH, naive=False, timeout=timeout
+            ),
+            proper_infixes,
+        ),
+        measure(
+            "infix_tree_based_preprocessing",
+            lambda t: calculate_optimal_infix_alignment(
+                t,
+                tree,
+                VARIANT_TREE_BASED_PREPROCESSING,
+                naive=False,
+                timeout=timeout,
+            ),
+            proper_infixes,
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Alignment benchmark over generated trees and noisy played out logs, writes a JSON report"
+    )
+    parser.add_argument("--activities", type=int, nargs="+", default=[10, 20, 40])
+    parser.add_argument("--parallel", type=float, nargs="+", default=[0.1, 0.4])
+    parser.add_argument("--noise", type=float, nargs="+", default=[0.0, 0.2])
+    parser.add_argument("--trees", type=int, default=3)
+    parser.add_argument("--traces", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=str, default=None)
+    args = parser.parse_args()
+
+    # the tree generator and the playout use the global random generators
+    random.seed(args.seed)
+    np.random.seed(args.seed)
+    rng = random.Random(args.seed)
+
+    results = []
+    for n_activities in args.activities:
+        for parallel in args.parallel:
+            trees = [generate_tree(n_activities, parallel) for _ in range(args.trees)]
+            for noise in args.noise:
+                for i, tree in enumerate(trees):
+                    traces = generate_traces(tree, args.traces, noise, rng)
+                    for result in benchmark_tree(tree, traces, rng, args.timeout):
+                        result.update(
+                            activities=n_activities,
+                            parallel=parallel,
+                            noise=noise,
+                            tree=i,
+                        )
+                        results.append(result)
+                        print(
+                            f"activities={n_activities:<4} parallel={parallel:<4} noise={noise:<4} "
+                            f"tree={i:<3} {result['alignment']:<32} time={result['seconds']:.2f}s "
+                            f"visited={result['visited_states']}",
+                            file=sys.stderr,
+                        )
+
+    report = {
+        "arguments": vars(args),
+        "python": platform.python_version(),
+        "results": results,
+    }
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+    else:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
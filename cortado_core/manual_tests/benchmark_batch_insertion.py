@@ -0,0 +1,92 @@
+import argparse
+import random
+import time
+from copy import deepcopy
+
+import numpy as np
+from pm4py.objects.log.obj import EventLog
+
+from cortado_core.lca_approach import (
+    add_trace_to_pt_language,
+    add_traces_to_pt_language,
+)
+from cortado_core.manual_tests.benchmark_alignments import (
+    generate_traces,
+    generate_tree,
+)
+from cortado_core.models.infix_type import InfixType
+from cortado_core.process_tree_utils.miscellaneous import get_number_nodes
+from cortado_core.utils.alignment_utils import typed_trace_fits_process_tree
+from cortado_core.utils.trace import TypedTrace
+
+
+def insert_sequentially(tree, log, traces, try_pulling_lca_down):
+    log = EventLog(log)
+    for trace in traces:
+        tree = add_trace_to_pt_language(
+            tree, log, trace, try_pulling_lca_down=try_pulling_lca_down
+        )
+        log.append(trace)
+
+    return tree
+
+
+def insert_batch(tree, log, traces, try_pulling_lca_down):
+    tree, reports = add_traces_to_pt_language(
+        tree, EventLog(log), traces, try_pulling_lca_down=try_pulling_lca_down
+    )
+
+    return tree
+
+
+def fits(tree, traces) -> bool:
+    return all(
+        typed_trace_fits_process_tree(TypedTrace(t, InfixType.NOT_AN_INFIX), tree)
+        for t in traces
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compares adding variants one by one with adding them in a batch using the lca approach"
+    )
+    parser.add_argument("--activities", type=int, nargs="+", default=[10, 20])
+    parser.add_argument("--parallel", type=float, default=0.2)
+    parser.add_argument("--noise", type=float, default=0.2)
+    parser.add_argument("--trees", type=int, default=3)
+    parser.add_argument("--log", type=int, default=10)
+    parser.add_argument("--traces", type=int, nargs="+", default=[5, 20])
+    parser.add_argument("--pull-lca-down", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    np.random.seed(args.seed)
+    rng = random.Random(args.seed)
+
+    # the inputs are generated upfront, since the lca approach uses the global random generators as well
+    inputs = []
+    for n_activities in args.activities:
+        for i in range(args.trees):
+            tree = generate_tree(n_activities, args.parallel)
+            # the traces of the log fit the tree
+            log = generate_traces(tree, args.log, 0, rng)
+            for n_traces in args.traces:
+                traces = generate_traces(tree, n_traces, args.noise, rng)
+                inputs.append((n_activities, i, tree, log, traces))
+
+    for n_activities, i, tree, log, traces in inputs:
+        for name, insert in [
+            ("sequential", insert_sequentially),
+            ("batch", insert_batch),
+        ]:
+            start = time.perf_counter()
+            new_tree = insert(deepcopy(tree), log, traces, args.pull_lca_down)
+            duration = time.perf_counter() - start
+
+            print(
+                f"activities={n_activities:<4} tree={i:<3} traces={len(traces):<5} {name:<12} "
+                f"time={duration:.2f}s nodes={get_number_nodes(new_tree):<5} "
+                f"fitting={fits(new_tree, list(log) + traces)}",
+                flush=True,
+            )
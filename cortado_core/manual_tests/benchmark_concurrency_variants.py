@@ -0,0 +1,88 @@
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from pm4py.objects.log.obj import EventLog, Trace, Event
+from pm4py.util.xes_constants import (
+    DEFAULT_NAME_KEY,
+    DEFAULT_START_TIMESTAMP_KEY,
+    DEFAULT_TIMESTAMP_KEY,
+    DEFAULT_TRACEID_KEY,
+)
+
+from cortado_core.utils.cvariants import get_concurrency_variants
+from cortado_core.utils.encoded_cvariants import get_concurrency_variants_encoded
+
+
+def create_synthetic_log(
+    n_traces: int,
+    n_templates: int = 200,
+    n_activities: int = 20,
+    max_trace_length: int = 15,
+    seed: int = 0,
+) -> EventLog:
+    """
+    Creates a log whose traces are time-shifted copies of a fixed number of random templates, i.e.,
+    the log contains at most n_templates concurrency variants
+    """
+    rng = random.Random(seed)
+    activities = [f"activity {i}" for i in range(n_activities)]
+    templates = []
+    for _ in range(n_templates):
+        offset = 0
+        template = []
+        for _ in range(rng.randint(1, max_trace_length)):
+            # events overlap with their predecessor with a probability of one third
+            offset += rng.randint(-30, 60)
+            template.append((rng.choice(activities), offset, rng.randint(0, 45)))
+        templates.append(template)
+
+    log = EventLog()
+    for case in range(n_traces):
+        trace = Trace(attributes={DEFAULT_TRACEID_KEY: str(case)})
+        base = datetime(2022, 1, 1) + timedelta(minutes=rng.randint(0, 10**6))
+        for activity, offset, duration in rng.choice(templates):
+            event = Event()
+            event[DEFAULT_NAME_KEY] = activity
+            event[DEFAULT_START_TIMESTAMP_KEY] = base + timedelta(minutes=offset)
+            event[DEFAULT_TIMESTAMP_KEY] = base + timedelta(minutes=offset + duration)
+            trace.append(event)
+        log.append(trace)
+
+    return log
+
+
+def benchmark(log: EventLog, variant_function, repetitions: int):
+    n_events = sum(len(trace) for trace in log)
+    durations = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        variants = variant_function(log)
+        durations.append(time.perf_counter() - start)
+
+    best = min(durations)
+    return best, n_events / best, len(variants)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compares the events/second of get_concurrency_variants and get_concurrency_variants_encoded"
+    )
+    parser.add_argument("--traces", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repetitions", type=int, default=3)
+    args = parser.parse_args()
+
+    for n_traces in args.traces:
+        log = create_synthetic_log(n_traces)
+        for name, function in [
+            ("get_concurrency_variants", get_concurrency_variants),
+            ("get_concurrency_variants_encoded", get_concurrency_variants_encoded),
+        ]:
+            duration, events_per_second, n_variants = benchmark(
+                log, function, args.repetitions
+            )
+            print(
+                f"{name:<34} traces={n_traces:<8} variants={n_variants:<8} "
+                f"time={duration:.3f}s events/s={events_per_second:,.0f}"
+            )
@@ -0,0 +1,63 @@
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from pm4py.objects.log.obj import EventLog, Trace, Event
+from pm4py.util.xes_constants import (
+    DEFAULT_NAME_KEY,
+    DEFAULT_START_TIMESTAMP_KEY,
+    DEFAULT_TIMESTAMP_KEY,
+    DEFAULT_TRACEID_KEY,
+)
+
+from cortado_core.utils.cvariants import get_concurrency_variants
+from cortado_core.utils.encoded_cvariants import get_concurrency_variants_encoded
+
+# →(a, ∧(b, c), d), given as (activity, start offset, end offset) in minutes
+TEMPLATE = [("a", 0, 10), ("b", 20, 40), ("c", 25, 35), ("d", 50, 60)]
+
+
+def create_single_variant_log(n_traces: int) -> EventLog:
+    log = EventLog()
+    base = datetime(2022, 1, 1)
+
+    for case in range(n_traces):
+        trace = Trace(attributes={DEFAULT_TRACEID_KEY: str(case)})
+        case_start = base + timedelta(minutes=case)
+        for activity, start, end in TEMPLATE:
+            event = Event()
+            event[DEFAULT_NAME_KEY] = activity
+            event[DEFAULT_START_TIMESTAMP_KEY] = case_start + timedelta(minutes=start)
+            event[DEFAULT_TIMESTAMP_KEY] = case_start + timedelta(minutes=end)
+            trace.append(event)
+        log.append(trace)
+
+    return log
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Regression benchmark: the variant computation must scale linearly in the number of traces of a variant"
+    )
+    parser.add_argument(
+        "--traces", type=int, nargs="+", default=[10000, 100000, 1000000]
+    )
+    args = parser.parse_args()
+
+    for n_traces in args.traces:
+        log = create_single_variant_log(n_traces)
+        for name, function in [
+            ("get_concurrency_variants", get_concurrency_variants),
+            ("get_concurrency_variants_encoded", get_concurrency_variants_encoded),
+        ]:
+            start = time.perf_counter()
+            variants = function(log)
+            duration = time.perf_counter() - start
+
+            assert len(variants) == 1
+            assert len(next(iter(variants.values()))) == n_traces
+
+            print(
+                f"{name:<34} traces={n_traces:<8} time={duration:.2f}s "
+                f"per trace={duration / n_traces * 10 ** 6:.1f}µs"
+            )
@@ -0,0 +1,35 @@
+import argparse
+import random
+import time
+
+from cortado_core.tests.utils.test_split_graph import create_random_graph
+from cortado_core.utils.split_graph import split_group, split_group_networkx
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compares the bitset and the networkx implementation of split_group across variant sizes"
+    )
+    parser.add_argument(
+        "--events", type=int, nargs="+", default=[10, 50, 100, 250, 500]
+    )
+    parser.add_argument("--graphs", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for n_events in args.events:
+        graphs = [create_random_graph(rng, n_events) for _ in range(args.graphs)]
+
+        durations = {}
+        for name, function in [
+            ("networkx", split_group_networkx),
+            ("bitset", split_group),
+        ]:
+            start = time.perf_counter()
+            variants = [function(graph) for graph in graphs]
+            durations[name] = (time.perf_counter() - start) / len(graphs)
+
+        print(
+            f"events={n_events:<5} networkx={durations['networkx'] * 1000:.2f}ms "
+            f"bitset={durations['bitset'] * 1000:.2f}ms "
+            f"speedup={durations['networkx'] / durations['bitset']:.1f}x"
+        )
@@ -30,7 +30,7 @@ from cortado_core.process_tree_utils.miscellaneous import (
 )
 from cortado_core.process_tree_utils.reduction import apply_reduction_rules
 from cortado_core.process_tree_utils.to_petri_net_transition_bordered import (
-    apply as pt_to_petri_net,
+    apply_cached as pt_to_petri_net,
 )
 from cortado_core.utils.visualize_petri_net import visualize_petri_net
 
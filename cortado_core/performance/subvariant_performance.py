@@ -1,14 +1,13 @@
-from pm4py.objects.log.obj import EventLog, Event, Trace
+from pm4py.objects.log.obj import EventLog, Trace
 from pm4py.objects.log.util.interval_lifecycle import to_interval
-from pm4py.objects.log.util.xes import (
-    DEFAULT_START_TIMESTAMP_KEY,
-    DEFAULT_TIMESTAMP_KEY,
-    DEFAULT_NAME_KEY,
-)
+from pm4py.objects.log.util.xes import DEFAULT_NAME_KEY
 
 from cortado_core.performance.aggregators import stats
 from cortado_core.utils.cvariants import ACTIVITY_INSTANCE_KEY, SubvariantNode
-from cortado_core.utils.timestamp_utils import TimeUnit, transform_timestamp
+from cortado_core.utils.timestamp_utils import (
+    TimeUnit,
+    transform_log_timestamps,
+)
 
 from collections import defaultdict
 from typing import List, Any
@@ -64,15 +63,12 @@ def __get_global_performance_stats(interval_log: EventLog, time_granularity: Tim
     min_timestamp = None
     max_timestamp = None
 
-    for trace in interval_log:
-        for event in trace:
-            start_timestamp = transform_timestamp(
-                event[DEFAULT_START_TIMESTAMP_KEY], time_granularity
-            )
-            complete_timestamp = transform_timestamp(
-                event[DEFAULT_TIMESTAMP_KEY], time_granularity
-            )
-
+    for start_timestamps, complete_timestamps in transform_log_timestamps(
+        interval_log, time_granularity
+    ):
+        for start_timestamp, complete_timestamp in zip(
+            start_timestamps.tolist(), complete_timestamps.tolist()
+        ):
             if min_timestamp is None or start_timestamp < min_timestamp:
                 min_timestamp = start_timestamp
 
@@ -82,7 +78,7 @@ def __get_global_performance_stats(interval_log: EventLog, time_granularity: Tim
         if max_timestamp is None or min_timestamp is None:
             continue
 
-        durations.append((max_timestamp - min_timestamp).total_seconds())
+        durations.append(__to_seconds(max_timestamp - min_timestamp))
 
     return stats(durations)
 
@@ -92,9 +88,12 @@ def __get_service_times_per_activity(
 ):
     service_times_per_activity = defaultdict(dict)
 
-    for trace in interval_log:
-        for event in trace:
-            service_time = __calculate_service_time(event, time_granularity)
+    for trace, (start_timestamps, complete_timestamps) in zip(
+        interval_log, transform_log_timestamps(interval_log, time_granularity)
+    ):
+        service_times = (complete_timestamps - start_timestamps).tolist()
+        for event, service_time in zip(trace, service_times):
+            service_time = __to_seconds(service_time)
             activity = event[DEFAULT_NAME_KEY]
             activity_instance = event[ACTIVITY_INSTANCE_KEY]
 
@@ -106,15 +105,9 @@ def __get_service_times_per_activity(
     return service_times_per_activity
 
 
-def __calculate_service_time(event: Event, time_granularity: TimeUnit) -> int:
-    start_timestamp = transform_timestamp(
-        event[DEFAULT_START_TIMESTAMP_KEY], time_granularity
-    )
-    complete_timestamp = transform_timestamp(
-        event[DEFAULT_TIMESTAMP_KEY], time_granularity
-    )
-
-    return (complete_timestamp - start_timestamp).total_seconds()
+def __to_seconds(microseconds: int) -> float:
+    # equals timedelta(microseconds=microseconds).total_seconds()
+    return microseconds / 10**6
 
 
 def __append_service_time_to_subvariant(subvariant, service_times_per_activity):
@@ -217,36 +210,39 @@ def get_successor_complete_node(
 def add_performance_to_waiting_time_events(
     waiting_time_events: List[WaitingTimeEvent], traces, time_granularity: TimeUnit
 ):
-    traces_as_act_instance_dicts = traces_to_activity_instance_dicts(traces)
+    traces_as_act_instance_indices = [
+        {
+            (event[DEFAULT_NAME_KEY], event[ACTIVITY_INSTANCE_KEY]): i
+            for i, event in enumerate(trace)
+        }
+        for trace in traces
+    ]
+    timestamps = [
+        dict(zip(("start", "complete"), trace_timestamps))
+        for trace_timestamps in transform_log_timestamps(traces, time_granularity)
+    ]
 
     for waiting_time_event in waiting_time_events:
         waiting_times = []
-        for trace_as_instance_dict in traces_as_act_instance_dicts:
-            start_timestamp_key = (
-                DEFAULT_START_TIMESTAMP_KEY
-                if waiting_time_event.start.lifecycle == "start"
-                else DEFAULT_TIMESTAMP_KEY
-            )
-            start_timestamp = trace_as_instance_dict[
-                waiting_time_event.start.activity,
-                waiting_time_event.start.activity_instance,
-            ][start_timestamp_key]
-            start_timestamp = transform_timestamp(start_timestamp, time_granularity)
-
-            complete_timestamp_key = (
-                DEFAULT_START_TIMESTAMP_KEY
-                if waiting_time_event.complete.lifecycle == "start"
-                else DEFAULT_TIMESTAMP_KEY
-            )
-            complete_timestamp = trace_as_instance_dict[
-                waiting_time_event.complete.activity,
-                waiting_time_event.complete.activity_instance,
-            ][complete_timestamp_key]
-            complete_timestamp = transform_timestamp(
-                complete_timestamp, time_granularity
-            )
+        for trace_as_instance_indices, trace_timestamps in zip(
+            traces_as_act_instance_indices, timestamps
+        ):
+            start_timestamp = trace_timestamps[waiting_time_event.start.lifecycle][
+                trace_as_instance_indices[
+                    waiting_time_event.start.activity,
+                    waiting_time_event.start.activity_instance,
+                ]
+            ]
+            complete_timestamp = trace_timestamps[
+                waiting_time_event.complete.lifecycle
+            ][
+                trace_as_instance_indices[
+                    waiting_time_event.complete.activity,
+                    waiting_time_event.complete.activity_instance,
+                ]
+            ]
 
-            waiting_time = (complete_timestamp - start_timestamp).total_seconds()
+            waiting_time = __to_seconds(int(complete_timestamp - start_timestamp))
             waiting_times.append(waiting_time)
 
         waiting_time_event.performance_stats = stats(waiting_times)
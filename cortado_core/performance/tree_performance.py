@@ -15,6 +15,7 @@ from cortado_core.performance.utils import (
     get_all_nodes,
 )
 from pm4py.algo.conformance.alignments.petri_net import algorithm as net_alignment
+from cortado_core.utils.parallel_alignments import AlignmentPool
 from pm4py.algo.filtering.log.variants import variants_filter
 from pm4py.objects.log.util.interval_lifecycle import to_lifecycle
 from pm4py.objects.petri_net.obj import PetriNet, Marking
@@ -379,6 +380,7 @@ def get_tree_performance_intervals(
     alignment_time_limit=None,
     alignment_params={},
     selected_tree_nodes=None,
+    n_processes=None,
 ):
     log_lifecycle = to_low_level_log(log)
 
@@ -388,6 +390,7 @@ def get_tree_performance_intervals(
         alignment_variant=alignment_variant,
         alignment_time_limit=alignment_time_limit,
         alignment_params=alignment_params,
+        n_processes=n_processes,
     )
     performances = compute_performances_intervals(
         pt, log_lifecycle, alignments, selected_tree_nodes
@@ -495,29 +498,49 @@ def get_all_alignments(
     alignment_variant=net_alignment.Variants.VERSION_STATE_EQUATION_A_STAR,
     alignment_time_limit=None,
     alignment_params={},
+    n_processes=None,
 ):
+    """
+    :param n_processes: if given, the variants are aligned by an AlignmentPool with this number of processes
+    """
     net, im, fm = to_petri_net_transition_bordered.apply(pt)
     low_level_net, im, fm, _ = get_low_level_net(net)
     variants = variants_filter.get_variants(log_lifecycle)
-    all_alignments = {}
-    fitness = 0
-    for variant in tqdm(variants):
-        v_trace = variant_to_trace(variant)
-        if alignment_time_limit is not None:
-            alignment_params[net_alignment.Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = (
-                alignment_time_limit
-            )
-        alignment_params[
-            net_alignment.Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE
-        ] = True
-        alignments = net_alignment.apply(
-            v_trace,
+    if alignment_time_limit is not None:
+        alignment_params[net_alignment.Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = (
+            alignment_time_limit
+        )
+    alignment_params[
+        net_alignment.Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE
+    ] = True
+
+    v_traces = [variant_to_trace(variant) for variant in variants]
+    if n_processes is not None:
+        with AlignmentPool(
             low_level_net,
             im,
             fm,
+            alignment_params,
+            n_processes=n_processes,
             variant=alignment_variant,
-            parameters=alignment_params,
-        )
+        ) as pool:
+            variant_alignments = pool.calculate_alignments(v_traces)
+    else:
+        variant_alignments = [
+            net_alignment.apply(
+                v_trace,
+                low_level_net,
+                im,
+                fm,
+                variant=alignment_variant,
+                parameters=alignment_params,
+            )
+            for v_trace in tqdm(v_traces)
+        ]
+
+    all_alignments = {}
+    fitness = 0
+    for variant, alignments in zip(variants, variant_alignments):
         if "all_alignments" in alignments:
             # reduced_alignments = reduce_alignments(alignments["all_alignments"])
             all_alignments[variant] = alignments["all_alignments"]
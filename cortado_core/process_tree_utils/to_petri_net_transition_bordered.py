@@ -1,4 +1,6 @@
-from typing import Tuple
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 from pm4py.objects.petri_net.obj import PetriNet, Marking
 from pm4py.objects.petri_net.utils import petri_utils as pn_util
@@ -36,6 +38,82 @@ def apply(tree: ProcessTree) -> Tuple[PetriNet, Marking, Marking]:
     return net, Marking(), Marking()
 
 
+def structural_fingerprint(tree: ProcessTree) -> Tuple:
+    """
+    Fingerprint of the structure of a (sub)tree including the identity of its nodes, i.e., the transitions
+    of a converted net, which are named by the nodes, stay valid as long as the fingerprint does not change
+    """
+    fingerprint = [tree.parent is None]
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        fingerprint.extend((id(node), node.operator, node.label, len(node.children)))
+        stack.extend(reversed(node.children))
+
+    return tuple(fingerprint)
+
+
+class PetriNetConversionCache:
+    """
+    Least recently used cache of converted (sub)trees. A tree is looked up by its identity and the cached net
+    is only reused if the structural fingerprint of the tree did not change since its conversion, hence,
+    trees mutated in place, e.g., by the repair of the lca approach, are converted again.
+    Cached nets must not be modified by the caller.
+    """
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        # time spent converting trees on cache misses
+        self.seconds = 0.0
+        self.__entries: OrderedDict[
+            int, Tuple[Tuple, Tuple[PetriNet, Marking, Marking]]
+        ] = OrderedDict()
+
+    def apply(self, tree: ProcessTree) -> Tuple[PetriNet, Marking, Marking]:
+        fingerprint = structural_fingerprint(tree)
+        entry = self.__entries.get(id(tree))
+        if entry is not None and entry[0] == fingerprint:
+            self.hits += 1
+            self.__entries.move_to_end(id(tree))
+            return entry[1]
+
+        self.misses += 1
+        # the net references all nodes of the tree, i.e., the ids of cached trees are not reused
+        start = time.perf_counter()
+        converted = apply(tree)
+        self.seconds += time.perf_counter() - start
+        self.__entries[id(tree)] = (fingerprint, converted)
+        self.__entries.move_to_end(id(tree))
+        if len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+
+        return converted
+
+    def invalidate(self, tree: Optional[ProcessTree] = None):
+        if tree is None:
+            self.__entries.clear()
+        else:
+            self.__entries.pop(id(tree), None)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+conversion_cache = PetriNetConversionCache()
+
+
+def apply_cached(tree: ProcessTree) -> Tuple[PetriNet, Marking, Marking]:
+    """
+    Cached counterpart of apply using the module-level conversion_cache, the returned net is shared
+    and must not be modified
+    """
+    return conversion_cache.apply(tree)
+
+
 def _get_src_transition(sub_net):
     for t in sub_net.transitions:
         if len(pn_util.pre_set(t)) == 0:
@@ -12,6 +12,7 @@ from cortado_core.alignments.infix_alignments.variants.tree_based_preprocessing
     reduce_process_tree,
     search_leaf_nodes_in_tree,
     get_matching_leaf_nodes,
+    ExtendedPetriNetCache,
 )
 from pm4py.objects.log.obj import Trace, Event
 from pm4py.objects.process_tree.utils.generic import parse
@@ -338,6 +339,37 @@ class TestInfixAlignments(unittest.TestCase):
 
             self.assertEqual(reduced_tree, expected_result)
 
+    def test_extended_net_is_built_once_per_activity_set(self):
+        process_tree = parse("->('a', *(X('b', 'c'), 'd'), +('e', 'f'), 'g')")
+        cache = ExtendedPetriNetCache()
+        infixes = ["bd", "db", "bdb", "ce", "dbx", "ef"]
+
+        for infix in infixes:
+            trace = generate_test_trace(infix)
+            cache.apply(trace, process_tree, False, False, False, 10)
+            expected = calculate_optimal_infix_alignment(
+                trace,
+                process_tree,
+                naive=False,
+                variant=VARIANT_TREE_BASED_PREPROCESSING,
+                use_extended_net_cache=False,
+            )
+            alignment = calculate_optimal_infix_alignment(
+                trace,
+                process_tree,
+                naive=False,
+                variant=VARIANT_TREE_BASED_PREPROCESSING,
+            )
+            self.assertEqual(expected["cost"], alignment["cost"], infix)
+            self.assertEqual(
+                len(expected["net"][0].transitions),
+                len(alignment["net"][0].transitions),
+            )
+
+        # "db", "bdb" and "dbx" share the activities of "bd" in the tree
+        self.assertEqual(3, cache.misses)
+        self.assertEqual(3, cache.hits)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,7 +6,11 @@ from pm4py.objects.log.obj import EventLog, Event, Trace
 from pm4py.objects.process_tree.obj import Operator
 from pm4py.objects.process_tree.utils.generic import parse as pt_parse, tree_sort
 
-from cortado_core.lca_approach import add_trace_to_pt_language
+from cortado_core.lca_approach import (
+    ModifiedSubtreeTracker,
+    add_trace_to_pt_language,
+    add_traces_to_pt_language,
+)
 from cortado_core.models.infix_type import InfixType
 from cortado_core.tests.test_infix_alignments import generate_test_trace
 from cortado_core.utils.alignment_utils import typed_trace_fits_process_tree
@@ -288,3 +292,89 @@ class LCA_Approach_Tests(unittest.TestCase):
             added.append(trace_to_add)
             for i2, trace in enumerate(added):
                 self.assertTrue(typed_trace_fits_process_tree(trace, tree))
+
+    def test_add_traces_repairs_lca_once_for_all_deviating_traces(self):
+        tree = pt_parse("->('a', X('b', 'c'), *('d', tau), 'e')")
+        log = EventLog([generate_test_trace("abde")])
+        traces = [
+            generate_test_trace(t) for t in ["abde", "axde", "abdxe", "fabde", "acdde"]
+        ]
+
+        new_tree, reports = add_traces_to_pt_language(
+            tree, log, traces, add_artificial_start_end=True
+        )
+
+        for trace in list(log) + traces:
+            self.assertTrue(
+                typed_trace_fits_process_tree(
+                    TypedTrace(trace, InfixType.NOT_AN_INFIX), new_tree
+                )
+            )
+        self.assertEqual(len(traces), len(reports))
+        self.assertTrue(reports[0].fitted_initially)
+        self.assertEqual(0, reports[0].repairs)
+        self.assertTrue(reports[4].fitted_initially)
+        for report in reports[1:4]:
+            self.assertFalse(report.fitted_initially)
+            self.assertEqual(1, report.repairs)
+
+    def test_add_traces_with_infixes(self):
+        tree = pt_parse("->('a', 'b', +('c', 'd'))")
+        traces = [
+            TypedTrace(generate_test_trace("be"), InfixType.PROPER_INFIX),
+            TypedTrace(generate_test_trace("abce"), InfixType.PREFIX),
+            TypedTrace(generate_test_trace("abcxd"), InfixType.NOT_AN_INFIX),
+        ]
+
+        new_tree, reports = add_traces_to_pt_language(
+            tree, [], traces, try_pulling_lca_down=True, add_artificial_start_end=False
+        )
+
+        for trace in traces:
+            self.assertTrue(typed_trace_fits_process_tree(trace, new_tree))
+        self.assertTrue(all(report.repairs > 0 for report in reports))
+
+    def test_tracker_only_normalizes_modified_subtrees(self):
+        tree = pt_parse("->('a', X('b', 'c'), +('d', 'e'))")
+        tracker = ModifiedSubtreeTracker()
+        self.assertEqual(8, tracker.normalize(tree))
+        ids = {id(node): node.id for node in self.__nodes(tree)}
+
+        new_subtree = pt_parse("*('b', 'c', 'f')")
+        new_subtree.parent = tree
+        tree.children[1] = new_subtree
+
+        # the loop is reduced to two children, i.e., 5 nodes are added
+        self.assertEqual(5, tracker.normalize(tree))
+        self.assertEqual(2, len(new_subtree.children))
+        self.assertEqual(0, tracker.normalize(tree))
+        for node in self.__nodes(tree):
+            if id(node) in ids:
+                self.assertEqual(ids[id(node)], node.id)
+        node_ids = [node.id for node in self.__nodes(tree)]
+        self.assertEqual(len(node_ids), len(set(node_ids)))
+
+    def test_statistics_of_repair_iterations(self):
+        tree = pt_parse("->('a', X('b', 'c'), +('d', 'e'))")
+        statistics = []
+
+        tree = add_trace_to_pt_language(
+            tree, EventLog(), generate_test_trace("abxde"), statistics=statistics
+        )
+
+        self.assertTrue(
+            typed_trace_fits_process_tree(
+                TypedTrace(generate_test_trace("abxde"), InfixType.NOT_AN_INFIX), tree
+            )
+        )
+        self.assertGreaterEqual(len(statistics), 2)
+        # the first iteration normalizes the tree including the artificial start and end activities
+        self.assertEqual(10, statistics[0].normalized_nodes)
+        self.assertLess(statistics[1].normalized_nodes, 10)
+        self.assertTrue(all(s.total > 0 for s in statistics))
+
+    @staticmethod
+    def __nodes(tree):
+        yield tree
+        for child in tree.children:
+            yield from LCA_Approach_Tests.__nodes(child)
@@ -8,6 +8,13 @@ from pm4py.objects.petri_net.utils import align_utils
 
 from pm4py.objects.conversion.process_tree import converter as pt_converter
 
+from cortado_core.process_tree_utils.to_petri_net_transition_bordered import (
+    apply as pt_to_petri_net,
+)
+from cortado_core.alignments.prefix_alignments.incremental import (
+    IncrementalPrefixAlignment,
+    PrefixAlignmentTrie,
+)
 from cortado_core.tests.test_infix_alignments import generate_test_trace
 
 
@@ -41,7 +48,48 @@ class TestInfixAlignments(unittest.TestCase):
             t, pn, im, fm, variant=prefix_alignments.VERSION_A_STAR
         )
 
-        return [variant_dijkstra, variant_a_star]
+        variant_a_star_prepared = lambda t, pn, im, fm: prefix_alignments.apply_traces(
+            [t], pn, im, fm
+        )[0]
+
+        variant_a_star_without_warm_start = (
+            lambda t, pn, im, fm: prefix_alignments.apply_trace(
+                t,
+                pn,
+                im,
+                fm,
+                variant=prefix_alignments.VERSION_A_STAR,
+                parameters={"warm_started_lp": False},
+            )
+        )
+
+        variant_dijkstra_array_markings = (
+            lambda t, pn, im, fm: prefix_alignments.apply_trace(
+                t, pn, im, fm, variant=prefix_alignments.VERSION_DIJKSTRA_ARRAY_MARKINGS
+            )
+        )
+        variant_a_star_array_markings = (
+            lambda t, pn, im, fm: prefix_alignments.apply_trace(
+                t, pn, im, fm, variant=prefix_alignments.VERSION_A_STAR_ARRAY_MARKINGS
+            )
+        )
+
+        def variant_incremental(t, pn, im, fm):
+            search = IncrementalPrefixAlignment(pn, im, fm)
+            for event in t:
+                search.append(event["concept:name"])
+                search.align()
+            return search.align()
+
+        return [
+            variant_dijkstra,
+            variant_dijkstra_array_markings,
+            variant_incremental,
+            variant_a_star,
+            variant_a_star_array_markings,
+            variant_a_star_prepared,
+            variant_a_star_without_warm_start,
+        ]
 
     def test_prefix_alignments_basic_parallel_case(self):
         tree = "+(->('a','b','c'),->('d','e','f'))"
@@ -121,6 +169,204 @@ class TestInfixAlignments(unittest.TestCase):
 
         self.__test_tree(tree, acceptable_prefixes, not_acceptable_prefixes)
 
+    def test_prepared_model_is_reused_across_traces(self):
+        process_tree = parse("X(+(->('a','b'),+('c','d')),*(+('e','f'),'b'))")
+        net, im, fm = pt_to_petri_net(process_tree)
+        traces = [
+            generate_test_trace(prefix)
+            for prefix in [
+                [],
+                ["a", "d", "c", "b"],
+                ["b", "a"],
+                ["f", "x", "e", "b"],
+                ["a", "d", "c", "b", "f"],
+            ]
+        ]
+        parameters = {"ret_tuple_as_trans_desc": True}
+
+        alignments = prefix_alignments.apply_traces(
+            traces, net, im, fm, parameters=parameters
+        )
+
+        for trace, alignment in zip(traces, alignments):
+            expected = prefix_alignments.apply_trace(
+                trace,
+                net,
+                im,
+                fm,
+                parameters=parameters,
+                variant=prefix_alignments.VERSION_A_STAR,
+            )
+            self.assertEqual(expected["cost"], alignment["cost"])
+            self.assertEqual(expected["fitness"], alignment["fitness"])
+            # model moves refer to the transitions of the net
+            self.assertTrue(
+                all(
+                    step[0][1] in {t.name for t in net.transitions}
+                    for step in alignment["alignment"]
+                    if step[0][1] != align_utils.SKIP
+                )
+            )
+            self.assertEqual(
+                [e["concept:name"] for e in trace],
+                [
+                    step[1][0]
+                    for step in alignment["alignment"]
+                    if step[1][0] != align_utils.SKIP
+                ],
+            )
+
+    def test_warm_started_lp_reports_lp_statistics(self):
+        process_tree = parse("+(->('a','b','c'),->('d','e','f'))")
+        net, im, fm = pt_converter.apply(process_tree)
+        trace = generate_test_trace(["a", "f", "x", "d", "e"])
+
+        alignments = [
+            prefix_alignments.apply_trace(
+                trace,
+                net,
+                im,
+                fm,
+                variant=prefix_alignments.VERSION_A_STAR,
+                parameters=parameters,
+            )
+            for parameters in [
+                {"warm_started_lp": False},
+                {},
+                {"lp_reuse_basis": False},
+            ]
+        ]
+
+        for alignment in alignments:
+            self.assertEqual(alignments[0]["cost"], alignment["cost"])
+            self.assertGreaterEqual(alignment["lp_solved"], 1)
+            self.assertGreaterEqual(alignment["lp_time"], 0)
+
+    def test_array_marking_variants_find_the_same_costs(self):
+        process_tree = parse("->('a',*(X('b','c'),'d'),+('e',->('f','g')))")
+        net, im, fm = pt_to_petri_net(process_tree)
+        prefixes = [[], ["a", "c", "d", "b"], ["a", "g", "f"], ["e", "a"], ["x"]]
+
+        for prefix in prefixes:
+            trace = generate_test_trace(prefix)
+            for variant, array_variant in [
+                (
+                    prefix_alignments.VERSION_A_STAR,
+                    prefix_alignments.VERSION_A_STAR_ARRAY_MARKINGS,
+                ),
+                (
+                    prefix_alignments.VERSION_DIJKSTRA_NO_HEURISTICS,
+                    prefix_alignments.VERSION_DIJKSTRA_ARRAY_MARKINGS,
+                ),
+            ]:
+                expected = prefix_alignments.apply_trace(
+                    trace, net, im, fm, variant=variant
+                )
+                alignment = prefix_alignments.apply_trace(
+                    trace, net, im, fm, variant=array_variant
+                )
+
+                self.assertEqual(expected["cost"], alignment["cost"], prefix)
+
+    def test_trie_reuses_search_of_shared_prefixes(self):
+        process_tree = parse("->('a',*(X('b','c'),'d'),+('e',->('f','g')))")
+        net, im, fm = pt_to_petri_net(process_tree)
+        prefixes = [
+            ["a", "b", "d", "c"],
+            ["a", "b", "d", "c", "e", "f"],
+            ["a", "b", "d", "x", "e"],
+            ["a", "b"],
+            ["g", "a"],
+        ]
+        trie = PrefixAlignmentTrie(
+            net, im, fm, parameters={"ret_tuple_as_trans_desc": True}
+        )
+
+        for prefix in prefixes:
+            trace = generate_test_trace(prefix)
+            expected = prefix_alignments.apply_trace(
+                trace,
+                net,
+                im,
+                fm,
+                variant=prefix_alignments.VERSION_DIJKSTRA_NO_HEURISTICS,
+                parameters={"ret_tuple_as_trans_desc": True},
+            )
+            alignment = trie.align(trace)
+
+            self.assertEqual(expected["cost"], alignment["cost"], prefix)
+            self.assertEqual(
+                prefix,
+                [move[1][0] for move in alignment["alignment"] if move[1][0] != ">>"],
+            )
+
+        self.assertEqual(["a", "g"], sorted(trie.root.children))
+        self.assertEqual(
+            ["c", "x"],
+            sorted(trie.root.children["a"].children["b"].children["d"].children),
+        )
+
+    def test_calculate_optimal_prefix_alignments(self):
+        process_tree = parse("X(+(->('a','b'),+('c','d')),*(+('e','f'),'b'))")
+        prefixes = [["a", "d"], ["a", "d", "c", "b"], ["a", "d", "c", "b", "f"], []]
+        traces = [generate_test_trace(prefix) for prefix in prefixes]
+
+        alignments = prefix_alignments.calculate_optimal_prefix_alignments(
+            traces, process_tree, use_cortado_tree_converter=True
+        )
+
+        for trace, alignment in zip(traces, alignments):
+            expected = prefix_alignments.calculate_optimal_prefix_alignment(
+                trace, process_tree, use_dijkstra=True, use_cortado_tree_converter=True
+            )
+            self.assertEqual(expected["cost"], alignment["cost"])
+            self.assertEqual(expected["fitness"], alignment["fitness"])
+
+    def test_state_limit_results_in_approximate_alignment(self):
+        process_tree = parse("->('a',+('b','c','d','e','f','g'),'h')")
+        net, im, fm = pt_to_petri_net(process_tree)
+        trace = generate_test_trace(["a", "x", "g", "f", "e", "d", "c", "b", "h"])
+
+        for variant in [
+            prefix_alignments.VERSION_A_STAR,
+            prefix_alignments.VERSION_DIJKSTRA_NO_HEURISTICS,
+            prefix_alignments.VERSION_A_STAR_ARRAY_MARKINGS,
+            prefix_alignments.VERSION_DIJKSTRA_ARRAY_MARKINGS,
+        ]:
+            expected = prefix_alignments.apply_trace(
+                trace, net, im, fm, variant=variant, parameters={"max_states": 1000}
+            )
+            alignment = prefix_alignments.apply_trace(
+                trace,
+                net,
+                im,
+                fm,
+                variant=variant,
+                parameters={"max_states": 10, "ret_tuple_as_trans_desc": True},
+            )
+
+            self.__assert_approximate_alignment(trace, expected, alignment)
+
+        # the moves of the prepared model of apply_traces have no arcs
+        expected, alignment = [
+            prefix_alignments.apply_traces([trace], net, im, fm, parameters)[0]
+            for parameters in [
+                {"max_states": 1000},
+                {"max_states": 10, "ret_tuple_as_trans_desc": True},
+            ]
+        ]
+        self.__assert_approximate_alignment(trace, expected, alignment)
+
+    def __assert_approximate_alignment(self, trace, expected, alignment):
+        self.assertNotIn("approximate", expected)
+        self.assertTrue(alignment["approximate"])
+        self.assertGreater(alignment["pruned_states"], 0)
+        self.assertGreater(alignment["cost"], expected["cost"])
+        self.assertEqual(
+            [e["concept:name"] for e in trace],
+            [m[1][0] for m in alignment["alignment"] if m[1][0] != ">>"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from copy import deepcopy
 from datetime import datetime
 
 from pm4py.objects.log.obj import Trace, Event
@@ -8,7 +9,18 @@ from pm4py.objects.log.util.xes import (
     DEFAULT_TRANSITION_KEY,
 )
 
-from cortado_core.utils.cvariants import get_detailed_variants, SubvariantNode
+from multiprocessing import Pool
+
+from cortado_core.tests.utils.test_encoded_cvariants import create_random_log
+from cortado_core.utils.cvariants import (
+    ACTIVITY_INSTANCE_KEY,
+    SubvariantCache,
+    get_concurrency_variants,
+    get_detailed_variants,
+    get_detailed_variants_batch,
+    SubvariantNode,
+)
+from cortado_core.utils.timestamp_utils import TimeUnit
 
 
 class TestSubvariantGeneration(unittest.TestCase):
@@ -82,6 +94,55 @@ class TestSubvariantGeneration(unittest.TestCase):
         self.assertEquals(subvariant, expected)
         self.assertEquals(len(subvariants[subvariant]), 2)
 
+    def assert_same_subvariants(self, expected, subvariants):
+        self.assertEqual(list(expected.keys()), list(subvariants.keys()))
+        for subvariant, traces in expected.items():
+            self.assertEqual(traces, subvariants[subvariant])
+            for trace in subvariants[subvariant]:
+                self.assertTrue(all(ACTIVITY_INSTANCE_KEY in event for event in trace))
+
+    def test_batch_equals_single_variants(self):
+        variants = get_concurrency_variants(create_random_log(3, 300))
+
+        for time_granularity in [TimeUnit.MIN, TimeUnit.HOUR]:
+            expected = {
+                variant: get_detailed_variants(traces, time_granularity)
+                for variant, traces in variants.items()
+            }
+            batch = get_detailed_variants_batch(variants, time_granularity)
+            with Pool(2) as pool:
+                parallel_batch = get_detailed_variants_batch(
+                    variants, time_granularity, use_mp=True, pool=pool
+                )
+
+            self.assertEqual(list(expected.keys()), list(batch.keys()))
+            for variant, subvariants in expected.items():
+                self.assert_same_subvariants(subvariants, batch[variant])
+                self.assert_same_subvariants(subvariants, parallel_batch[variant])
+
+    def test_subvariant_cache(self):
+        variants = get_concurrency_variants(create_random_log(5, 100))
+        variant, traces = max(variants.items(), key=lambda item: len(item[1]))
+        cache = SubvariantCache()
+
+        subvariants = cache.get_detailed_variants(variant, traces)
+        self.assertIs(subvariants, cache.get_detailed_variants(variant, traces))
+        self.assertIs(subvariants, cache.get_detailed_variants_batch(variants)[variant])
+
+        # changed traces of a variant are recomputed
+        recomputed = cache.get_detailed_variants(variant, traces[:1])
+        self.assertIsNot(subvariants, recomputed)
+        self.assertEqual(sum(len(t) for t in recomputed.values()), 1)
+
+        cache.invalidate(variant)
+        self.assertIsNot(recomputed, cache.get_detailed_variants(variant, traces[:1]))
+
+        # a replaced trace between the first and the last one is detected as well
+        traces = list(traces)
+        subvariants = cache.get_detailed_variants(variant, traces)
+        traces[1] = deepcopy(traces[1])
+        self.assertIsNot(subvariants, cache.get_detailed_variants(variant, traces))
+
 
 if __name__ == "__main__":
     unittest.main()
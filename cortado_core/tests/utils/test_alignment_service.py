@@ -0,0 +1,103 @@
+import unittest
+from multiprocessing import Pool
+
+from pm4py.objects.log.obj import Event, EventLog, Trace
+from pm4py.objects.process_tree.obj import ProcessTree
+from pm4py.objects.process_tree.utils.generic import parse as pt_parse
+
+from cortado_core.models.infix_type import InfixType
+from cortado_core.process_tree_utils.to_petri_net_transition_bordered import (
+    apply as pt_to_petri_net,
+)
+from cortado_core.utils.alignment_service import (
+    AlignmentCache,
+    group_traces_by_activities,
+)
+from cortado_core.utils.alignment_utils import calculate_alignment_typed_trace
+from cortado_core.utils.parallel_alignments import calculate_alignments_parallel
+from cortado_core.utils.trace import TypedTrace
+
+
+def create_trace(activities):
+    return Trace([Event({"concept:name": a}) for a in activities])
+
+
+class TestAlignmentService(unittest.TestCase):
+    def setUp(self):
+        self.cache = AlignmentCache()
+        self.tree = pt_parse("->('A', X('B', 'C'), +('D', 'E'))")
+
+    def test_group_traces_by_activities(self):
+        traces = [create_trace(a) for a in ["ABDE", "ACDE", "ABDE", "AB"]]
+        infix_types = [
+            InfixType.NOT_AN_INFIX,
+            InfixType.NOT_AN_INFIX,
+            InfixType.NOT_AN_INFIX,
+            InfixType.PREFIX,
+        ]
+
+        groups = group_traces_by_activities(traces, infix_types)
+
+        self.assertEqual([[0, 2], [1], [3]], list(groups.values()))
+
+    def test_distinct_traces_are_aligned_once(self):
+        traces = [
+            TypedTrace(create_trace(a), InfixType.NOT_AN_INFIX)
+            for a in ["ABDE", "ACED", "ABDE", "AXDE", "ABDE"]
+        ]
+        traces.append(TypedTrace(create_trace("AB"), InfixType.PREFIX))
+
+        alignments = self.cache.calculate_alignments(self.tree, traces)
+
+        self.assertEqual(4, self.cache.misses)
+        self.assertEqual(0, self.cache.hits)
+        for trace, alignment in zip(traces, alignments):
+            expected = calculate_alignment_typed_trace(self.tree, trace)
+            self.assertEqual(expected["cost"], alignment["cost"])
+        self.assertIsNot(alignments[0]["alignment"], alignments[2]["alignment"])
+
+    def test_alignments_are_reused_until_tree_is_modified(self):
+        trace = TypedTrace(create_trace("ABDEF"), InfixType.NOT_AN_INFIX)
+        alignment = self.cache.calculate_alignment(self.tree, trace)
+        alignment["alignment"].clear()
+
+        self.assertEqual(
+            alignment["cost"], self.cache.calculate_alignment(self.tree, trace)["cost"]
+        )
+        self.assertEqual(1, self.cache.hits)
+
+        leaf = ProcessTree(label="F", parent=self.tree)
+        self.tree.children.append(leaf)
+        alignment = self.cache.calculate_alignment(self.tree, trace)
+
+        self.assertEqual(2, self.cache.misses)
+        self.assertEqual(0, alignment["cost"] // 10000)
+
+    def test_least_recently_used_alignment_is_evicted(self):
+        cache = AlignmentCache(max_size=1)
+        traces = [
+            TypedTrace(create_trace(a), InfixType.NOT_AN_INFIX) for a in ["ABDE", "AC"]
+        ]
+
+        for trace in traces + traces[:1]:
+            cache.calculate_alignment(self.tree, trace)
+
+        self.assertEqual(1, len(cache))
+        self.assertEqual(3, cache.misses)
+
+    def test_parallel_alignments_are_fanned_out(self):
+        log = EventLog([create_trace(a) for a in ["ABDE", "AXDE", "ABDE", "ACED"]])
+        net, im, fm = pt_to_petri_net(self.tree)
+
+        with Pool(2) as pool:
+            alignments = calculate_alignments_parallel(
+                log, net, im, fm, parameters={}, pool=pool
+            )
+
+        self.assertEqual(len(log), len(alignments))
+        self.assertEqual(alignments[0]["alignment"], alignments[2]["alignment"])
+        self.assertEqual([0, 2, 0, 0], [a["cost"] // 10000 for a in alignments])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import random
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+from pm4py.objects.log.obj import EventLog, Trace, Event
+from pm4py.util.xes_constants import (
+    DEFAULT_NAME_KEY,
+    DEFAULT_START_TIMESTAMP_KEY,
+    DEFAULT_TIMESTAMP_KEY,
+    DEFAULT_TRACEID_KEY,
+)
+
+from cortado_core.tests.pattern_mining.example_log import create_example_log_1
+from cortado_core.utils.cvariants import get_concurrency_variants
+from cortado_core.utils.encoded_cvariants import (
+    get_concurrency_variants_encoded,
+    encode_event_log,
+)
+from cortado_core.utils.encoded_log import DEFAULT_CASE_ID_KEY
+from cortado_core.utils.timestamp_utils import TimeUnit
+
+
+def create_random_log(seed: int, n_traces: int = 100) -> EventLog:
+    rng = random.Random(seed)
+    log = EventLog()
+
+    for case in range(n_traces):
+        trace = Trace(attributes={DEFAULT_TRACEID_KEY: str(case)})
+        base = datetime(2021, 1, 1, tzinfo=timezone.utc) + timedelta(
+            days=rng.randint(0, 100)
+        )
+        for _ in range(rng.randint(1, 6)):
+            start = base + timedelta(minutes=rng.randint(0, 20) * 30)
+            complete = start + timedelta(minutes=rng.randint(0, 4) * 30)
+            event = Event()
+            event[DEFAULT_NAME_KEY] = rng.choice("abcd")
+            event[DEFAULT_START_TIMESTAMP_KEY] = start
+            event[DEFAULT_TIMESTAMP_KEY] = complete
+            trace.append(event)
+        log.append(trace)
+
+    return log
+
+
+class TestEncodedConcurrencyVariants(unittest.TestCase):
+    def assert_same_variants(self, expected, actual, compare_traces=True):
+        self.assertEqual(list(expected.keys()), list(actual.keys()))
+
+        actual_variants = {variant: variant for variant in actual}
+        for variant, traces in expected.items():
+            actual_variant = actual_variants[variant]
+            self.assertEqual(
+                {str(g): count for g, count in variant.graphs.items()},
+                {str(g): count for g, count in actual_variant.graphs.items()},
+            )
+            self.assertEqual(len(traces), len(actual[variant]))
+            if compare_traces:
+                self.assertEqual(traces, actual[variant])
+
+    def test_example_log(self):
+        log = create_example_log_1()
+
+        self.assert_same_variants(
+            get_concurrency_variants(log), get_concurrency_variants_encoded(log)
+        )
+
+    def test_random_logs_all_time_granularities(self):
+        for seed in range(3):
+            for time_granularity in TimeUnit:
+                with self.subTest(seed=seed, time_granularity=time_granularity):
+                    log = create_random_log(seed)
+                    self.assert_same_variants(
+                        get_concurrency_variants(
+                            log, time_granularity=time_granularity
+                        ),
+                        get_concurrency_variants_encoded(
+                            log, time_granularity=time_granularity
+                        ),
+                    )
+
+    def test_dataframe_input(self):
+        log = create_random_log(42)
+        rows = [
+            {
+                DEFAULT_CASE_ID_KEY: trace.attributes[DEFAULT_TRACEID_KEY],
+                DEFAULT_NAME_KEY: event[DEFAULT_NAME_KEY],
+                DEFAULT_START_TIMESTAMP_KEY: event[DEFAULT_START_TIMESTAMP_KEY],
+                DEFAULT_TIMESTAMP_KEY: event[DEFAULT_TIMESTAMP_KEY],
+            }
+            for trace in log
+            for event in trace
+        ]
+
+        variants = get_concurrency_variants_encoded(pd.DataFrame(rows))
+
+        self.assert_same_variants(
+            get_concurrency_variants(log), variants, compare_traces=False
+        )
+        for traces in variants.values():
+            for trace in traces:
+                self.assertIn(DEFAULT_TRACEID_KEY, trace.attributes)
+
+    def test_encoded_log(self):
+        log = create_example_log_1()
+        encoded_log = encode_event_log(log)
+
+        self.assertEqual(encoded_log.n_cases, len(log))
+        self.assertEqual(encoded_log.n_events, int(encoded_log.case_offsets[-1]))
+        self.assertEqual(
+            sorted(encoded_log.activities), ["A", "B", "C", "D", "G", "H", "I", "K"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
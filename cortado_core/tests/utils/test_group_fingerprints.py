@@ -0,0 +1,114 @@
+import pickle
+import unittest
+from copy import deepcopy
+
+from cortado_core.models.infix_type import InfixType
+from cortado_core.utils.cgroups_graph import ConcurrencyGroup
+from cortado_core.utils.split_graph import (
+    LeafGroup,
+    ParallelGroup,
+    SequenceGroup,
+    ChoiceGroup,
+    create_graph_for_cvariant,
+)
+
+
+def create_variant():
+    return SequenceGroup(
+        [
+            LeafGroup(["a"]),
+            ParallelGroup([LeafGroup(["c"]), LeafGroup(["b"])]),
+            LeafGroup(["d"]),
+        ]
+    )
+
+
+class TestGroupFingerprints(unittest.TestCase):
+    def test_fingerprint_ignores_order_of_unordered_groups(self):
+        v1 = create_variant()
+        v2 = SequenceGroup(
+            [
+                LeafGroup(["a"]),
+                ParallelGroup([LeafGroup(["b"]), LeafGroup(["c"])]),
+                LeafGroup(["d"]),
+            ]
+        )
+
+        self.assertEqual(len(v1.fingerprint()), 16)
+        self.assertEqual(v1.fingerprint(), v2.fingerprint())
+        self.assertEqual(v1, v2)
+        self.assertEqual(hash(v1), hash(v2))
+
+    def test_group_type_and_infix_type_are_part_of_the_identity(self):
+        sequence = SequenceGroup([LeafGroup(["a"]), LeafGroup(["b"])])
+        parallel = ParallelGroup([LeafGroup(["a"]), LeafGroup(["b"])])
+        prefix = SequenceGroup(
+            [LeafGroup(["a"]), LeafGroup(["b"])], infix_type=InfixType.PREFIX
+        )
+
+        self.assertNotEqual(sequence, parallel)
+        self.assertNotEqual(sequence, prefix)
+        self.assertNotEqual(
+            sequence, SequenceGroup([LeafGroup(["b"]), LeafGroup(["a"])])
+        )
+        self.assertEqual(
+            ChoiceGroup([LeafGroup(["a"])]),
+            ChoiceGroup([LeafGroup(["a"])], infix_type=InfixType.PREFIX),
+        )
+
+    def test_frozen_groups_cannot_be_modified(self):
+        variant = create_variant().freeze()
+
+        self.assertTrue(variant.frozen)
+        self.assertTrue(variant[1].frozen)
+        self.assertRaises(TypeError, lambda: variant.append(LeafGroup(["e"])))
+        self.assertRaises(TypeError, lambda: variant[1].pop())
+        with self.assertRaises(TypeError):
+            variant[0][0] = "e"
+        with self.assertRaises(TypeError):
+            variant[1].infix_type = InfixType.PREFIX
+
+        variant.id = 3
+        variant.graphs = {}
+
+    def test_pickled_groups_stay_frozen(self):
+        variant = create_variant().freeze()
+        restored = pickle.loads(pickle.dumps(variant))
+
+        self.assertTrue(restored.frozen)
+        self.assertEqual(restored.fingerprint(), variant.fingerprint())
+        self.assertEqual(restored, variant)
+        self.assertEqual(hash(restored), hash(create_variant()))
+
+    def test_copies_are_not_frozen(self):
+        variant = create_variant().freeze()
+        copied = deepcopy(variant)
+
+        self.assertFalse(copied.frozen)
+        self.assertFalse(copied[1].frozen)
+        self.assertEqual(copied, variant)
+        self.assertEqual(hash(copied), hash(variant))
+
+        copied[0][0] = "e"
+        self.assertNotEqual(copied, variant)
+
+    def test_concurrency_group_fingerprint(self):
+        graph = create_graph_for_cvariant(create_variant())
+        restored = pickle.loads(pickle.dumps(graph))
+
+        self.assertEqual(graph, restored)
+        self.assertEqual(hash(graph), hash(restored))
+        self.assertEqual(graph.fingerprint(), restored.fingerprint())
+
+        fingerprint = graph.fingerprint()
+        graph.events = {"x": {0}}
+        self.assertNotEqual(graph.fingerprint(), fingerprint)
+        self.assertNotEqual(graph, restored)
+
+    def test_concurrency_group_not_equal_to_other_objects(self):
+        self.assertNotEqual(ConcurrencyGroup(), create_variant())
+        self.assertNotEqual(create_variant(), ConcurrencyGroup())
+
+
+if __name__ == "__main__":
+    unittest.main()
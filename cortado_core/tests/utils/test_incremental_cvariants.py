@@ -0,0 +1,85 @@
+import unittest
+
+from pm4py.objects.log.obj import EventLog
+from pm4py.util.xes_constants import DEFAULT_TRACEID_KEY
+
+from cortado_core.tests.utils.test_encoded_cvariants import create_random_log
+from cortado_core.utils.cvariants import get_concurrency_variants
+from cortado_core.utils.incremental_cvariants import (
+    IncrementalConcurrencyVariants,
+    update_concurrency_variants,
+)
+
+
+class TestIncrementalConcurrencyVariants(unittest.TestCase):
+    def setUp(self):
+        self.log = create_random_log(13, 240)
+
+    def assert_same_variants(self, expected, variants, compare_graphs=True):
+        self.assertEqual(set(expected.keys()), set(variants.keys()))
+        variants_by_key = {variant: variant for variant in variants}
+        for variant, traces in expected.items():
+            # the traces of a variant are grouped by graph in get_concurrency_variants
+            self.assertEqual(
+                sorted(t.attributes[DEFAULT_TRACEID_KEY] for t in traces),
+                sorted(t.attributes[DEFAULT_TRACEID_KEY] for t in variants[variant]),
+            )
+            updated_variant = variants_by_key[variant]
+            self.assertEqual(len(traces), sum(updated_variant.graphs.values()))
+            if compare_graphs:
+                self.assertEqual(variant.graphs, updated_variant.graphs)
+
+    def test_appended_traces_equal_recomputation(self):
+        expected = get_concurrency_variants(self.log)
+
+        incremental_variants = IncrementalConcurrencyVariants()
+        for i in range(0, len(self.log), 50):
+            incremental_variants.add_traces(self.log[i : i + 50])
+
+        self.assert_same_variants(expected, incremental_variants.variants)
+
+    def test_update_existing_variants(self):
+        expected = get_concurrency_variants(self.log)
+
+        variants = get_concurrency_variants(EventLog(self.log[:100]))
+        unaffected = {id(v) for v in variants}
+        variants = update_concurrency_variants(variants, self.log[100:])
+
+        self.assert_same_variants(expected, variants)
+        self.assertTrue(unaffected.issubset({id(v) for v in variants}))
+
+    def test_removed_cases(self):
+        removed_case_ids = {str(i) for i in range(0, len(self.log), 3)}
+        remaining_log = EventLog(
+            [
+                trace
+                for trace in self.log
+                if trace.attributes[DEFAULT_TRACEID_KEY] not in removed_case_ids
+            ]
+        )
+        expected = get_concurrency_variants(remaining_log)
+
+        variants = update_concurrency_variants(
+            get_concurrency_variants(self.log), removed_case_ids=removed_case_ids
+        )
+
+        # the interned activity names of the full log remain, i.e., the ids in the graphs differ
+        self.assert_same_variants(expected, variants, compare_graphs=False)
+
+    def test_remove_and_add_cases(self):
+        incremental_variants = IncrementalConcurrencyVariants(
+            get_concurrency_variants(self.log)
+        )
+        incremental_variants.remove_cases(
+            [trace.attributes[DEFAULT_TRACEID_KEY] for trace in self.log[:120]]
+        )
+        incremental_variants.add_traces(self.log[:120])
+
+        expected = get_concurrency_variants(self.log)
+        self.assertEqual(set(expected.keys()), set(incremental_variants.variants))
+        for variant, traces in expected.items():
+            self.assertEqual(len(traces), len(incremental_variants.variants[variant]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+from multiprocessing import Pool
+
+from pm4py.algo.conformance.alignments.petri_net.algorithm import (
+    apply as calculate_alignment,
+)
+from pm4py.objects.log.obj import EventLog
+from pm4py.objects.process_tree.utils.generic import parse as pt_parse
+
+from cortado_core.process_tree_utils.to_petri_net_transition_bordered import (
+    apply as pt_to_petri_net,
+)
+from cortado_core.tests.utils.test_alignment_service import create_trace
+from cortado_core.utils.parallel_alignments import (
+    AlignmentPool,
+    calculate_alignments_parallel,
+)
+
+
+class TestParallelAlignments(unittest.TestCase):
+    def setUp(self):
+        self.tree = tree = pt_parse("->('A', *(X('B', 'C'), 'F'), +('D', 'E'))")
+        self.net, self.im, self.fm = pt_to_petri_net(tree)
+        self.log = EventLog(
+            [
+                create_trace(a)
+                for a in ["ABDE", "AXDE", "ABFCED", "ABDE", "", "ACFCFBDE", "AXDE"]
+            ]
+        )
+        self.expected_costs = [
+            calculate_alignment(trace, self.net, self.im, self.fm)["cost"]
+            for trace in self.log
+        ]
+
+    def test_alignment_pool_keeps_order_of_log(self):
+        with AlignmentPool(self.net, self.im, self.fm, n_processes=2) as pool:
+            alignments = pool.calculate_alignments(self.log, chunk_size=2)
+
+        self.assertEqual(self.expected_costs, [a["cost"] for a in alignments])
+        self.assertEqual(
+            5, sum(statistics.traces for statistics in pool.statistics.values())
+        )
+        self.assertEqual(
+            3, sum(statistics.chunks for statistics in pool.statistics.values())
+        )
+
+    def test_alignment_pool_yields_every_trace_once(self):
+        with AlignmentPool(self.net, self.im, self.fm, n_processes=2) as pool:
+            indices = sorted(i for i, _ in pool.imap_alignments(self.log))
+
+        self.assertEqual(list(range(len(self.log))), indices)
+
+    def test_exceeded_time_budget_results_in_no_alignment(self):
+        with AlignmentPool(self.net, self.im, self.fm, n_processes=1) as pool:
+            alignments = pool.calculate_alignments(self.log, timeout=0)
+
+        self.assertEqual([None] * len(self.log), alignments)
+
+    def test_chunked_alignments_in_shared_pool(self):
+        with Pool(2) as pool:
+            alignments = calculate_alignments_parallel(
+                self.log, self.net, self.im, self.fm, parameters={}, pool=pool
+            )
+
+        self.assertEqual(self.expected_costs, [a["cost"] for a in alignments])
+
+    def test_transitions_of_tree_nodes_keep_their_identity(self):
+        nodes = {id(node) for node in self.__nodes(self.tree)}
+        parameters = {"ret_tuple_as_trans_desc": True}
+
+        with AlignmentPool(self.net, self.im, self.fm, parameters, 2) as pool:
+            pool_alignments = pool.calculate_alignments(self.log)
+        with Pool(2) as pool:
+            shared_pool_alignments = calculate_alignments_parallel(
+                self.log, self.net, self.im, self.fm, parameters, pool
+            )
+
+        for alignment in pool_alignments + shared_pool_alignments:
+            for move in alignment["alignment"]:
+                if move[0][1] != ">>":
+                    self.assertIn(id(move[0][1][0]), nodes)
+
+    def test_structurally_equal_tree_nodes_are_not_confused(self):
+        # the optimal alignments are unique, although leaves have the same labels
+        tree = pt_parse("->(X('A', tau), 'B', X('A', tau))")
+        net, im, fm = pt_to_petri_net(tree)
+        log = EventLog([create_trace(a) for a in ["BA", "AB", "B", "ABA"]])
+        parameters = {"ret_tuple_as_trans_desc": True}
+        expected = [
+            calculate_alignment(trace, net, im, fm, parameters=parameters)
+            for trace in log
+        ]
+
+        with AlignmentPool(net, im, fm, parameters, 1) as pool:
+            pool_alignments = pool.calculate_alignments(log)
+        with Pool(1) as pool:
+            shared_pool_alignments = calculate_alignments_parallel(
+                log, net, im, fm, parameters, pool
+            )
+
+        for alignments in [pool_alignments, shared_pool_alignments]:
+            for alignment, expected_alignment in zip(alignments, expected):
+                self.assertEqual(
+                    self.__model_moves(expected_alignment),
+                    self.__model_moves(alignment),
+                )
+
+    @staticmethod
+    def __model_moves(alignment):
+        return [
+            (id(move[0][1][0]), move[0][1][1])
+            for move in alignment["alignment"]
+            if move[0][1] != ">>"
+        ]
+
+    @staticmethod
+    def __nodes(tree):
+        yield tree
+        for child in tree.children:
+            yield from TestParallelAlignments.__nodes(child)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import tempfile
+import unittest
+from multiprocessing import Pool
+
+import numpy as np
+
+from cortado_core.tests.utils.test_encoded_cvariants import create_random_log
+from cortado_core.utils.encoded_cvariants import (
+    encode_event_log,
+    get_concurrency_variants_encoded,
+)
+from cortado_core.utils.encoded_log import load_encoded_log, save_encoded_log
+from cortado_core.utils.parallel_utils import (
+    merge_index_maps,
+    tree_reduce,
+    workload_bounds,
+)
+
+
+def concatenate(left, right):
+    return left + right
+
+
+class TestParallelUtils(unittest.TestCase):
+    def test_workload_bounds_cover_all_items(self):
+        for sizes in [[1] * 3, [5, 1, 1, 100, 2, 3, 7], list(range(1000))]:
+            bounds = workload_bounds(sizes, n_workers=2, min_size_per_chunk=10)
+
+            self.assertEqual(bounds[0][0], 0)
+            self.assertEqual(bounds[-1][1], len(sizes))
+            for (_, upper), (lower, _) in zip(bounds, bounds[1:]):
+                self.assertEqual(upper, lower)
+            self.assertTrue(all(lower < upper for lower, upper in bounds))
+
+        self.assertEqual(workload_bounds([]), [])
+
+    def test_workload_bounds_balance_sizes(self):
+        sizes = [1] * 900 + [100] * 9
+        bounds = workload_bounds(sizes, n_workers=1, min_size_per_chunk=1)
+        chunk_sizes = [sum(sizes[lower:upper]) for lower, upper in bounds]
+
+        self.assertEqual(len(bounds), 4)
+        self.assertLessEqual(max(chunk_sizes) - min(chunk_sizes), 100)
+
+    def test_tree_reduce_preserves_order(self):
+        partial_results = [[i] for i in range(11)]
+
+        self.assertEqual(tree_reduce(partial_results, concatenate), list(range(11)))
+        self.assertIsNone(tree_reduce([], concatenate))
+
+        merged = tree_reduce([{"a": [0], "b": [1]}, {"a": [2]}], merge_index_maps)
+        self.assertEqual(merged, {"a": [0, 2], "b": [1]})
+
+    def test_encoded_log_round_trip(self):
+        encoded_log = encode_event_log(create_random_log(3, 50))
+
+        with tempfile.TemporaryDirectory() as directory:
+            save_encoded_log(encoded_log, directory)
+            loaded = load_encoded_log(directory)
+
+            self.assertEqual(loaded.activities, encoded_log.activities)
+            self.assertEqual(loaded.n_cases, encoded_log.n_cases)
+            np.testing.assert_array_equal(loaded.activity_ids, encoded_log.activity_ids)
+            np.testing.assert_array_equal(
+                loaded.start_timestamps, encoded_log.start_timestamps
+            )
+
+            sliced = loaded.slice_cases(10, 20)
+            self.assertEqual(sliced.n_cases, 10)
+            self.assertEqual(sliced.case_offsets[0], 0)
+            np.testing.assert_array_equal(
+                sliced.activity_ids,
+                encoded_log.activity_ids[
+                    encoded_log.case_offsets[10] : encoded_log.case_offsets[20]
+                ],
+            )
+            del loaded, sliced
+
+    def test_parallel_encoded_variants(self):
+        log = create_random_log(5, 300)
+        expected = get_concurrency_variants_encoded(log)
+
+        with Pool(2) as pool:
+            variants = get_concurrency_variants_encoded(log, use_mp=True, pool=pool)
+
+        self.assertEqual(list(expected.keys()), list(variants.keys()))
+        for variant, traces in expected.items():
+            self.assertEqual(traces, variants[variant])
+
+
+if __name__ == "__main__":
+    unittest.main()
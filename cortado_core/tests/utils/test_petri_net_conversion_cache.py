@@ -0,0 +1,93 @@
+import unittest
+
+from pm4py.objects.process_tree.obj import ProcessTree
+from pm4py.objects.process_tree.utils.generic import parse as pt_parse
+
+from cortado_core.process_tree_utils.to_petri_net_transition_bordered import (
+    PetriNetConversionCache,
+    structural_fingerprint,
+)
+
+
+class TestPetriNetConversionCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = PetriNetConversionCache()
+        self.tree = pt_parse("->('A', X('B', 'C'), +('D', 'E'))")
+
+    def test_unchanged_tree_is_converted_once(self):
+        net, im, fm = self.cache.apply(self.tree)
+
+        self.assertIs(net, self.cache.apply(self.tree)[0])
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+        self.assertEqual(0.5, self.cache.hit_rate)
+        self.assertEqual(1, len(im))
+        self.assertEqual(1, len(fm))
+
+    def test_structurally_equal_trees_are_not_shared(self):
+        # transitions are named by the nodes of the converted tree
+        other_tree = pt_parse("->('A', X('B', 'C'), +('D', 'E'))")
+
+        net = self.cache.apply(self.tree)[0]
+        other_net = self.cache.apply(other_tree)[0]
+
+        self.assertIsNot(net, other_net)
+        for transition in other_net.transitions:
+            self.assertIs(other_tree, self.__root(transition.name[0]))
+
+    def test_mutated_tree_is_converted_again(self):
+        net = self.cache.apply(self.tree)[0]
+
+        leaf = ProcessTree(label="F", parent=self.tree.children[1])
+        self.tree.children[1].children.append(leaf)
+        mutated_net = self.cache.apply(self.tree)[0]
+
+        self.assertIsNot(net, mutated_net)
+        self.assertIn("F", {t.label for t in mutated_net.transitions})
+        self.assertEqual(0, self.cache.hits)
+
+    def test_relabeled_leaf_changes_fingerprint(self):
+        fingerprint = structural_fingerprint(self.tree)
+
+        self.tree.children[0].label = "Z"
+
+        self.assertNotEqual(fingerprint, structural_fingerprint(self.tree))
+
+    def test_detached_subtree_is_converted_with_markings(self):
+        subtree = self.tree.children[2]
+        net, im, fm = self.cache.apply(subtree)
+        self.assertEqual(0, len(im))
+
+        subtree.parent = None
+        net, im, fm = self.cache.apply(subtree)
+
+        self.assertEqual(1, len(im))
+        self.assertEqual(2, self.cache.misses)
+
+    def test_least_recently_used_tree_is_evicted(self):
+        cache = PetriNetConversionCache(max_size=1)
+        other_tree = pt_parse("->('A', 'B')")
+
+        cache.apply(self.tree)
+        cache.apply(other_tree)
+        cache.apply(self.tree)
+
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(3, cache.misses)
+
+    def test_invalidate(self):
+        self.cache.apply(self.tree)
+        self.cache.invalidate(self.tree)
+        self.cache.apply(self.tree)
+
+        self.assertEqual(2, self.cache.misses)
+
+    @staticmethod
+    def __root(node):
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+
+if __name__ == "__main__":
+    unittest.main()
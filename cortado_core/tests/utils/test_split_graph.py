@@ -0,0 +1,93 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+
+from pm4py.objects.log.obj import Event, Trace
+from pm4py.util.xes_constants import (
+    DEFAULT_NAME_KEY,
+    DEFAULT_START_TIMESTAMP_KEY,
+    DEFAULT_TIMESTAMP_KEY,
+)
+
+from cortado_core.utils.cgroups_graph import ConcurrencyGroup, cgroups_graph
+from cortado_core.utils.split_graph import (
+    LeafGroup,
+    ParallelGroup,
+    SequenceGroup,
+    split_group,
+    split_group_networkx,
+)
+from cortado_core.utils.timestamp_utils import TimeUnit
+
+
+def create_random_graph(rng: random.Random, n_events: int) -> ConcurrencyGroup:
+    base = datetime(2022, 1, 1)
+    trace = Trace()
+    for i in range(n_events):
+        start = base + timedelta(minutes=rng.randint(0, 3 * n_events))
+        event = Event()
+        event[DEFAULT_NAME_KEY] = f"a{i}"
+        event[DEFAULT_START_TIMESTAMP_KEY] = start
+        event[DEFAULT_TIMESTAMP_KEY] = start + timedelta(minutes=rng.randint(0, 5))
+        trace.append(event)
+
+    return cgroups_graph(trace, TimeUnit.MIN)
+
+
+class TestSplitGroup(unittest.TestCase):
+    def test_equal_to_networkx_implementation(self):
+        rng = random.Random(42)
+        for n_events in [1, 2, 3, 5, 8, 13, 21, 50, 120]:
+            for _ in range(20):
+                graph = create_random_graph(rng, n_events)
+
+                expected = split_group_networkx(graph)
+                variant = split_group(graph)
+
+                self.assertEqual(expected, variant, str(graph))
+                self.assertTrue(variant.frozen)
+
+    def test_cuts(self):
+        graph = ConcurrencyGroup()
+        graph.events = {"a", "b", "c", "d"}
+        graph.follows = {("a", "b"), ("a", "c"), ("a", "d"), ("b", "d"), ("c", "d")}
+        graph.concurrency_pairs = {("b", "c")}
+
+        self.assertEqual(
+            split_group(graph),
+            SequenceGroup(
+                [
+                    LeafGroup(["a"]),
+                    ParallelGroup([LeafGroup(["b"]), LeafGroup(["c"])]),
+                    LeafGroup(["d"]),
+                ]
+            ),
+        )
+
+    def test_fallthrough_results_in_leaf(self):
+        # N-shaped relations: neither a sequence nor a parallel cut exists
+        graph = ConcurrencyGroup()
+        graph.events = {"a", "b", "c", "d"}
+        graph.follows = {("a", "b"), ("c", "d"), ("a", "d")}
+        graph.concurrency_pairs = {("a", "c"), ("b", "c"), ("b", "d")}
+
+        variant = split_group(graph)
+
+        self.assertEqual(variant, split_group_networkx(graph))
+        self.assertEqual(variant, LeafGroup(["a", "b", "c", "d"]))
+        self.assertEqual(list(variant), ["a", "b", "c", "d"])
+
+    def test_nodes_missing_in_events(self):
+        graph = ConcurrencyGroup()
+        graph.events = {"a", "b"}
+        graph.follows = {("a", "b"), ("a", "c")}
+        graph.concurrency_pairs = {("b", "c")}
+
+        self.assertEqual(split_group(graph), split_group_networkx(graph))
+
+    def test_empty_graph(self):
+        self.assertEqual(split_group(ConcurrencyGroup()), LeafGroup([]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+from pm4py.objects.log.exporter.xes import exporter as xes_exporter
+from pm4py.objects.log.obj import Trace
+from pm4py.util.xes_constants import (
+    DEFAULT_NAME_KEY,
+    DEFAULT_START_TIMESTAMP_KEY,
+    DEFAULT_TIMESTAMP_KEY,
+    DEFAULT_TRACEID_KEY,
+)
+
+from cortado_core.tests.utils.test_encoded_cvariants import create_random_log
+from cortado_core.utils.cvariants import get_concurrency_variants
+from cortado_core.utils.encoded_log import DEFAULT_CASE_ID_KEY
+from cortado_core.utils.streaming_cvariants import (
+    StreamingConcurrencyVariants,
+    get_concurrency_variants_streaming,
+    iterate_xes_traces,
+)
+
+
+class TestStreamingConcurrencyVariants(unittest.TestCase):
+    def setUp(self):
+        self.log = create_random_log(7, 200)
+        self.expected = get_concurrency_variants(self.log)
+
+    def assert_same_case_ids(self, variants, case_id=None):
+        if case_id is None:
+            case_id = lambda trace: trace.attributes[DEFAULT_TRACEID_KEY]
+
+        self.assertEqual(set(self.expected.keys()), set(variants.keys()))
+
+        variants_by_key = {variant: variant for variant in variants}
+        for variant, traces in self.expected.items():
+            self.assertEqual(
+                sorted(case_id(t) for t in traces), sorted(variants[variant])
+            )
+            self.assertEqual(
+                sum(variant.graphs.values()),
+                sum(variants_by_key[variant].graphs.values()),
+            )
+
+    def test_chunked_traces(self):
+        variants = get_concurrency_variants_streaming(iter(self.log), chunk_size=17)
+
+        self.assert_same_case_ids(variants)
+
+    def test_empty_traces_at_chunk_boundaries(self):
+        traces = list(self.log)
+        for position in [0, 3, 4, 8, 9]:
+            traces.insert(
+                position, Trace(attributes={DEFAULT_TRACEID_KEY: f"empty{position}"})
+            )
+
+        streaming_variants = StreamingConcurrencyVariants(chunk_size=2)
+        streaming_variants.add_traces(iter(traces))
+
+        self.assertEqual(len(traces), streaming_variants.n_traces)
+        self.assertEqual(len(self.log), streaming_variants.n_cases)
+        self.assert_same_case_ids(streaming_variants.get_variants())
+
+    def test_traces_without_case_id_are_identified_by_position(self):
+        # the case ids of the random log are the positions of the traces
+        variants = get_concurrency_variants_streaming(
+            (Trace(list(trace)) for trace in self.log), chunk_size=17
+        )
+
+        self.assert_same_case_ids(
+            variants, lambda trace: int(trace.attributes[DEFAULT_TRACEID_KEY])
+        )
+
+    def test_dataframe_chunks(self):
+        rows = [
+            {
+                DEFAULT_CASE_ID_KEY: trace.attributes[DEFAULT_TRACEID_KEY],
+                DEFAULT_NAME_KEY: event[DEFAULT_NAME_KEY],
+                DEFAULT_START_TIMESTAMP_KEY: event[DEFAULT_START_TIMESTAMP_KEY],
+                DEFAULT_TIMESTAMP_KEY: event[DEFAULT_TIMESTAMP_KEY],
+            }
+            for trace in self.log
+            for event in trace
+        ]
+        df = pd.DataFrame(rows)
+        case_ids = df[DEFAULT_CASE_ID_KEY].unique()
+        chunks = [
+            df[df[DEFAULT_CASE_ID_KEY].isin(case_ids[i : i + 30])]
+            for i in range(0, len(case_ids), 30)
+        ]
+
+        streaming_variants = StreamingConcurrencyVariants()
+        streaming_variants.add_dataframes(chunks)
+
+        self.assertEqual(streaming_variants.n_cases, len(self.log))
+        self.assert_same_case_ids(streaming_variants.get_variants())
+
+    def test_xes_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "log.xes")
+            xes_exporter.apply(self.log, path, parameters={"show_progress_bar": False})
+
+            variants = get_concurrency_variants_streaming(
+                iterate_xes_traces(path), chunk_size=50
+            )
+
+        self.assert_same_case_ids(variants)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,7 +9,10 @@ from cortado_core.lca_approach import set_preorder_ids_in_tree
 from cortado_core.models.infix_type import InfixType
 from cortado_core.tests.test_infix_alignments import generate_test_trace
 from cortado_core.utils.alignment_utils import get_first_deviation
+from cortado_core.utils.lca_utils import find_lowest_common_ancestor
 from cortado_core.utils.sublog_utils import (
+    SublogIndex,
+    add_alignment_to_activity_sequences,
     generate_infix_sublog,
     calculate_sublog_for_lca,
 )
@@ -191,3 +194,82 @@ class TestFragmentUtils(unittest.TestCase):
         for idx, event in enumerate(sublog[0]):
             if event["concept:name"] == "c":
                 self.assertEqual(sublog[0][idx + 1]["concept:name"], "a")
+
+    def test_sublog_index_only_projects_onto_rediscovered_subtree(self):
+        model = pt_parse("->('a', X('b', 'c'), *('d', tau), 'e')")
+        set_preorder_ids_in_tree(model)
+        log = [
+            TypedTrace(generate_test_trace(t), InfixType.NOT_AN_INFIX)
+            for t in ["abde", "acddde", "abde"]
+        ]
+        index = SublogIndex(log)
+
+        choice = model.children[1]
+        sublog = index.sublog(model, choice)
+        self.assertEqual([["b"], ["c"], ["b"]], self.__as_lists(sublog))
+
+        sublog.append(generate_test_trace("f"))
+        model = index.rediscover_subtree(choice, sublog)
+        set_preorder_ids_in_tree(model)
+        rediscovered_choice = model.children[1]
+
+        self.assertIsNot(choice, rediscovered_choice)
+        self.assertEqual(
+            [["d"], ["d", "d", "d"], ["d"]],
+            self.__as_lists(index.sublog(model, model.children[2])),
+        )
+        for node in [rediscovered_choice] + rediscovered_choice.children:
+            self.assertEqual(
+                self.__as_lists(SublogIndex(log).sublog(model, node)),
+                self.__as_lists(index.sublog(model, node)),
+            )
+        self.assertEqual(1, index.rebuilds)
+        self.assertEqual(1, index.updates)
+
+    def test_sublog_index_stays_valid_when_lca_is_pulled_down(self):
+        model = pt_parse("->('a', 'b', X('c', 'd'), 'e')")
+        log = [
+            TypedTrace(generate_test_trace(t), InfixType.NOT_AN_INFIX)
+            for t in ["abce", "abde"]
+        ]
+        index = SublogIndex(log)
+        index.sublog(model, model)
+
+        lca, modified = find_lowest_common_ancestor(
+            model.children[1], model.children[2].children[0], True
+        )
+
+        self.assertTrue(modified)
+        self.assertFalse(index.is_up_to_date(model))
+        index.restructure_subtree(lca)
+        self.assertTrue(index.is_up_to_date(model))
+        pulled_down_lca = model.children[1]
+        self.assertEqual(
+            [["b", "c"], ["b", "d"]],
+            self.__as_lists(index.sublog(model, pulled_down_lca)),
+        )
+        self.assertEqual(1, index.rebuilds)
+
+    def test_activity_sequences_of_structurally_equal_subtrees(self):
+        model = pt_parse("+(->('a', X('b', 'c')), ->('a', X('b', 'c')))")
+        net, im, fm = pt_to_petri_net(model)
+        alignment = calculate_alignments(
+            generate_test_trace("abac"),
+            net,
+            im,
+            fm,
+            parameters={"ret_tuple_as_trans_desc": True},
+        )
+
+        sequences = add_alignment_to_activity_sequences(alignment, {})
+
+        self.assertEqual([("a", "b", "a", "c")], sequences[id(model)][1])
+        self.assertEqual(
+            [[("a", "b")], [("a", "c")]],
+            sorted(sequences[id(child)][1] for child in model.children),
+        )
+        self.assertNotIn(id(model.children[0].children[0]), sequences)
+
+    @staticmethod
+    def __as_lists(log):
+        return [[e["concept:name"] for e in t] for t in log]
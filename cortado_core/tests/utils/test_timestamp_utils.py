@@ -0,0 +1,98 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from pm4py.objects.log.obj import Event, Trace
+from pm4py.util.xes_constants import DEFAULT_START_TIMESTAMP_KEY, DEFAULT_TIMESTAMP_KEY
+
+from cortado_core.utils.timestamp_utils import (
+    TimeUnit,
+    get_transformed_timestamps,
+    to_epoch_microseconds,
+    transform_log_timestamps,
+    transform_timestamp,
+)
+
+
+def create_trace(timestamps):
+    return Trace(
+        [
+            Event({DEFAULT_START_TIMESTAMP_KEY: start, DEFAULT_TIMESTAMP_KEY: complete})
+            for start, complete in timestamps
+        ]
+    )
+
+
+class TestTransformedTimestamps(unittest.TestCase):
+    def setUp(self):
+        cet = timezone(timedelta(hours=1))
+        self.timestamps = [
+            (datetime(2021, 3, 31, 23, 59, 59, 999999), datetime(2021, 4, 1, 0, 0, 1)),
+            (
+                datetime(2021, 1, 1, 0, 30, 12, 5, tzinfo=cet),
+                datetime(2021, 1, 1, 2, 0, tzinfo=cet),
+            ),
+            (datetime(1969, 12, 31, 23, 59, 30), datetime(1970, 1, 1, 0, 0, 30)),
+        ]
+
+    def test_equal_to_transform_timestamp(self):
+        trace = create_trace(self.timestamps)
+
+        for granularity in TimeUnit:
+            start_timestamps, complete_timestamps = get_transformed_timestamps(
+                trace, granularity
+            )
+            for (start, complete), transformed_start, transformed_complete in zip(
+                self.timestamps, start_timestamps, complete_timestamps
+            ):
+                self.assertEqual(
+                    to_epoch_microseconds(transform_timestamp(start, granularity)),
+                    transformed_start,
+                )
+                self.assertEqual(
+                    to_epoch_microseconds(transform_timestamp(complete, granularity)),
+                    transformed_complete,
+                )
+
+    def test_timestamps_of_whole_logs(self):
+        traces = [
+            create_trace(self.timestamps),
+            Trace(),
+            create_trace(self.timestamps[:1]),
+        ]
+        timestamps = transform_log_timestamps(traces, TimeUnit.MIN)
+
+        self.assertEqual([3, 0, 1], [len(start) for start, _ in timestamps])
+        for trace, (start_timestamps, complete_timestamps) in zip(traces, timestamps):
+            expected_start, expected_complete = get_transformed_timestamps(
+                trace, TimeUnit.MIN
+            )
+            self.assertEqual(expected_start.tolist(), start_timestamps.tolist())
+            self.assertEqual(expected_complete.tolist(), complete_timestamps.tolist())
+
+    def test_timestamps_are_not_cached_on_the_traces(self):
+        trace = create_trace(self.timestamps)
+        transform_log_timestamps([trace], TimeUnit.MIN)
+        self.assertEqual({}, dict(trace.properties))
+
+        # modified timestamps are reflected by the next transformation
+        trace[0][DEFAULT_START_TIMESTAMP_KEY] = datetime(2022, 1, 1)
+        start_timestamps, _ = get_transformed_timestamps(trace, TimeUnit.MIN)
+        self.assertEqual(
+            to_epoch_microseconds(datetime(2022, 1, 1)), start_timestamps[0]
+        )
+
+    def test_lists_of_events_and_empty_traces(self):
+        events = list(create_trace(self.timestamps))
+        start_timestamps, _ = get_transformed_timestamps(events, TimeUnit.HOUR)
+        self.assertEqual(len(start_timestamps), 3)
+
+        start_timestamps, complete_timestamps = get_transformed_timestamps(
+            Trace(), TimeUnit.HOUR
+        )
+        self.assertEqual(start_timestamps.dtype, np.int64)
+        self.assertEqual(len(complete_timestamps), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+
+from cortado_core.subprocess_discovery.subtree_mining.treebank import (
+    create_treebank_from_cv_variants,
+)
+from cortado_core.tests.utils.test_encoded_cvariants import create_random_log
+from cortado_core.utils.cvariants import get_concurrency_variants
+from cortado_core.utils.timestamp_utils import TimeUnit
+from cortado_core.utils.variant_cache import VariantCache
+
+
+class TestVariantCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = VariantCache(self.directory.name)
+        self.log = create_random_log(11, 150)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def assert_same_variants(self, expected, variants):
+        self.assertEqual(list(expected.keys()), list(variants.keys()))
+        variants_by_key = {variant: variant for variant in variants}
+        for variant, traces in expected.items():
+            self.assertEqual(traces, variants[variant])
+            self.assertEqual(variant.graphs, variants_by_key[variant].graphs)
+
+    def test_cached_variants_equal_computed_variants(self):
+        expected = get_concurrency_variants(self.log)
+
+        computed = self.cache.get_concurrency_variants(self.log)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+        cached = self.cache.get_concurrency_variants(self.log)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+        self.assert_same_variants(expected, computed)
+        self.assert_same_variants(expected, cached)
+
+    def test_key_includes_time_granularity_and_content(self):
+        self.cache.get_concurrency_variants(self.log)
+        variants = self.cache.get_concurrency_variants(
+            self.log, time_granularity=TimeUnit.DAY
+        )
+        self.assertEqual(self.cache.misses, 2)
+        self.assert_same_variants(
+            get_concurrency_variants(self.log, time_granularity=TimeUnit.DAY),
+            variants,
+        )
+
+        self.cache.get_concurrency_variants(create_random_log(11, 149))
+        self.assertEqual(self.cache.misses, 3)
+
+    def test_cached_treebank(self):
+        variants = get_concurrency_variants(self.log)
+        expected = create_treebank_from_cv_variants(variants, add_traces=True)
+
+        self.cache.create_treebank(self.log)
+        treebank = self.cache.create_treebank(self.log, add_traces=True)
+
+        self.assertEqual(len(expected), len(treebank))
+        for uid, entry in expected.items():
+            self.assertEqual(str(entry.tree), str(treebank[uid].tree))
+            self.assertEqual(entry.nTraces, treebank[uid].nTraces)
+            self.assertEqual(entry.traces, treebank[uid].traces)
+
+    def test_unreadable_files_are_recomputed(self):
+        expected = get_concurrency_variants(self.log)
+        self.cache.get_concurrency_variants(self.log)
+        (file_name,) = os.listdir(self.directory.name)
+        path = os.path.join(self.directory.name, file_name)
+
+        for content in [
+            b"",
+            # pickled reference to a class that does not exist (anymore)
+            b"\x80\x04\x95\x00\x00\x00\x00\x00\x00\x00\x00\x8c\x0ccortado_core\x94\x8c\x07Missing\x94\x93\x94.",
+        ]:
+            with open(path, "wb") as file:
+                file.write(content)
+
+            variants = self.cache.get_concurrency_variants(self.log)
+            self.assert_same_variants(expected, variants)
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 3))
+        self.assertEqual(
+            expected.keys(), self.cache.get_concurrency_variants(self.log).keys()
+        )
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_clear(self):
+        self.cache.get_concurrency_variants(self.log)
+        self.cache.create_treebank(self.log)
+        self.cache.clear()
+
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
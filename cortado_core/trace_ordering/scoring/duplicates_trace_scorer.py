@@ -9,7 +9,7 @@ from cortado_core.process_tree_utils.reduction import (
     reduce_loops_with_more_than_two_children,
 )
 from cortado_core.trace_ordering.scoring.trace_scorer import TraceScorer
-from cortado_core.utils.alignment_utils import calculate_alignment_typed_trace
+from cortado_core.utils.alignment_service import calculate_alignment_typed_trace_cached
 from cortado_core.utils.deviation_solvers import DeviationType
 from cortado_core.utils.lca_utils import find_lowest_common_ancestor
 from cortado_core.utils.trace import TypedTrace
@@ -31,7 +31,7 @@ class DuplicatesTraceScorer(TraceScorer):
         reduce_loops_with_more_than_two_children(process_tree)
 
         set_preorder_ids_in_tree(process_tree)
-        alignment = calculate_alignment_typed_trace(
+        alignment = calculate_alignment_typed_trace_cached(
             process_tree, TypedTrace(trace_candidate, InfixType.NOT_AN_INFIX)
         )
 
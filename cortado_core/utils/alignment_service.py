@@ -0,0 +1,149 @@
+from collections import OrderedDict
+from itertools import repeat
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from pm4py.objects.log.obj import Trace
+from pm4py.objects.process_tree.obj import ProcessTree
+from pm4py.util.typing import AlignmentResult
+from pm4py.util.xes_constants import DEFAULT_NAME_KEY
+
+from cortado_core.models.infix_type import InfixType
+from cortado_core.process_tree_utils.to_petri_net_transition_bordered import (
+    structural_fingerprint,
+)
+from cortado_core.utils.alignment_utils import calculate_alignment_typed_trace
+from cortado_core.utils.trace import TypedTrace
+
+
+def activity_sequence(
+    trace: Trace, activity_key: str = DEFAULT_NAME_KEY
+) -> Tuple[str, ...]:
+    return tuple(event[activity_key] for event in trace)
+
+
+def group_traces_by_activities(
+    traces: Iterable[Trace],
+    infix_types: Optional[Iterable[InfixType]] = None,
+    activity_key: str = DEFAULT_NAME_KEY,
+) -> Dict[Tuple[Tuple[str, ...], InfixType], List[int]]:
+    """
+    Groups the positions of the traces by their activity sequence and infix type. Alignments only depend on
+    both, i.e., it suffices to align one trace per group. The groups are ordered by their first trace.
+    """
+    if infix_types is None:
+        infix_types = repeat(InfixType.NOT_AN_INFIX)
+
+    groups: Dict[Tuple[Tuple[str, ...], InfixType], List[int]] = {}
+    for i, (trace, infix_type) in enumerate(zip(traces, infix_types)):
+        groups.setdefault(
+            (activity_sequence(trace, activity_key), infix_type), []
+        ).append(i)
+
+    return groups
+
+
+def fan_out_alignments(
+    alignments: List[AlignmentResult],
+    groups: Iterable[List[int]],
+    n_traces: int,
+) -> List[AlignmentResult]:
+    """
+    Assigns the alignment of every group to all traces of the group. Every trace gets its own copy of the
+    alignment, since callers modify alignments in place, e.g., model repair reorders their moves.
+    """
+    result: List[Optional[AlignmentResult]] = [None] * n_traces
+    for alignment, positions in zip(alignments, groups):
+        for position in positions:
+            result[position] = copy_alignment(alignment)
+
+    return result
+
+
+def copy_alignment(alignment: Optional[AlignmentResult]) -> Optional[AlignmentResult]:
+    if alignment is None:
+        return None
+
+    copied = dict(alignment)
+    if copied.get("alignment") is not None:
+        copied["alignment"] = list(copied["alignment"])
+
+    return copied
+
+
+class AlignmentCache:
+    """
+    Least recently used cache of alignments of process trees, keyed by the structural fingerprint of the
+    tree, the activity sequence and the infix type of the aligned trace. Since the fingerprint contains
+    the identity of the nodes, alignments are reused as long as the tree is not modified, e.g., across
+    the iterations of the lca approach and the freezing that do not change the tree, and are not reused
+    for trees that were repaired in place.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__entries: OrderedDict[Hashable, AlignmentResult] = OrderedDict()
+
+    def calculate_alignment(
+        self, pt: ProcessTree, trace: TypedTrace
+    ) -> AlignmentResult:
+        return self.calculate_alignments(pt, [trace])[0]
+
+    def calculate_alignments(
+        self, pt: ProcessTree, traces: List[TypedTrace]
+    ) -> List[AlignmentResult]:
+        """
+        Aligns every distinct (activity sequence, infix type) of the traces at most once
+        """
+        fingerprint = structural_fingerprint(pt)
+        groups = group_traces_by_activities(
+            [t.trace for t in traces], [t.infix_type for t in traces]
+        )
+
+        alignments = []
+        for key, positions in groups.items():
+            cache_key = (fingerprint, key)
+            alignment = self.__entries.get(cache_key)
+            if alignment is None:
+                self.misses += 1
+                alignment = calculate_alignment_typed_trace(pt, traces[positions[0]])
+                self.__entries[cache_key] = alignment
+                if len(self.__entries) > self.max_size:
+                    self.__entries.popitem(last=False)
+            else:
+                self.hits += 1
+                self.__entries.move_to_end(cache_key)
+            alignments.append(alignment)
+
+        return fan_out_alignments(alignments, groups.values(), len(traces))
+
+    def clear(self):
+        self.__entries.clear()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+
+alignment_cache = AlignmentCache()
+
+
+def calculate_alignments_typed_traces(
+    pt: ProcessTree, traces: List[TypedTrace]
+) -> List[AlignmentResult]:
+    """
+    Cached counterpart of calculate_alignment_typed_trace for many traces using the module-level
+    alignment_cache
+    """
+    return alignment_cache.calculate_alignments(pt, traces)
+
+
+def calculate_alignment_typed_trace_cached(
+    pt: ProcessTree, trace: TypedTrace
+) -> AlignmentResult:
+    return alignment_cache.calculate_alignment(pt, trace)
@@ -17,7 +17,7 @@ from cortado_core.alignments.infix_alignments import algorithm as infix_alignmen
 from cortado_core.alignments.prefix_alignments import algorithm as prefix_alignments
 from cortado_core.alignments.suffix_alignments import algorithm as suffix_alignments
 from cortado_core.process_tree_utils.to_petri_net_transition_bordered import (
-    apply as pt_to_petri_net_cortado,
+    apply_cached as pt_to_petri_net_cortado,
 )
 
 
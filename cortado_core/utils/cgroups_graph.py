@@ -1,17 +1,34 @@
+from hashlib import blake2b
 from typing import Mapping
 
 import networkx as nx
-from pm4py.util.xes_constants import (
-    DEFAULT_START_TIMESTAMP_KEY,
-    DEFAULT_TIMESTAMP_KEY,
-    DEFAULT_NAME_KEY,
-)
+from pm4py.util.xes_constants import DEFAULT_START_TIMESTAMP_KEY, DEFAULT_NAME_KEY
 
-from cortado_core.utils.timestamp_utils import transform_timestamp
+from cortado_core.utils.timestamp_utils import get_transformed_timestamps
+
+FINGERPRINT_SIZE = 16
+
+RELATION_ATTRIBUTES = {
+    "events",
+    "concurrency_pairs",
+    "follows",
+    "directly_follows",
+    "start_activities",
+    "end_activities",
+}
 
 
 class ConcurrencyGroup:
+    """
+    The canonical key (see get), hash and fingerprint are computed once and recomputed only after one
+    of the relations is reassigned. Hence, relations must not be modified in place after the group
+    was hashed.
+    """
+
     def __init__(self):
+        self._key = None
+        self._hash = None
+        self._fingerprint = None
         self.events = set()
         self.concurrency_pairs = set()
         self.follows = set()
@@ -20,15 +37,50 @@ class ConcurrencyGroup:
         self.end_activities = set()
         self.id = None
 
+    def __setattr__(self, name, value):
+        if name in RELATION_ATTRIBUTES:
+            self.__dict__["_key"] = None
+            self.__dict__["_hash"] = None
+            self.__dict__["_fingerprint"] = None
+
+        super().__setattr__(name, value)
+
+    def __getstate__(self):
+        # python's hash of strings differs between processes, thus, it must not be transferred
+        state = self.__dict__.copy()
+        state["_hash"] = None
+        return state
+
     def get(self):
-        return (
-            frozenset(self.events),
-            frozenset([frozenset(e) for e in self.concurrency_pairs]),
-            frozenset(self.directly_follows),
-            frozenset(self.start_activities),
-            frozenset(self.end_activities),
-            frozenset(self.follows),
-        )
+        if self._key is None:
+            self._key = (
+                frozenset(self.events),
+                frozenset([frozenset(e) for e in self.concurrency_pairs]),
+                frozenset(self.directly_follows),
+                frozenset(self.start_activities),
+                frozenset(self.end_activities),
+                frozenset(self.follows),
+            )
+
+        return self._key
+
+    def fingerprint(self) -> bytes:
+        """
+        Canonical 128-bit digest of the relations, independent of set iteration orders and therefore
+        stable across processes
+        """
+        if self._fingerprint is None:
+            events, concurrency_pairs, *relations = self.get()
+            concurrency_pairs = [tuple(sorted(pair)) for pair in concurrency_pairs]
+            canonical_relations = [
+                sorted(map(repr, relation))
+                for relation in [events, concurrency_pairs, *relations]
+            ]
+            self._fingerprint = blake2b(
+                repr(canonical_relations).encode(), digest_size=FINGERPRINT_SIZE
+            ).digest()
+
+        return self._fingerprint
 
     def to_simple(self):
         return frozenset(self.events)
@@ -59,7 +111,7 @@ class ConcurrencyGroup:
                     tmp[names[e]].add(id_name_map[e])
 
                 else:
-                    tmp[names[e]] = set([(id_name_map[e])])
+                    tmp[names[e]] = set([id_name_map[e]])
 
             return tmp
 
@@ -90,10 +142,19 @@ class ConcurrencyGroup:
         self.follows = _restore_names_binary(self.follows, sort=False)
 
     def __eq__(self, o: object) -> bool:
-        return self.get().__hash__() == o.__hash__()
+        if self is o:
+            return True
+
+        if not isinstance(o, ConcurrencyGroup):
+            return NotImplemented
+
+        return hash(self) == hash(o) and self.get() == o.get()
 
     def __hash__(self) -> int:
-        return self.get().__hash__()
+        if self._hash is None:
+            self._hash = hash(self.get())
+
+        return self._hash
 
     def __str__(self):
         return f"{{ events: {self.events}, concurrent: {self.concurrency_pairs}, directly_follows: {self.directly_follows}, follows: {self.follows} }}"
@@ -102,8 +163,24 @@ class ConcurrencyGroup:
         return self.__str__()
 
 
-def cgroups_graph(trace, time_granularity):
-    trace = sorted(trace, key=lambda e: e[DEFAULT_START_TIMESTAMP_KEY])
+def cgroups_graph(trace, time_granularity, timestamps=None):
+    """
+    :param timestamps: transformed start and complete timestamps of the events (see transform_log_timestamps),
+    they are computed if not given
+    """
+    if timestamps is None:
+        timestamps = get_transformed_timestamps(trace, time_granularity)
+    start_timestamps, complete_timestamps = timestamps
+    # the events are ordered by their (not transformed) start timestamps
+    order = sorted(
+        range(len(trace)), key=lambda i: trace[i][DEFAULT_START_TIMESTAMP_KEY]
+    )
+    start_timestamps = start_timestamps.tolist()
+    complete_timestamps = complete_timestamps.tolist()
+    trace = [
+        (trace[i][DEFAULT_NAME_KEY], start_timestamps[i], complete_timestamps[i])
+        for i in order
+    ]
 
     parallel = set()
     follows = set()
@@ -116,27 +193,11 @@ def cgroups_graph(trace, time_granularity):
 
     is_start = True
 
-    for event in trace:
-        event[DEFAULT_START_TIMESTAMP_KEY] = transform_timestamp(
-            event[DEFAULT_START_TIMESTAMP_KEY], time_granularity
-        )
-
-        event[DEFAULT_TIMESTAMP_KEY] = transform_timestamp(
-            event[DEFAULT_TIMESTAMP_KEY], time_granularity
-        )
-
-    for i, event in enumerate(trace):
-        complete = event[DEFAULT_TIMESTAMP_KEY]
-
-        activity = event[DEFAULT_NAME_KEY]
+    for i, (activity, _, complete) in enumerate(trace):
         activities.add(activity)
         earliest_complete = None
 
-        for event2 in trace[i + 1 :]:
-            start2 = event2[DEFAULT_START_TIMESTAMP_KEY]
-            complete2 = event2[DEFAULT_TIMESTAMP_KEY]
-            activity2 = event2[DEFAULT_NAME_KEY]
-
+        for activity2, start2, complete2 in trace[i + 1 :]:
             if complete < start2:
                 follows.add((activity, activity2))
                 not_end_activitites.add(activity)
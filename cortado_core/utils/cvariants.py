@@ -4,18 +4,20 @@ from copy import copy
 from dataclasses import dataclass
 from typing import Mapping, Tuple, Dict, List, Any
 
+import numpy as np
 from pm4py.objects.log.obj import EventLog, Trace
 from pm4py.objects.log.util.interval_lifecycle import to_interval
 from pm4py.util.xes_constants import (
     DEFAULT_NAME_KEY,
-    DEFAULT_START_TIMESTAMP_KEY,
-    DEFAULT_TIMESTAMP_KEY,
     DEFAULT_TRANSITION_KEY,
 )
 
-from cortado_core.utils.timestamp_utils import TimeUnit, transform_timestamp
+from cortado_core.utils.timestamp_utils import (
+    TimeUnit,
+    transform_log_timestamps,
+)
 from .cgroups_graph import cgroups_graph, ConcurrencyGroup
-from .parallel_utils import workload_split, workload_split_graphs
+from .parallel_utils import workload_bounds, workload_split, workload_split_graphs
 from .split_graph import Group, LeafGroup, ParallelGroup, SequenceGroup, split_group
 
 ACTIVITY_INSTANCE_KEY = "cortado_activity_instance"
@@ -23,6 +25,8 @@ ACTIVITY_INSTANCE_KEY = "cortado_activity_instance"
 
 @dataclass
 class SubvariantNode:
+    __slots__ = ("activity", "lifecycle", "activity_instance", "performance_stats")
+
     activity: str
     lifecycle: str
     activity_instance: int
@@ -41,37 +45,48 @@ class SubvariantNode:
 
 def create_graphs(
     log_renamed: EventLog, interval_log: EventLog, use_mp: bool, time_granularity, pool
-):
+) -> Dict[ConcurrencyGroup, List[Trace]]:
     if not use_mp or pool is None:
-        return __create_graphs(log_renamed, interval_log, time_granularity)
-
-    graphs = {}
-    (
-        log_renamed_bounded,
-        interval_log_bounded,
-        time_granularity_bounded,
-    ) = workload_split(log_renamed, interval_log, time_granularity)
-    res = pool.starmap(
-        __create_graphs,
-        zip(log_renamed_bounded, interval_log_bounded, time_granularity_bounded),
-    )
-    while len(res) > 0:  # "Merge" the results of all workers
-        partial_result = res.pop()
-        for variant in partial_result:
-            graphs[variant] = graphs.get(variant, []) + partial_result[variant]
+        graphs = __create_graphs(log_renamed, time_granularity)
+    else:
+        log_renamed_bounded, _, time_granularity_bounded = workload_split(
+            log_renamed, interval_log, time_granularity
+        )
+        offsets = [0]
+        for log_bounded in log_renamed_bounded[:-1]:
+            offsets.append(offsets[-1] + len(log_bounded))
+
+        res = pool.starmap(
+            __create_graphs,
+            zip(log_renamed_bounded, time_granularity_bounded, offsets),
+        )
+        graphs = {}
+        for partial_result in res:  # "Merge" the results of all workers in log order
+            for variant, indices in partial_result.items():
+                graphs.setdefault(variant, []).extend(indices)
 
-    return graphs
+    return {
+        variant: [interval_log[i] for i in indices]
+        for variant, indices in graphs.items()
+    }
 
 
 def __create_graphs(
-    log_renamed: EventLog, interval_log: EventLog, time_granularity: TimeUnit
-) -> Mapping[ConcurrencyGroup, List[Trace]]:
-    own_results: Dict[ConcurrencyGroup, List[Trace]] = dict()
-    for trace, original_trace in zip(log_renamed, interval_log):
+    log_renamed: EventLog, time_granularity: TimeUnit, offset: int = 0
+) -> Dict[ConcurrencyGroup, List[int]]:
+    """
+    Returns the graphs together with the indices of their traces, i.e., the workers never send traces
+    """
+    timestamps = transform_log_timestamps(log_renamed, time_granularity)
+
+    own_results: Dict[ConcurrencyGroup, List[int]] = dict()
+    for i, (trace, trace_timestamps) in enumerate(
+        zip(log_renamed, timestamps), start=offset
+    ):
         variant: ConcurrencyGroup = cgroups_graph(
-            trace, time_granularity=time_granularity
+            trace, time_granularity=time_granularity, timestamps=trace_timestamps
         )
-        own_results[variant] = own_results.get(variant, []) + [original_trace]
+        own_results.setdefault(variant, []).append(i)
 
     return own_results
 
@@ -86,7 +101,11 @@ def create_variants(
     if not use_mp or pool is None:
         return __create_variants(list(graphs.items()), names, id_name_map)
 
-    workload_graphs = workload_split_graphs(graphs)
+    # the workers receive the positions of the graphs instead of their traces
+    graphs = list(graphs.items())
+    workload_graphs = workload_split_graphs(
+        {graph: i for i, (graph, _) in enumerate(graphs)}
+    )
     workload_names = [names for _ in range(len(workload_graphs))]
     workload_id_name_map = [id_name_map for _ in range(len(workload_graphs))]
 
@@ -94,19 +113,16 @@ def create_variants(
     res = pool.starmap(
         __create_variants, zip(workload_graphs, workload_names, workload_id_name_map)
     )
-    while len(res) > 0:  # "Merge" the results of all workers
-        partial_result = res.pop()
-        for v in partial_result:
-            if not v.checkGroupType():
-                raise Exception("Variant contains ChoiceGroup")
-            variants[v] = graphs.get(v, []) + partial_result[v]
+    for partial_result in res:  # "Merge" the results of all workers
+        for v, restored_graphs in partial_result.items():
+            variants.setdefault(v, []).extend(
+                (graph, graphs[i][1]) for graph, i in restored_graphs
+            )
 
     return variants
 
 
-def __create_variants(
-    graphs: List[Tuple[ConcurrencyGroup, List[Trace]]], names, id_name_map
-):
+def __create_variants(graphs: List[Tuple[ConcurrencyGroup, Any]], names, id_name_map):
     variants = dict()
     for variant, traces in graphs:
         v = split_group(variant)
@@ -114,17 +130,15 @@ def __create_variants(
             raise Exception("Variant contains ChoiceGroup")
         # Restore name and add a Reference to the Group
         variant.restore_names(names, id_name_map)
-        variants[v] = variants.get(v, []) + [(variant, traces)]
+        variants.setdefault(v, []).append((variant, traces))
 
     return variants
 
 
-def get_concurrency_variants(
-    log: EventLog,
-    use_mp: bool = False,
-    time_granularity: TimeUnit = min(TimeUnit),
-    pool=None,
-):
+def to_filtered_interval_log(log: EventLog) -> EventLog:
+    """
+    Merges start and complete lifecycle events into interval events and removes empty traces
+    """
     if log.attributes.get("PM4PY_TYPE", "") != "interval":
         if DEFAULT_TRANSITION_KEY in log[0][0]:
             traces = [
@@ -150,7 +164,7 @@ def get_concurrency_variants(
             )
 
     interval_log = to_interval(log)
-    interval_log_filtered = EventLog(
+    return EventLog(
         [trace for trace in interval_log if len(trace) > 0],
         attributes=copy(log.attributes),
         extensions=log.extensions,
@@ -158,18 +172,34 @@ def get_concurrency_variants(
         omni_present=log.omni_present,
         properties=log.properties,
     )
+
+
+def get_concurrency_variants(
+    log: EventLog,
+    use_mp: bool = False,
+    time_granularity: TimeUnit = min(TimeUnit),
+    pool=None,
+):
+    interval_log_filtered = to_filtered_interval_log(log)
     log_renamed, names = unique_activities(interval_log_filtered)
     graphs = create_graphs(
         log_renamed, interval_log_filtered, use_mp, time_granularity, pool
     )
 
+    return variants_from_graphs(graphs, names, use_mp, pool)
+
+
+def variants_from_graphs(
+    graphs: Mapping[ConcurrencyGroup, List[Trace]], names, use_mp: bool, pool
+) -> Dict[Group, List[Trace]]:
     id_name_map = {name: id for id, name in enumerate(names.keys())}
     variants = create_variants(graphs, names, id_name_map, use_mp, pool)
 
     res_variants = {}
     for v, ls in variants.items():
+        traces = res_variants.setdefault(v, [])
         for g, ts in ls:
-            res_variants[v] = res_variants.get(v, []) + ts
+            traces.extend(ts)
             v.graphs[g] = v.graphs.get(g, 0) + len(ts)
 
     res_variants = restore_names(res_variants, names)
@@ -178,34 +208,189 @@ def get_concurrency_variants(
 
 
 def get_detailed_variants(traces, time_granularity: TimeUnit = min(TimeUnit)):
-    variants = {}
-    traces = to_interval(EventLog(traces))
-    for trace in traces:
-        act_counter = defaultdict(int)
-        v = defaultdict(list)
-        trace = __sort_trace_on_timestamps(trace, time_granularity)
-        for event in trace:
-            start = transform_timestamp(
-                event[DEFAULT_START_TIMESTAMP_KEY], time_granularity
+    traces = list(to_interval(EventLog(traces)))
+    compact_subvariants = __compact_subvariants(
+        [
+            __compact_trace(trace, timestamps)
+            for trace, timestamps in zip(
+                traces, transform_log_timestamps(traces, time_granularity)
+            )
+        ]
+    )
+
+    return __group_subvariants(traces, compact_subvariants)
+
+
+def get_detailed_variants_batch(
+    variants: Mapping[Group, List[Trace]],
+    time_granularity: TimeUnit = min(TimeUnit),
+    use_mp: bool = False,
+    pool=None,
+) -> Dict[Group, Dict[Tuple, List[Trace]]]:
+    """
+    Computes the sub-variants (see get_detailed_variants) of all variants at once. The timestamps of all
+    traces are transformed in one pass and, if a pool is given, the sub-variants are computed by the workers
+    on a compact representation of the traces (activities and integer timestamps).
+    """
+    interval_traces = {
+        variant: list(to_interval(EventLog(traces)))
+        for variant, traces in variants.items()
+    }
+    timestamps = iter(
+        transform_log_timestamps(
+            [trace for traces in interval_traces.values() for trace in traces],
+            time_granularity,
+        )
+    )
+    if use_mp and pool is not None:
+        compact_traces = [
+            [__compact_trace(trace, next(timestamps)) for trace in traces]
+            for traces in interval_traces.values()
+        ]
+        bounds = workload_bounds(
+            [sum(len(t[0]) for t in traces) for traces in compact_traces],
+            min_size_per_chunk=1000,
+        )
+        compact_subvariants = [
+            subvariants
+            for chunk in pool.starmap(
+                __compact_subvariants_of_variants,
+                [(compact_traces[lower:upper],) for lower, upper in bounds],
             )
-            complete = transform_timestamp(
-                event[DEFAULT_TIMESTAMP_KEY], time_granularity
+            for subvariants in chunk
+        ]
+    else:
+        # one variant at a time, i.e., the compact traces of all variants are never kept at once
+        compact_subvariants = (
+            __compact_subvariants(
+                [__compact_trace(trace, next(timestamps)) for trace in traces]
             )
-            activity = event[DEFAULT_NAME_KEY]
+            for traces in interval_traces.values()
+        )
+
+    return {
+        variant: __group_subvariants(traces, subvariants)
+        for (variant, traces), subvariants in zip(
+            interval_traces.items(), compact_subvariants
+        )
+    }
+
+
+class SubvariantCache:
+    """
+    Caches the sub-variants per variant. Cached sub-variants are recomputed if the traces of the variant
+    changed, e.g., after an incremental update of the variants.
+    """
+
+    def __init__(self, time_granularity: TimeUnit = min(TimeUnit)):
+        self.time_granularity = time_granularity
+        # the traces are kept with their sub-variants, i.e., they are compared by identity
+        self.__subvariants: Dict[
+            Group, Tuple[Tuple[Trace, ...], Dict[Tuple, List[Trace]]]
+        ] = {}
+
+    def get_detailed_variants(
+        self, variant: Group, traces: List[Trace]
+    ) -> Dict[Tuple, List[Trace]]:
+        return self.get_detailed_variants_batch({variant: traces})[variant]
+
+    def get_detailed_variants_batch(
+        self, variants: Mapping[Group, List[Trace]], use_mp: bool = False, pool=None
+    ) -> Dict[Group, Dict[Tuple, List[Trace]]]:
+        missing_variants = {
+            variant: traces
+            for variant, traces in variants.items()
+            if variant not in self.__subvariants
+            or not self.__same_traces(self.__subvariants[variant][0], traces)
+        }
+        if len(missing_variants) > 0:
+            for variant, subvariants in get_detailed_variants_batch(
+                missing_variants, self.time_granularity, use_mp, pool
+            ).items():
+                self.__subvariants[variant] = (tuple(variants[variant]), subvariants)
+
+        return {variant: self.__subvariants[variant][1] for variant in variants}
+
+    def invalidate(self, variant: Group = None):
+        if variant is None:
+            self.__subvariants.clear()
+        else:
+            self.__subvariants.pop(variant, None)
+
+    @staticmethod
+    def __same_traces(cached_traces: Tuple[Trace, ...], traces: List[Trace]) -> bool:
+        return len(cached_traces) == len(traces) and all(
+            cached is trace for cached, trace in zip(cached_traces, traces)
+        )
+
+
+def __compact_trace(
+    trace: Trace, timestamps: Tuple[np.ndarray, np.ndarray]
+) -> Tuple[List[str], List[int], List[int]]:
+    start_timestamps, complete_timestamps = timestamps
+    return (
+        [event[DEFAULT_NAME_KEY] for event in trace],
+        start_timestamps.tolist(),
+        complete_timestamps.tolist(),
+    )
+
+
+def __compact_subvariants_of_variants(
+    compact_traces: List[List[Tuple[List[str], List[int], List[int]]]],
+) -> List[List[Tuple[Tuple, List[int], List[int]]]]:
+    return [__compact_subvariants(traces) for traces in compact_traces]
+
+
+def __compact_subvariants(
+    compact_traces: List[Tuple[List[str], List[int], List[int]]],
+) -> List[Tuple[Tuple, List[int], List[int]]]:
+    """
+    Returns per trace its sub-variant as tuples of (activity, lifecycle, activity instance) nodes, the order
+    of its events sorted by timestamps and the activity instances of the sorted events
+    """
+    compact_subvariants = []
+    for activities, start_timestamps, complete_timestamps in compact_traces:
+        order = sorted(
+            range(len(activities)),
+            key=lambda i: (start_timestamps[i], complete_timestamps[i], activities[i]),
+        )
+
+        act_counter = defaultdict(int)
+        activity_instances = []
+        v = defaultdict(list)
+        for i in order:
+            activity = activities[i]
             activity_instance = act_counter[activity]
-            event[ACTIVITY_INSTANCE_KEY] = activity_instance
             act_counter[activity] += 1
+            activity_instances.append(activity_instance)
 
-            v[start] += [SubvariantNode(activity, "start", activity_instance, None)]
-            v[complete] += [
-                SubvariantNode(activity, "complete", activity_instance, None)
-            ]
+            v[start_timestamps[i]].append((activity, "start", activity_instance))
+            v[complete_timestamps[i]].append((activity, "complete", activity_instance))
 
-        v = sorted(v.items(), key=lambda x: x[0])
-        v = tuple(tuple(vv[1]) for vv in v)
-        variants[v] = variants.get(v, []) + [trace]
+        v = tuple(tuple(nodes) for _, nodes in sorted(v.items(), key=lambda x: x[0]))
+        compact_subvariants.append((v, order, activity_instances))
 
-    return variants
+    return compact_subvariants
+
+
+def __group_subvariants(
+    traces: List[Trace], compact_subvariants: List[Tuple[Tuple, List[int], List[int]]]
+) -> Dict[Tuple, List[Trace]]:
+    traces_per_subvariant: Dict[Tuple, List[Trace]] = {}
+    for trace, (v, order, activity_instances) in zip(traces, compact_subvariants):
+        trace = Trace([trace[i] for i in order], attributes=trace.attributes)
+        for event, activity_instance in zip(trace, activity_instances):
+            event[ACTIVITY_INSTANCE_KEY] = activity_instance
+
+        traces_per_subvariant.setdefault(v, []).append(trace)
+
+    # the nodes are created once per sub-variant instead of once per event
+    return {
+        tuple(
+            tuple(SubvariantNode(*node, None) for node in nodes) for nodes in v
+        ): subvariant_traces
+        for v, subvariant_traces in traces_per_subvariant.items()
+    }
 
 
 def unique_activities(log):
@@ -237,10 +422,20 @@ def restore_name(event, names):
 
 def restore_names(variants, names) -> Dict[Group, List[Trace]]:
     variants_new = {}
+    restored_variants = {}
     for v in variants:
-        v_new = restore_names_rek(v, names)
-        variants_new[v_new] = variants_new.get(v_new, []) + variants[v]
-        v_new.graphs = v.graphs
+        v_new = restore_names_rek(v, names).freeze()
+        if v_new not in restored_variants:
+            restored_variants[v_new] = v_new
+            v_new.graphs = dict(v.graphs)
+            variants_new[v_new] = []
+        else:
+            # different renamed variants can result in the same variant
+            v_new = restored_variants[v_new]
+            for g, count in v.graphs.items():
+                v_new.graphs[g] = v_new.graphs.get(g, 0) + count
+
+        variants_new[v_new].extend(variants[v])
     return variants_new
 
 
@@ -257,20 +452,3 @@ def restore_names_rek(variant, names):
         return g
 
     return variant
-
-
-def __sort_trace_on_timestamps(trace, time_granularity):
-    events = sorted(trace._list, key=lambda x: __get_sort_tuple(x, time_granularity))
-    new_trace = Trace(events, attributes=trace.attributes)
-    return new_trace
-
-
-def __get_sort_tuple(event, time_granularity):
-    start_timestamp = transform_timestamp(
-        event[DEFAULT_START_TIMESTAMP_KEY], time_granularity
-    )
-    complete_timestamp = transform_timestamp(
-        event[DEFAULT_TIMESTAMP_KEY], time_granularity
-    )
-
-    return start_timestamp, complete_timestamp, event[DEFAULT_NAME_KEY]
@@ -19,6 +19,7 @@ from cortado_core.utils.lca_utils import (
     rediscover_subtree_and_modify_pt,
 )
 from cortado_core.utils.sublog_utils import (
+    SublogIndex,
     calculate_sublog_for_lca,
     generate_full_alignment_based_on_infix_alignment,
 )
@@ -169,17 +170,20 @@ class EnclosedDeviationSolverTrace(DeviationSolver):
     Solves deviations for full-traces, i.e. NOT infixes/postfixes/prefixes, by applying the LCA-algorithm.
     """
 
-    def __init__(self, try_pulldown: bool, pool: Optional[Pool]):
+    def __init__(
+        self,
+        try_pulldown: bool,
+        pool: Optional[Pool],
+        sublog_index: Optional[SublogIndex] = None,
+    ):
         self.try_pulldown = try_pulldown
         self.pool = pool
+        self.sublog_index = sublog_index
 
     def solve(self, deviation: Deviation, pt: ProcessTree, log):
-        lca, process_tree_modified = find_lowest_common_ancestor(
-            deviation.left_node[0], deviation.right_node[0], self.try_pulldown
+        lca, process_tree_modified = EnclosedDeviationSolverTrace.find_lca(
+            deviation, self.try_pulldown, self.sublog_index
         )
-        lca_is_leaf_node = len(lca.children) == 0
-        if lca_is_leaf_node:
-            lca = lca.parent
 
         assert lca
         assert is_subtree(pt, lca)
@@ -188,6 +192,60 @@ class EnclosedDeviationSolverTrace(DeviationSolver):
             # process tree was modified, recalculation of the alignment is needed
             return get_root(lca)
 
+        trace_to_add = EnclosedDeviationSolverTrace.get_trace_to_add_of_lca(
+            deviation, lca
+        )
+
+        sublog = calculate_sublog_for_lca(
+            pt,
+            log,
+            lca,
+            deviation.alignment,
+            deviation.deviation_index,
+            trace_to_add,
+            InfixType.NOT_AN_INFIX,
+            self.pool,
+            self.sublog_index,
+        )
+
+        if self.sublog_index is not None:
+            return self.sublog_index.rediscover_subtree(lca, sublog)
+
+        pt = rediscover_subtree_and_modify_pt(lca, sublog)
+        return pt
+
+    @staticmethod
+    def find_lca(
+        deviation: Deviation,
+        try_pulldown: bool,
+        sublog_index: Optional[SublogIndex] = None,
+    ) -> tuple[ProcessTree, bool]:
+        """
+        Returns the lca of the nodes enclosing the deviation, which is never a leaf node, and whether the process tree
+        was modified by pulling the lca down. Pulling down does not change the language of the lca, hence, the
+        projections of sublog_index stay valid and only the ones onto the lca are aligned again.
+        """
+        update_sublog_index = (
+            try_pulldown
+            and sublog_index is not None
+            and sublog_index.is_up_to_date(get_root(deviation.left_node[0]))
+        )
+        lca, process_tree_modified = find_lowest_common_ancestor(
+            deviation.left_node[0], deviation.right_node[0], try_pulldown
+        )
+        if process_tree_modified and update_sublog_index:
+            sublog_index.restructure_subtree(lca)
+        lca_is_leaf_node = len(lca.children) == 0
+        if lca_is_leaf_node:
+            lca = lca.parent
+
+        return lca, process_tree_modified
+
+    @staticmethod
+    def get_trace_to_add_of_lca(deviation: Deviation, lca: ProcessTree) -> Trace:
+        """
+        Returns the trace to add for the execution of the lca that contains the deviation
+        """
         alignment_step_index_lca_activated = (
             DeviationSolver.get_alignment_step_index_of_lca_activation(
                 deviation.deviation_index, deviation.alignment, lca
@@ -199,27 +257,13 @@ class EnclosedDeviationSolverTrace(DeviationSolver):
             )
         )
 
-        trace_to_add = DeviationSolver.get_trace_to_add(
+        return DeviationSolver.get_trace_to_add(
             deviation.alignment,
             lca,
             alignment_step_index_lca_activated + 1,
             alignment_step_index_lca_closed - 1,
         )
 
-        sublog = calculate_sublog_for_lca(
-            pt,
-            log,
-            lca,
-            deviation.alignment,
-            deviation.deviation_index,
-            trace_to_add,
-            InfixType.NOT_AN_INFIX,
-            self.pool,
-        )
-
-        pt = rediscover_subtree_and_modify_pt(lca, sublog)
-        return pt
-
 
 class FallbackDeviationSolverTrace(DeviationSolver):
     def solve(self, deviation: Deviation, pt: ProcessTree, log):
@@ -233,20 +277,18 @@ class EnclosedDeviationSolverInfix(DeviationSolver):
     to the right, for infixes/prefixes/postfixes.
     """
 
-    def __init__(self, pool, infix_type, try_pulling_down_lca):
+    def __init__(self, pool, infix_type, try_pulling_down_lca, sublog_index=None):
         self.pool = pool
         self.infix_type = infix_type
         self.try_pulling_down_lca = try_pulling_down_lca
+        self.sublog_index = sublog_index
 
     def solve(self, deviation: Deviation, pt: ProcessTree, log):
         left_node, left_dev_idx = deviation.left_node
         right_node, right_dev_idx = deviation.right_node
-        lca, process_tree_modified = find_lowest_common_ancestor(
-            left_node, right_node, try_pulling_lca_down=self.try_pulling_down_lca
+        lca, process_tree_modified = EnclosedDeviationSolverTrace.find_lca(
+            deviation, self.try_pulling_down_lca, self.sublog_index
         )
-        lca_is_leaf_node = len(lca.children) == 0
-        if lca_is_leaf_node:
-            lca = lca.parent
 
         if process_tree_modified:
             # process tree was modified, recalculation of the alignment is needed
@@ -284,8 +326,12 @@ class EnclosedDeviationSolverInfix(DeviationSolver):
             trace_to_add,
             self.infix_type,
             self.pool,
+            self.sublog_index,
         )
 
+        if self.sublog_index is not None:
+            return self.sublog_index.rediscover_subtree(lca, sublog)
+
         return rediscover_subtree_and_modify_pt(lca, sublog)
 
 
@@ -356,6 +402,7 @@ def get_deviation_solver(
     infix_type: InfixType,
     try_pulling_lca_down: bool,
     pool: Optional[Pool],
+    sublog_index: Optional[SublogIndex] = None,
 ):
     """
     Factory-method that returns the correct DeviationSolver for the present deviation.
@@ -365,6 +412,7 @@ def get_deviation_solver(
     infix_type
     try_pulling_lca_down
     pool
+    sublog_index: projections of the full traces of the log that are kept across the repairs of one trace
 
     Returns
     -------
@@ -374,13 +422,17 @@ def get_deviation_solver(
         case DeviationType.NONE, _:
             return NoDeviationSolver()
         case DeviationType.ENCLOSED, InfixType.NOT_AN_INFIX:
-            return EnclosedDeviationSolverTrace(try_pulling_lca_down, pool)
+            return EnclosedDeviationSolverTrace(
+                try_pulling_lca_down, pool, sublog_index
+            )
         case _, InfixType.NOT_AN_INFIX:
             return FallbackDeviationSolverTrace()
         case DeviationType.NOT_ENCLOSED, _:
             return FallbackDeviationSolverInfix()
         case DeviationType.ENCLOSED, _:
-            return EnclosedDeviationSolverInfix(pool, infix_type, try_pulling_lca_down)
+            return EnclosedDeviationSolverInfix(
+                pool, infix_type, try_pulling_lca_down, sublog_index
+            )
         case DeviationType.LEFT_ENCLOSED, _:
             return LeftEnclosedDeviationSolver()
         case DeviationType.RIGHT_ENCLOSED, _:
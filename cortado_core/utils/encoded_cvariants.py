@@ -0,0 +1,336 @@
+import os
+import tempfile
+from typing import Any, Dict, Iterable, List, Mapping, Tuple, Union
+
+import numpy as np
+from pm4py.objects.log.obj import EventLog, Trace
+
+from cortado_core.utils.cgroups_graph import ConcurrencyGroup
+from cortado_core.utils.cvariants import to_filtered_interval_log, variants_from_graphs
+from cortado_core.utils.encoded_log import (
+    EncodedLog,
+    encode_dataframe,
+    encode_traces,
+    save_encoded_log,
+    load_encoded_log,
+)
+from cortado_core.utils.parallel_utils import (
+    workload_bounds,
+    tree_reduce,
+    merge_index_maps,
+)
+from cortado_core.utils.split_graph import Group
+from cortado_core.utils.timestamp_utils import TimeUnit, transform_timestamps
+
+# activity id, activity occurrence, rank of start timestamp, rank of complete timestamp
+PATTERN_COLUMNS = 4
+MAX_RANK = np.iinfo(np.int32).max
+# workers memory-map the encoded log, /dev/shm keeps the files in memory
+SHARED_MEMORY_DIRECTORY = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def encode_event_log(log: EventLog) -> EncodedLog:
+    """
+    Encodes an event log in the same way get_concurrency_variants preprocesses it, i.e., lifecycle
+    events are merged into intervals and empty traces are removed
+    """
+    return encode_traces(list(to_filtered_interval_log(log)))
+
+
+def get_concurrency_variants_encoded(
+    log: Union[EventLog, EncodedLog, Any],
+    use_mp: bool = False,
+    time_granularity: TimeUnit = min(TimeUnit),
+    pool=None,
+    **dataframe_keys,
+) -> Dict[Group, List[Trace]]:
+    """
+    Computes the same concurrency variants as cvariants.get_concurrency_variants on an integer-encoded
+    representation of the log. Events are not copied or renamed; instead, every case is reduced to a
+    fingerprint of its activities and the order of its (time granularity truncated) timestamps.
+    The interval order relations are computed once per distinct fingerprint.
+
+    :param log: event log, already encoded log or pandas/pyarrow dataframe with one row per activity instance
+    :param dataframe_keys: column names passed to encoded_log.encode_dataframe
+    """
+    if isinstance(log, EncodedLog):
+        encoded_log = log
+    elif isinstance(log, EventLog):
+        encoded_log = encode_event_log(log)
+    else:
+        encoded_log = encode_dataframe(log, **dataframe_keys)
+
+    variants = compute_variant_case_indices(encoded_log, use_mp, time_granularity, pool)
+
+    return {
+        variant: [encoded_log.get_trace(case) for case in cases]
+        for variant, cases in variants.items()
+    }
+
+
+def compute_variant_case_indices(
+    encoded_log: EncodedLog,
+    use_mp: bool = False,
+    time_granularity: TimeUnit = min(TimeUnit),
+    pool=None,
+) -> Dict[Group, List[int]]:
+    """
+    Computes the concurrency variants of an encoded log, mapping them to the indices of their cases
+    """
+    if use_mp and pool is not None:
+        graphs, names = create_encoded_graphs_parallel(
+            encoded_log, time_granularity, pool
+        )
+    else:
+        graphs, names = create_encoded_graphs(encoded_log, time_granularity)
+
+    return variants_from_graphs(graphs, names, use_mp, pool)
+
+
+def create_encoded_graphs(
+    encoded_log: EncodedLog, time_granularity: TimeUnit
+) -> Tuple[Dict[ConcurrencyGroup, List[int]], Dict[str, str]]:
+    """
+    Returns the concurrency graphs (on renamed activities, e.g., 'a0', 'a1') together with the indices
+    of the cases they describe, and the mapping of renamed activities to the original activity names
+    """
+    cases_per_pattern = __cases_per_pattern(encoded_log, time_granularity)
+    patterns = list(cases_per_pattern.keys())
+    pattern_graphs = __patterns_to_cgroups_graphs(patterns, encoded_log.activities)
+
+    return (
+        __group_cases_by_graph(cases_per_pattern, pattern_graphs),
+        renamed_activities(encoded_log),
+    )
+
+
+def create_encoded_graphs_parallel(
+    encoded_log: EncodedLog, time_granularity: TimeUnit, pool, n_workers: int = None
+) -> Tuple[Dict[ConcurrencyGroup, List[int]], Dict[str, str]]:
+    """
+    Parallel version of create_encoded_graphs. The workers memory-map the encoded log instead of
+    receiving pickled parts of it and chunks contain roughly the same number of events. The partial
+    fingerprint maps of the workers are merged in the parent process, since merging only extends lists
+    and is cheaper than transferring the maps to the workers again.
+    """
+    if n_workers is None:
+        n_workers = getattr(pool, "_processes", None)
+
+    bounds = workload_bounds(np.diff(encoded_log.case_offsets), n_workers)
+    with tempfile.TemporaryDirectory(dir=SHARED_MEMORY_DIRECTORY) as directory:
+        save_encoded_log(encoded_log, directory)
+        partial_results = pool.starmap(
+            __cases_per_pattern_of_chunk,
+            [(directory, lower, upper, time_granularity) for lower, upper in bounds],
+        )
+
+    cases_per_pattern = tree_reduce(partial_results, merge_index_maps) or {}
+
+    patterns = list(cases_per_pattern.keys())
+    pattern_bounds = workload_bounds(
+        [len(pattern) // PATTERN_COLUMNS for pattern in patterns], n_workers
+    )
+    pattern_graphs = [
+        graph
+        for graphs in pool.starmap(
+            __patterns_to_cgroups_graphs,
+            [
+                (patterns[lower:upper], encoded_log.activities)
+                for lower, upper in pattern_bounds
+            ],
+        )
+        for graph in graphs
+    ]
+
+    return (
+        __group_cases_by_graph(cases_per_pattern, pattern_graphs),
+        renamed_activities(encoded_log),
+    )
+
+
+def __cases_per_pattern(
+    encoded_log: EncodedLog, time_granularity: TimeUnit, offset: int = 0
+) -> Dict[bytes, List[int]]:
+    patterns = compute_case_patterns(encoded_log, time_granularity)
+
+    cases_per_pattern: Dict[bytes, List[int]] = {}
+    for case, pattern in enumerate(patterns, start=offset):
+        cases_per_pattern.setdefault(pattern, []).append(case)
+
+    return cases_per_pattern
+
+
+def __cases_per_pattern_of_chunk(
+    directory: str, lower: int, upper: int, time_granularity: TimeUnit
+) -> Dict[bytes, List[int]]:
+    encoded_log = load_encoded_log(directory).slice_cases(lower, upper)
+    return __cases_per_pattern(encoded_log, time_granularity, offset=lower)
+
+
+def __patterns_to_cgroups_graphs(
+    patterns: List[bytes], activities: List[str]
+) -> List[ConcurrencyGroup]:
+    return [pattern_to_cgroups_graph(pattern, activities) for pattern in patterns]
+
+
+def __group_cases_by_graph(
+    cases_per_pattern: Dict[bytes, List[int]], pattern_graphs: List[ConcurrencyGroup]
+) -> Dict[ConcurrencyGroup, List[int]]:
+    graphs: Dict[ConcurrencyGroup, List[int]] = {}
+    for graph, cases in zip(pattern_graphs, cases_per_pattern.values()):
+        graphs.setdefault(graph, []).extend(cases)
+
+    # different fingerprints can describe the same graph, keep the cases in log order
+    for cases in graphs.values():
+        cases.sort()
+
+    return graphs
+
+
+def compute_case_patterns(
+    encoded_log: EncodedLog, time_granularity: TimeUnit
+) -> List[bytes]:
+    """
+    Computes a fingerprint per case. Events are ordered by their start timestamp (ties keep the log
+    order) and every timestamp is replaced by its dense rank among the truncated timestamps of the
+    case. Cases with equal fingerprints have equal concurrency graphs.
+    """
+    n_events = encoded_log.n_events
+    case_index = encoded_log.case_index()
+    order = np.lexsort((encoded_log.start_timestamps, case_index))
+
+    timestamps = np.concatenate(
+        (
+            transform_timestamps(encoded_log.start_timestamps, time_granularity)[order],
+            transform_timestamps(encoded_log.complete_timestamps, time_granularity)[
+                order
+            ],
+        )
+    )
+    ranks = __dense_ranks_per_case(
+        timestamps, np.concatenate((case_index, case_index)), encoded_log.case_offsets
+    )
+
+    rows = np.empty((n_events, PATTERN_COLUMNS), dtype=np.int32)
+    rows[:, 0] = encoded_log.activity_ids[order]
+    rows[:, 1] = encoded_log.occurrences[order]
+    rows[:, 2] = ranks[:n_events]
+    rows[:, 3] = ranks[n_events:]
+
+    buffer = rows.tobytes()
+    row_size = rows.itemsize * PATTERN_COLUMNS
+    offsets = (encoded_log.case_offsets * row_size).tolist()
+
+    return [buffer[lower:upper] for lower, upper in zip(offsets, offsets[1:])]
+
+
+def __dense_ranks_per_case(
+    values: np.ndarray, case_index: np.ndarray, case_offsets: np.ndarray
+) -> np.ndarray:
+    n_values = len(values)
+    if n_values == 0:
+        return np.zeros(0, dtype=np.int32)
+
+    order = np.lexsort((values, case_index))
+    sorted_values = values[order]
+    sorted_cases = case_index[order]
+
+    is_new_value = np.ones(n_values, dtype=bool)
+    is_new_value[1:] = (sorted_values[1:] != sorted_values[:-1]) | (
+        sorted_cases[1:] != sorted_cases[:-1]
+    )
+    global_ranks = np.cumsum(is_new_value) - 1
+
+    # every case owns twice as many values as events, i.e., its first value is at 2 * case offset
+    first_positions = 2 * case_offsets[:-1]
+    case_lengths = 2 * np.diff(case_offsets)
+    non_empty = case_lengths > 0
+    case_base_ranks = np.repeat(
+        global_ranks[first_positions[non_empty]], case_lengths[non_empty]
+    )
+
+    ranks = np.empty(n_values, dtype=np.int32)
+    ranks[order] = global_ranks - case_base_ranks
+    return ranks
+
+
+def pattern_to_cgroups_graph(pattern: bytes, activities: List[str]) -> ConcurrencyGroup:
+    """
+    Vectorised counterpart of cgroups_graph.cgroups_graph operating on a case fingerprint
+    """
+    rows = np.frombuffer(pattern, dtype=np.int32).reshape(-1, PATTERN_COLUMNS)
+    events = [activities[a] + str(o) for a, o in rows[:, :2].tolist()]
+    start = rows[:, 2]
+    complete = rows[:, 3]
+    n = len(events)
+
+    upper = np.triu(np.ones((n, n), dtype=bool), 1)
+    follows = upper & (complete[:, None] < start[None, :])
+    parallel = upper & ~follows
+
+    # j directly follows i unless an event between i and j completes before j starts
+    earliest_complete = np.minimum.accumulate(
+        np.where(follows, complete[None, :], MAX_RANK), axis=1
+    )
+    previous_earliest_complete = np.full((n, n), MAX_RANK, dtype=np.int64)
+    previous_earliest_complete[:, 1:] = earliest_complete[:, :-1]
+    candidates = np.where(follows, previous_earliest_complete >= start[None, :], True)
+    directly_follows = follows & np.logical_and.accumulate(candidates, axis=1)
+
+    has_successor = follows.any(axis=1)
+    if not has_successor.any():
+        n_start_activities = n if n > 1 else 0
+    elif has_successor[0]:
+        n_start_activities = int(np.argmax(follows[0]))
+    else:
+        n_start_activities = n
+
+    graph = ConcurrencyGroup()
+    graph.events = set(events)
+    graph.follows = __pairs(follows, events)
+    graph.concurrency_pairs = __pairs(parallel, events)
+    graph.directly_follows = __pairs(directly_follows, events)
+    graph.start_activities = set(events[:n_start_activities])
+    graph.end_activities = {e for e, s in zip(events, has_successor.tolist()) if not s}
+
+    return graph
+
+
+def __pairs(relation: np.ndarray, events: List[str]):
+    sources, targets = np.nonzero(relation)
+    return {(events[i], events[j]) for i, j in zip(sources.tolist(), targets.tolist())}
+
+
+def renamed_activities(encoded_log: EncodedLog) -> Mapping[str, str]:
+    """
+    Returns the mapping of renamed activities (activity name + occurrence) to activity names, in the
+    order of their first appearance in the log
+    """
+    max_occurrence = int(encoded_log.occurrences.max(initial=0)) + 1
+    codes = encoded_log.activity_ids.astype(np.int64) * max_occurrence
+    codes += encoded_log.occurrences
+    unique_codes, first_indices = np.unique(codes, return_index=True)
+    unique_codes = unique_codes[np.argsort(first_indices)]
+
+    names = {}
+    for code in unique_codes.tolist():
+        activity = encoded_log.activities[code // max_occurrence]
+        names[activity + str(code % max_occurrence)] = activity
+
+    return names
+
+
+def renamed_activities_of_patterns(
+    patterns: Iterable[bytes], activities: List[str]
+) -> Mapping[str, str]:
+    """
+    Returns the mapping of renamed activities to activity names for the activities occurring in the
+    given case fingerprints
+    """
+    names = {}
+    for pattern in patterns:
+        rows = np.frombuffer(pattern, dtype=np.int32).reshape(-1, PATTERN_COLUMNS)
+        for activity, occurrence in rows[:, :2].tolist():
+            names[activities[activity] + str(occurrence)] = activities[activity]
+
+    return names
@@ -0,0 +1,260 @@
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from pm4py.objects.log.obj import Event, Trace
+from pm4py.util.xes_constants import (
+    DEFAULT_NAME_KEY,
+    DEFAULT_START_TIMESTAMP_KEY,
+    DEFAULT_TIMESTAMP_KEY,
+    DEFAULT_TRACEID_KEY,
+)
+
+from cortado_core.utils.timestamp_utils import to_epoch_microseconds
+
+DEFAULT_CASE_ID_KEY = "case:" + DEFAULT_TRACEID_KEY
+
+ARRAY_ATTRIBUTES = [
+    "activity_ids",
+    "occurrences",
+    "start_timestamps",
+    "complete_timestamps",
+    "case_offsets",
+]
+ACTIVITIES_FILE = "activities.json"
+
+
+@dataclass
+class EncodedLog:
+    """
+    Columnar, integer-encoded representation of an interval event log. Events of case i are stored
+    in the slice case_offsets[i]:case_offsets[i + 1] of the event arrays, in their original order.
+    Timestamps are microseconds since the epoch (UTC, not truncated to any time granularity).
+    """
+
+    activities: List[str]
+    activity_ids: np.ndarray
+    occurrences: np.ndarray
+    start_timestamps: np.ndarray
+    complete_timestamps: np.ndarray
+    case_offsets: np.ndarray
+    case_ids: List = field(default_factory=list)
+    traces: Optional[List[Trace]] = None
+
+    @property
+    def n_cases(self) -> int:
+        return len(self.case_offsets) - 1
+
+    @property
+    def n_events(self) -> int:
+        return len(self.activity_ids)
+
+    def case_index(self) -> np.ndarray:
+        """
+        Returns for every event the index of the case it belongs to
+        """
+        return np.repeat(
+            np.arange(self.n_cases, dtype=np.int64), np.diff(self.case_offsets)
+        )
+
+    def get_trace(self, case: int) -> Trace:
+        if self.traces is not None:
+            return self.traces[case]
+
+        lower, upper = self.case_offsets[case], self.case_offsets[case + 1]
+        starts = self.start_timestamps[lower:upper].astype("datetime64[us]").tolist()
+        completes = (
+            self.complete_timestamps[lower:upper].astype("datetime64[us]").tolist()
+        )
+        events = [
+            Event(
+                {
+                    DEFAULT_NAME_KEY: self.activities[activity_id],
+                    DEFAULT_START_TIMESTAMP_KEY: start,
+                    DEFAULT_TIMESTAMP_KEY: complete,
+                }
+            )
+            for activity_id, start, complete in zip(
+                self.activity_ids[lower:upper].tolist(), starts, completes
+            )
+        ]
+        attributes = {}
+        if len(self.case_ids) > 0:
+            attributes[DEFAULT_TRACEID_KEY] = self.case_ids[case]
+
+        return Trace(events, attributes=attributes)
+
+    def slice_cases(self, lower: int, upper: int) -> "EncodedLog":
+        """
+        Returns the cases lower, ..., upper - 1 without copying the event arrays
+        """
+        event_lower, event_upper = self.case_offsets[lower], self.case_offsets[upper]
+
+        return EncodedLog(
+            activities=self.activities,
+            activity_ids=self.activity_ids[event_lower:event_upper],
+            occurrences=self.occurrences[event_lower:event_upper],
+            start_timestamps=self.start_timestamps[event_lower:event_upper],
+            complete_timestamps=self.complete_timestamps[event_lower:event_upper],
+            case_offsets=self.case_offsets[lower : upper + 1] - event_lower,
+            case_ids=self.case_ids[lower:upper],
+            traces=self.traces[lower:upper] if self.traces is not None else None,
+        )
+
+    def get_traces(self) -> List[Trace]:
+        if self.traces is not None:
+            return self.traces
+
+        return [self.get_trace(case) for case in range(self.n_cases)]
+
+
+def save_encoded_log(encoded_log: EncodedLog, directory: str):
+    """
+    Stores the event arrays as .npy files and the activities as json, case ids and traces are not stored
+    """
+    os.makedirs(directory, exist_ok=True)
+    for attribute in ARRAY_ATTRIBUTES:
+        np.save(
+            os.path.join(directory, attribute + ".npy"),
+            getattr(encoded_log, attribute),
+        )
+
+    with open(os.path.join(directory, ACTIVITIES_FILE), "w") as file:
+        json.dump(encoded_log.activities, file)
+
+
+def load_encoded_log(directory: str, mmap_mode: Optional[str] = "r") -> EncodedLog:
+    """
+    Loads a log stored by save_encoded_log. By default, the event arrays are memory-mapped, i.e.,
+    processes loading the same log share its memory.
+    """
+    arrays = {
+        attribute: np.load(
+            os.path.join(directory, attribute + ".npy"), mmap_mode=mmap_mode
+        )
+        for attribute in ARRAY_ATTRIBUTES
+    }
+
+    with open(os.path.join(directory, ACTIVITIES_FILE)) as file:
+        activities = json.load(file)
+
+    return EncodedLog(activities=activities, **arrays)
+
+
+def compute_occurrences(activity_ids: np.ndarray, case_offsets: np.ndarray):
+    """
+    Computes for every event how often its activity occurred before in the same case
+    """
+    n_events = len(activity_ids)
+    if n_events == 0:
+        return np.zeros(0, dtype=np.int32)
+
+    case_index = np.repeat(
+        np.arange(len(case_offsets) - 1, dtype=np.int64), np.diff(case_offsets)
+    )
+    order = np.lexsort((np.arange(n_events), activity_ids, case_index))
+    sorted_case = case_index[order]
+    sorted_activity = activity_ids[order]
+    new_group = np.ones(n_events, dtype=bool)
+    new_group[1:] = (sorted_case[1:] != sorted_case[:-1]) | (
+        sorted_activity[1:] != sorted_activity[:-1]
+    )
+    group_start = np.maximum.accumulate(np.where(new_group, np.arange(n_events), 0))
+
+    occurrences = np.empty(n_events, dtype=np.int32)
+    occurrences[order] = np.arange(n_events) - group_start
+    return occurrences
+
+
+def encode_traces(
+    traces: List[Trace], activities: Optional[Dict[str, int]] = None
+) -> EncodedLog:
+    """
+    Encodes interval traces, i.e., traces whose events carry a start and a complete timestamp
+    :param traces: interval traces
+    :param activities: optional mapping of already interned activity names to ids, extended in place
+    """
+    if activities is None:
+        activities = {}
+
+    activity_ids = []
+    starts = []
+    completes = []
+    lengths = []
+
+    for trace in traces:
+        lengths.append(len(trace))
+        for event in trace:
+            activity_ids.append(
+                activities.setdefault(event[DEFAULT_NAME_KEY], len(activities))
+            )
+            starts.append(to_epoch_microseconds(event[DEFAULT_START_TIMESTAMP_KEY]))
+            completes.append(to_epoch_microseconds(event[DEFAULT_TIMESTAMP_KEY]))
+
+    activity_ids = np.array(activity_ids, dtype=np.int32)
+    case_offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=case_offsets[1:])
+
+    return EncodedLog(
+        activities=list(activities.keys()),
+        activity_ids=activity_ids,
+        occurrences=compute_occurrences(activity_ids, case_offsets),
+        start_timestamps=np.array(starts, dtype=np.int64),
+        complete_timestamps=np.array(completes, dtype=np.int64),
+        case_offsets=case_offsets,
+        case_ids=[trace.attributes.get(DEFAULT_TRACEID_KEY, None) for trace in traces],
+        traces=traces,
+    )
+
+
+def encode_dataframe(
+    df,
+    case_id_key: str = DEFAULT_CASE_ID_KEY,
+    activity_key: str = DEFAULT_NAME_KEY,
+    start_timestamp_key: str = DEFAULT_START_TIMESTAMP_KEY,
+    timestamp_key: str = DEFAULT_TIMESTAMP_KEY,
+    activities: Optional[Dict[str, int]] = None,
+) -> EncodedLog:
+    """
+    Encodes a pandas or pyarrow dataframe with one row per activity instance. Rows of a case keep
+    their relative order, cases are ordered by their first row.
+    :param activities: optional mapping of already interned activity names to ids, extended in place
+    """
+    if not isinstance(df, pd.DataFrame):
+        # pyarrow tables and record batches
+        df = df.to_pandas()
+
+    case_codes, case_ids = pd.factorize(df[case_id_key], sort=False)
+    activity_codes, activity_names = pd.factorize(df[activity_key], sort=False)
+
+    order = np.argsort(case_codes, kind="stable")
+    case_codes = case_codes[order]
+    lengths = np.bincount(case_codes, minlength=len(case_ids))
+    case_offsets = np.zeros(len(case_ids) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=case_offsets[1:])
+
+    if activities is None:
+        activities = {}
+    interned_ids = np.array(
+        [activities.setdefault(str(a), len(activities)) for a in activity_names],
+        dtype=np.int32,
+    )
+    activity_ids = interned_ids[activity_codes[order]]
+
+    return EncodedLog(
+        activities=list(activities.keys()),
+        activity_ids=activity_ids,
+        occurrences=compute_occurrences(activity_ids, case_offsets),
+        start_timestamps=__to_epoch_microseconds(df[start_timestamp_key])[order],
+        complete_timestamps=__to_epoch_microseconds(df[timestamp_key])[order],
+        case_offsets=case_offsets,
+        case_ids=list(case_ids),
+    )
+
+
+def __to_epoch_microseconds(column) -> np.ndarray:
+    column = pd.to_datetime(column, utc=True).dt.tz_localize(None)
+    return column.to_numpy(dtype="datetime64[us]").astype(np.int64)
@@ -0,0 +1,233 @@
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+from pm4py.objects.log.obj import EventLog, Trace
+from pm4py.util.xes_constants import DEFAULT_TRACEID_KEY
+
+from cortado_core.utils.cgroups_graph import ConcurrencyGroup, RELATION_ATTRIBUTES
+from cortado_core.utils.cvariants import restore_names_rek, to_filtered_interval_log
+from cortado_core.utils.encoded_cvariants import (
+    compute_case_patterns,
+    pattern_to_cgroups_graph,
+    renamed_activities,
+)
+from cortado_core.utils.encoded_log import EncodedLog, encode_traces
+from cortado_core.utils.split_graph import Group, split_group
+from cortado_core.utils.timestamp_utils import TimeUnit
+
+
+class IncrementalConcurrencyVariants:
+    """
+    Maintains the concurrency variants of a growing log. Added traces are assigned to existing variants by
+    their concurrency graph, i.e., only graphs that were not seen before are split into variants. Variants
+    that are not affected by an update are neither copied nor modified.
+
+    The renamed activities (activity name + occurrence) are interned once, new ones are appended to the
+    table, such that the graphs in Group.graphs stay comparable across updates. Case ids are assumed to be
+    unique.
+    """
+
+    def __init__(
+        self,
+        variants: Dict[Group, List[Trace]] = None,
+        time_granularity: TimeUnit = min(TimeUnit),
+    ):
+        """
+        :param variants: variants computed by get_concurrency_variants (or a previous incremental
+        computation), they are updated in place
+        """
+        self.variants: Dict[Group, List[Trace]] = {} if variants is None else variants
+        self.time_granularity = time_granularity
+        self.names, self.id_name_map = interned_activity_names(self.variants)
+        self.activities: Dict[str, int] = {}
+
+        self.__variants_by_key: Dict[Group, Group] = {v: v for v in self.variants}
+        # graphs with restored names only compare activities, thus, the renamed graphs are indexed
+        self.__variant_of_graph: Dict[ConcurrencyGroup, Group] = {
+            graph_with_renamed_activities(graph, self.id_name_map): v
+            for v in self.variants
+            for graph in v.graphs
+        }
+        self.__variant_of_case: Dict[Any, Group] = {
+            trace.attributes[DEFAULT_TRACEID_KEY]: v
+            for v, traces in self.variants.items()
+            for trace in traces
+            if DEFAULT_TRACEID_KEY in trace.attributes
+        }
+
+    def add_traces(self, traces: Iterable[Trace]):
+        traces = [trace for trace in traces if len(trace) > 0]
+        if len(traces) == 0:
+            return
+
+        encoded_log = encode_traces(
+            list(to_filtered_interval_log(EventLog(traces))), self.activities
+        )
+        self.__intern_names(renamed_activities(encoded_log))
+
+        cases_per_variant: Dict[Group, List[int]] = {}
+        for graph, cases in self.__cases_per_graph(encoded_log).items():
+            variant = self.__variant_of_graph.get(graph)
+            if variant is None or self.__variants_by_key.get(variant) is not variant:
+                variant = self.__add_graph(graph)
+
+            restored_graph = self.__restored_graph(graph)
+            variant.graphs[restored_graph] = variant.graphs.get(
+                restored_graph, 0
+            ) + len(cases)
+            cases_per_variant.setdefault(variant, []).extend(cases)
+
+        for variant, cases in cases_per_variant.items():
+            cases.sort()
+            variant_traces = self.variants.setdefault(variant, [])
+            for case in cases:
+                trace = encoded_log.traces[case]
+                variant_traces.append(trace)
+                if DEFAULT_TRACEID_KEY in trace.attributes:
+                    self.__variant_of_case[trace.attributes[DEFAULT_TRACEID_KEY]] = (
+                        variant
+                    )
+
+    def remove_cases(self, case_ids: Iterable[Any]):
+        removed_per_variant: Dict[Group, set] = {}
+        for case_id in case_ids:
+            variant = self.__variant_of_case.pop(case_id, None)
+            if variant is not None:
+                removed_per_variant.setdefault(variant, set()).add(case_id)
+
+        for variant, removed_case_ids in removed_per_variant.items():
+            kept_traces = []
+            removed_traces = []
+            for trace in self.variants[variant]:
+                if trace.attributes.get(DEFAULT_TRACEID_KEY) in removed_case_ids:
+                    removed_traces.append(trace)
+                else:
+                    kept_traces.append(trace)
+
+            # the traces of variants are interval traces already
+            encoded_log = encode_traces(removed_traces, self.activities)
+            for graph, cases in self.__cases_per_graph(encoded_log).items():
+                restored_graph = self.__restored_graph(graph)
+                variant.graphs[restored_graph] -= len(cases)
+                if variant.graphs[restored_graph] <= 0:
+                    del variant.graphs[restored_graph]
+
+            if len(kept_traces) == 0:
+                del self.variants[variant]
+                del self.__variants_by_key[variant]
+            else:
+                self.variants[variant] = kept_traces
+
+    def __intern_names(self, names: Mapping[str, str]):
+        for renamed_activity, activity in names.items():
+            if renamed_activity not in self.names:
+                self.names[renamed_activity] = activity
+                self.id_name_map[renamed_activity] = len(self.id_name_map)
+
+    def __cases_per_graph(
+        self, encoded_log: EncodedLog
+    ) -> Dict[ConcurrencyGroup, List[int]]:
+        activities = list(self.activities.keys())
+        cases_per_pattern: Dict[bytes, List[int]] = {}
+        for case, pattern in enumerate(
+            compute_case_patterns(encoded_log, self.time_granularity)
+        ):
+            cases_per_pattern.setdefault(pattern, []).append(case)
+
+        cases_per_graph: Dict[ConcurrencyGroup, List[int]] = {}
+        for pattern, cases in cases_per_pattern.items():
+            graph = pattern_to_cgroups_graph(pattern, activities)
+            cases_per_graph.setdefault(graph, []).extend(cases)
+
+        return cases_per_graph
+
+    def __restored_graph(self, graph: ConcurrencyGroup) -> ConcurrencyGroup:
+        restored_graph = ConcurrencyGroup()
+        for attribute in RELATION_ATTRIBUTES:
+            setattr(restored_graph, attribute, getattr(graph, attribute))
+        restored_graph.restore_names(self.names, self.id_name_map)
+
+        return restored_graph
+
+    def __add_graph(self, graph: ConcurrencyGroup) -> Group:
+        v = split_group(graph)
+        if not v.checkGroupType():
+            raise Exception("Variant contains ChoiceGroup")
+
+        v = restore_names_rek(v, self.names).freeze()
+        variant = self.__variants_by_key.get(v)
+        if variant is None:
+            variant = v
+            variant.graphs = {}
+            self.__variants_by_key[variant] = variant
+
+        self.__variant_of_graph[graph] = variant
+        return variant
+
+
+def interned_activity_names(
+    variants: Mapping[Group, Any],
+) -> Tuple[Dict[str, str], Dict[str, int]]:
+    """
+    Reconstructs the table of renamed activities (activity name + occurrence) and their ids from the graphs
+    of variants. The n-th occurrence of an activity is renamed before the (n+1)-th one, i.e., the ids of the
+    occurrences of an activity are increasing.
+    """
+    ids_per_activity: Dict[str, set] = {}
+    for v in variants:
+        for graph in v.graphs:
+            for activity, ids in graph.events.items():
+                ids_per_activity.setdefault(activity, set()).update(ids)
+
+    renamed_activities = []
+    for activity, ids in ids_per_activity.items():
+        for occurrence, id in enumerate(sorted(ids)):
+            renamed_activities.append((id, activity + str(occurrence), activity))
+    renamed_activities.sort()
+
+    names = {renamed: activity for _, renamed, activity in renamed_activities}
+    id_name_map = {renamed: id for id, renamed, _ in renamed_activities}
+    return names, id_name_map
+
+
+def graph_with_renamed_activities(
+    graph: ConcurrencyGroup, id_name_map: Mapping[str, int]
+) -> ConcurrencyGroup:
+    """
+    Inverse of ConcurrencyGroup.restore_names
+    """
+    renamed_activity_of_id = {id: renamed for renamed, id in id_name_map.items()}
+
+    def _rename_unary(relation):
+        return {renamed_activity_of_id[id] for ids in relation.values() for id in ids}
+
+    def _rename_binary(relation):
+        return {
+            (renamed_activity_of_id[x], renamed_activity_of_id[y])
+            for pairs in relation.values()
+            for x, y in pairs
+        }
+
+    renamed_graph = ConcurrencyGroup()
+    renamed_graph.events = _rename_unary(graph.events)
+    renamed_graph.start_activities = _rename_unary(graph.start_activities)
+    renamed_graph.end_activities = _rename_unary(graph.end_activities)
+    renamed_graph.follows = _rename_binary(graph.follows)
+    renamed_graph.directly_follows = _rename_binary(graph.directly_follows)
+    renamed_graph.concurrency_pairs = _rename_binary(graph.concurrency_pairs)
+    return renamed_graph
+
+
+def update_concurrency_variants(
+    variants: Dict[Group, List[Trace]],
+    new_traces: Iterable[Trace] = (),
+    removed_case_ids: Iterable[Any] = (),
+    time_granularity: TimeUnit = min(TimeUnit),
+) -> Dict[Group, List[Trace]]:
+    """
+    Updates variants computed by get_concurrency_variants in place, see IncrementalConcurrencyVariants
+    """
+    incremental_variants = IncrementalConcurrencyVariants(variants, time_granularity)
+    incremental_variants.remove_cases(removed_case_ids)
+    incremental_variants.add_traces(new_traces)
+
+    return incremental_variants.variants
@@ -1,29 +1,75 @@
-from typing import List
+import os
+import time
+from dataclasses import dataclass
+from multiprocessing import Pool
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 from pm4py.objects.log.obj import EventLog, Trace
 from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.util import exec_utils
 from pm4py.util.typing import AlignmentResult
+from pm4py.util.xes_constants import DEFAULT_NAME_KEY
 from pm4py.algo.conformance.alignments.petri_net.algorithm import (
     apply as calculate_alignment,
 )
 from pm4py.algo.conformance.alignments.petri_net.algorithm import (
     variants as variants_calculate_alignments,
+    Variants,
 )
+from pm4py.algo.conformance.alignments.petri_net.variants.state_equation_a_star import (
+    Parameters,
+)
+
+from cortado_core.utils.alignment_service import (
+    fan_out_alignments,
+    group_traces_by_activities,
+)
+from cortado_core.utils.parallel_utils import workload_bounds
+
+# the costs of an alignment grow with the length of the trace, short traces are cheap to transfer
+MIN_EVENTS_PER_ALIGNMENT_CHUNK = 50
+
+# model of the worker processes of an AlignmentPool, it is transferred once by the pool initializer
+__worker_model = None
 
 
 def calculate_alignments_parallel(
     log: EventLog, net: PetriNet, im: Marking, fm: Marking, parameters, pool
 ) -> List[AlignmentResult]:
-    results = []
-    for trace in log:
-        result = pool.apply_async(
-            calculate_alignment_a_star,
-            args=[trace, net, im, fm],
-            kwds={"parameters": parameters},
+    """
+    Aligns one trace per activity sequence in the pool and assigns the alignment to all traces of the
+    activity sequence. The traces are sent in chunks of similar length, i.e., the net is pickled once per
+    chunk instead of once per trace, and chunks are collected as they complete. Model transitions are
+    transferred by their position as in AlignmentPool. The net is not cached across calls, since model
+    repair modifies it in place.
+    """
+    activity_key = exec_utils.get_param_value(
+        Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY
+    )
+    groups = group_traces_by_activities(log, activity_key=activity_key)
+    traces = [log[positions[0]] for positions in groups.values()]
+
+    transitions = list(net.transitions)
+    alignments: List[Optional[AlignmentResult]] = [None] * len(traces)
+    chunks = [
+        (
+            net,
+            im,
+            fm,
+            parameters,
+            transitions,
+            list(range(lower, upper)),
+            traces[lower:upper],
         )
-        results.append(result)
+        for lower, upper in alignment_chunk_bounds(traces)
+    ]
+    for _, indices, chunk_alignments, _ in pool.imap_unordered(
+        align_chunk_with_model, chunks
+    ):
+        for i, alignment in zip(indices, chunk_alignments):
+            alignments[i] = decode_model_transitions(alignment, transitions)
 
-    return [r.get() for r in results]
+    return fan_out_alignments(alignments, groups.values(), len(log))
 
 
 def calculate_alignment_a_star(
@@ -41,3 +87,235 @@ def calculate_alignment_a_star(
         parameters=parameters,
         variant=variants_calculate_alignments.state_equation_a_star,
     )
+
+
+@dataclass
+class WorkerStatistics:
+    traces: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """
+        Aligned traces per second
+        """
+        return self.traces / self.seconds if self.seconds > 0 else 0.0
+
+
+class AlignmentPool:
+    """
+    Process pool aligning traces against a fixed model. The model is sent to every worker once by the pool
+    initializer, afterward, only chunks of traces and their alignments are transferred. Alignments are
+    yielded as their chunks complete. Model transitions in returned alignments are transferred by their
+    position, i.e., transition names referencing the nodes of a process tree keep their identity.
+
+    Usage:
+        with AlignmentPool(net, im, fm, parameters) as pool:
+            alignments = pool.calculate_alignments(log)
+    """
+
+    def __init__(
+        self,
+        net: PetriNet,
+        im: Marking,
+        fm: Marking,
+        parameters: Optional[dict] = None,
+        n_processes: Optional[int] = None,
+        variant: Variants = Variants.VERSION_STATE_EQUATION_A_STAR,
+    ):
+        self.n_processes = n_processes or os.cpu_count() or 1
+        self.statistics: Dict[int, WorkerStatistics] = {}
+        self.__transitions = list(net.transitions)
+        self.__pool = Pool(
+            self.n_processes,
+            initializer=initialize_alignment_worker,
+            initargs=(net, im, fm, parameters or {}, variant, self.__transitions),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.__pool.terminate()
+        self.__pool.join()
+
+    def imap_alignments(
+        self,
+        traces: Sequence[Trace],
+        chunk_size: Optional[int] = None,
+        trace_timeout: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Tuple[int, Optional[AlignmentResult]]]:
+        """
+        Yields (index of the trace, alignment) in the order of completion
+        :param chunk_size: number of traces per chunk, by default, chunks of similar total length are formed
+        :param trace_timeout: time budget of a single trace in seconds
+        :param timeout: time budget of all traces in seconds, traces that are not aligned within the budget
+        get None as alignment
+        """
+        if chunk_size is None:
+            bounds = alignment_chunk_bounds(traces, self.n_processes)
+        else:
+            bounds = [
+                (lower, min(lower + chunk_size, len(traces)))
+                for lower in range(0, len(traces), chunk_size)
+            ]
+
+        deadline = time.time() + timeout if timeout is not None else None
+        chunks = [
+            (list(range(lower, upper)), traces[lower:upper], trace_timeout, deadline)
+            for lower, upper in bounds
+        ]
+        for pid, indices, alignments, seconds in self.__pool.imap_unordered(
+            align_chunk, chunks
+        ):
+            statistics = self.statistics.setdefault(pid, WorkerStatistics())
+            statistics.traces += len(indices)
+            statistics.chunks += 1
+            statistics.seconds += seconds
+
+            for i, alignment in zip(indices, alignments):
+                yield i, decode_model_transitions(alignment, self.__transitions)
+
+    def calculate_alignments(
+        self,
+        log: Sequence[Trace],
+        chunk_size: Optional[int] = None,
+        trace_timeout: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Optional[AlignmentResult]]:
+        """
+        Aligns one trace per activity sequence and returns the alignments in the order of the log
+        """
+        groups = group_traces_by_activities(log)
+        traces = [log[positions[0]] for positions in groups.values()]
+
+        alignments: List[Optional[AlignmentResult]] = [None] * len(traces)
+        for i, alignment in self.imap_alignments(
+            traces, chunk_size, trace_timeout, timeout
+        ):
+            alignments[i] = alignment
+
+        return fan_out_alignments(alignments, groups.values(), len(log))
+
+
+def initialize_alignment_worker(
+    net: PetriNet,
+    im: Marking,
+    fm: Marking,
+    parameters: dict,
+    variant,
+    transitions: List[PetriNet.Transition],
+):
+    global __worker_model
+    positions = model_transition_positions(transitions)
+    __worker_model = (net, im, fm, parameters, variant, positions)
+
+
+def align_chunk(chunk):
+    indices, traces, trace_timeout, deadline = chunk
+    net, im, fm, parameters, variant, positions = __worker_model
+    start_time = time.time()
+
+    alignments = []
+    for trace in traces:
+        time_budget = trace_timeout
+        if deadline is not None:
+            remaining_time = deadline - time.time()
+            if remaining_time <= 0:
+                alignments.append(None)
+                continue
+            time_budget = min(time_budget or remaining_time, remaining_time)
+
+        trace_parameters = parameters
+        if time_budget is not None:
+            trace_parameters = dict(parameters)
+            trace_parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = time_budget
+        alignment = calculate_alignment(
+            trace, net, im, fm, parameters=trace_parameters, variant=variant
+        )
+        alignments.append(encode_model_transitions(alignment, positions))
+
+    return os.getpid(), indices, alignments, time.time() - start_time
+
+
+def align_chunk_with_model(chunk):
+    net, im, fm, parameters, transitions, indices, traces = chunk
+    start_time = time.time()
+    positions = model_transition_positions(transitions)
+    alignments = [
+        encode_model_transitions(
+            calculate_alignment_a_star(trace, net, im, fm, parameters), positions
+        )
+        for trace in traces
+    ]
+
+    return os.getpid(), indices, alignments, time.time() - start_time
+
+
+def model_transition_positions(
+    transitions: List[PetriNet.Transition],
+) -> Dict[int, int]:
+    """
+    Maps the identity of the names of the given transitions to their positions. Names are not used as keys, since
+    the names of nets converted from process trees contain tree nodes, which compare equal if their subtrees are
+    equal, e.g., different tau leaves
+    """
+    return {id(t.name): i for i, t in enumerate(transitions)}
+
+
+def encode_model_transitions(
+    alignment: Optional[AlignmentResult], positions: Dict[int, int]
+) -> Optional[AlignmentResult]:
+    """
+    Replaces the names and labels of model transitions in the moves of an alignment (ret_tuple_as_trans_desc)
+    by their positions, see model_transition_positions
+    """
+    if alignment is None or alignment.get("alignment") is None:
+        return alignment
+
+    encoded = []
+    for move in alignment["alignment"]:
+        if isinstance(move[0], tuple) and id(move[0][1]) in positions:
+            # the label of the model transition is restored from the transition as well
+            move = ((move[0][0], positions[id(move[0][1])]), (move[1][0], None))
+        encoded.append(move)
+
+    return {**alignment, "alignment": encoded}
+
+
+def decode_model_transitions(
+    alignment: Optional[AlignmentResult], transitions: List[PetriNet.Transition]
+) -> Optional[AlignmentResult]:
+    """
+    Inverse of encode_model_transitions
+    """
+    if alignment is None or alignment.get("alignment") is None:
+        return alignment
+
+    decoded = []
+    for move in alignment["alignment"]:
+        if isinstance(move[0], tuple) and isinstance(move[0][1], int):
+            transition = transitions[move[0][1]]
+            move = ((move[0][0], transition.name), (move[1][0], transition.label))
+        decoded.append(move)
+    alignment["alignment"] = decoded
+
+    return alignment
+
+
+def alignment_chunk_bounds(
+    traces: Sequence[Trace], n_workers: Optional[int] = None
+) -> List[Tuple[int, int]]:
+    """
+    Splits traces into consecutive chunks of similar total length
+    """
+    return workload_bounds(
+        [len(trace) + 1 for trace in traces],
+        n_workers=n_workers,
+        min_size_per_chunk=MIN_EVENTS_PER_ALIGNMENT_CHUNK,
+    )
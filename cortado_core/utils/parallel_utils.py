@@ -1,19 +1,55 @@
-from typing import List, Tuple, Mapping
+import os
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
 
 from cortado_core.utils.cgroups_graph import ConcurrencyGroup
 
 from cortado_core.utils.timestamp_utils import TimeUnit
 from pm4py.objects.log.obj import EventLog, Trace
 
-MIN_CHUNKS = 8
+# chunks per worker, more chunks balance the load of unequally expensive chunks
+CHUNKS_PER_WORKER = 4
+# smaller chunks cost more for transferring than they save
+MIN_EVENTS_PER_CHUNK = 5000
+
+
+def workload_bounds(
+    sizes: Sequence[int],
+    n_workers: int = None,
+    min_size_per_chunk: int = MIN_EVENTS_PER_CHUNK,
+) -> List[Tuple[int, int]]:
+    """
+    Splits items into consecutive chunks of roughly equal total size, e.g., traces by their number of events
+    :param sizes: size of every item
+    :param n_workers: number of workers, defaults to the number of cpus
+    :param min_size_per_chunk: minimal total size of a chunk
+    :return: list of (lower, upper) item bounds
+    """
+    n_items = len(sizes)
+    if n_items == 0:
+        return []
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+
+    cumulative_sizes = np.cumsum(sizes)
+    total_size = int(cumulative_sizes[-1])
+    size_per_chunk = max(
+        min_size_per_chunk, total_size // (n_workers * CHUNKS_PER_WORKER), 1
+    )
+    targets = np.arange(size_per_chunk, total_size, size_per_chunk)
+    uppers = np.searchsorted(cumulative_sizes, targets, side="left") + 1
+    uppers = np.unique(np.append(uppers[uppers < n_items], n_items))
+    lowers = np.concatenate(([0], uppers[:-1]))
+
+    return list(zip(lowers.tolist(), uppers.tolist()))
 
 
 def workload_split(
     log_renamed: EventLog, interval_log: EventLog, time_granularity: TimeUnit
 ) -> Tuple[List[EventLog], List[EventLog], List[TimeUnit]]:
-    len_log = len(log_renamed)
-    step_size = min(100, len_log // MIN_CHUNKS)
-    bounds = [(i, min([i + step_size, len_log])) for i in range(0, len_log, step_size)]
+    bounds = workload_bounds([len(trace) for trace in log_renamed])
 
     log_renamed_bounds = [log_renamed[lower:upper] for lower, upper in bounds]
     interval_log_bounds = [interval_log[lower:upper] for lower, upper in bounds]
@@ -26,11 +62,47 @@ def workload_split(
 
 
 def workload_split_graphs(graphs: Mapping[ConcurrencyGroup, List[Trace]]):
-    len_graphs = len(graphs)
-    step_size = min(100, len_graphs // MIN_CHUNKS)
-    bounds = [
-        (i, min([i + step_size, len_graphs])) for i in range(0, len_graphs, step_size)
-    ]
     flattend_graphs = list(graphs.items())
+    # the costs of splitting a graph grow with its number of events, graphs are small, though
+    bounds = workload_bounds(
+        [len(graph.events) for graph, _ in flattend_graphs], min_size_per_chunk=100
+    )
 
     return [flattend_graphs[lower:upper] for lower, upper in bounds]
+
+
+def tree_reduce(
+    partial_results: List[Any], merge: Callable[[Any, Any], Any], pool=None
+) -> Any:
+    """
+    Merges partial results pairwise in rounds, i.e., in log2(n) rounds of parallel merges instead of n
+    sequential merges. Neighbouring results are merged, hence, an order-preserving merge function
+    results in an order-preserving reduction.
+    :param merge: picklable function merging two partial results
+    :param pool: optional process pool executing the merges of a round in parallel
+    """
+    if len(partial_results) == 0:
+        return None
+
+    while len(partial_results) > 1:
+        pairs = list(zip(partial_results[0::2], partial_results[1::2]))
+        if pool is not None and len(pairs) > 1:
+            merged = pool.starmap(merge, pairs)
+        else:
+            merged = [merge(left, right) for left, right in pairs]
+
+        if len(partial_results) % 2 == 1:
+            merged.append(partial_results[-1])
+
+        partial_results = merged
+
+    return partial_results[0]
+
+
+def merge_index_maps(
+    left: Dict[Any, List[int]], right: Dict[Any, List[int]]
+) -> Dict[Any, List[int]]:
+    for key, indices in right.items():
+        left.setdefault(key, []).extend(indices)
+
+    return left
@@ -1,13 +1,15 @@
 from collections import Counter
 from copy import deepcopy
 from functools import cmp_to_key
-from itertools import pairwise, product, combinations
-from typing import List, Mapping
+from hashlib import blake2b
+from itertools import chain, pairwise, product, combinations
+from typing import Iterable, List, Mapping, Tuple
 
 import networkx as nx
+import numpy as np
 
 from cortado_core.models.infix_type import InfixType
-from cortado_core.utils.cgroups_graph import ConcurrencyGroup
+from cortado_core.utils.cgroups_graph import ConcurrencyGroup, FINGERPRINT_SIZE
 from cortado_core.utils.collection_utils import (
     count_ordererd_sub_list_occurrences,
     count_unordered_sub_list_occurrences,
@@ -16,6 +18,11 @@ from cortado_core.utils.constants import ARTIFICAL_END_NAME, ARTIFICAL_START_NAM
 
 
 class Group(list):
+    # whether the order of the members is part of the identity of the group
+    ordered = True
+    # whether the infix type is part of the identity of the group
+    identity_includes_infix_type = True
+
     def __init__(
         self,
         lst: tuple = (),
@@ -34,6 +41,10 @@ class Group(list):
         super().__init__(lst)
         self.graphs: Mapping[ConcurrencyGroup, int] = {}
         self.performance = {"wait_time": None, "service_time": None}
+        self._frozen: bool = False
+        self._fingerprint: bytes = None
+        # hash of frozen groups, it is not pickled since hashes of strings differ between processes
+        self._hash: int = None
         self.infix_type: InfixType = infix_type
         self.id: int = id
 
@@ -106,7 +117,152 @@ class Group(list):
         return True
 
     def __eq__(self, o: object) -> bool:
-        return self.__hash__() == o.__hash__()
+        if self is o:
+            return True
+
+        if not isinstance(o, Group):
+            return NotImplemented
+
+        return _groups_equal(self, o, {})
+
+    def __ne__(self, o: object) -> bool:
+        # list.__ne__ would compare the members only
+        equal = self.__eq__(o)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return _group_hash(self, {})
+
+    def fingerprint(self) -> bytes:
+        """
+        Canonical 128-bit digest of the group. Members of unordered groups are sorted by their
+        fingerprints, thus, the fingerprint is independent of the member order and of the process
+        that computed it. Frozen groups compute it only once.
+        """
+        if self._fingerprint is not None:
+            return self._fingerprint
+
+        digest = blake2b(type(self).__name__.encode(), digest_size=FINGERPRINT_SIZE)
+        if self.identity_includes_infix_type:
+            digest.update(str(self.infix_type).encode())
+
+        member_fingerprints = [_member_fingerprint(e) for e in self]
+        if not self.ordered:
+            member_fingerprints.sort()
+
+        for member_fingerprint in member_fingerprints:
+            digest.update(member_fingerprint)
+
+        fingerprint = digest.digest()
+        if self._frozen:
+            self._fingerprint = fingerprint
+
+        return fingerprint
+
+    def freeze(self) -> "Group":
+        """
+        Recursively makes the group and its members immutable, including their infix types, and caches their
+        fingerprints. Attributes that are not part of the identity (e.g., graphs, performance and id) can still be
+        set.
+        Copies of frozen groups are not frozen.
+        """
+        if not self._frozen:
+            for e in self:
+                if isinstance(e, Group):
+                    e.freeze()
+
+            self._frozen = True
+            self._fingerprint = self.fingerprint()
+
+        return self
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    @property
+    def infix_type(self) -> InfixType:
+        return self._infix_type
+
+    @infix_type.setter
+    def infix_type(self, infix_type: InfixType):
+        self.__check_not_frozen()
+        self._infix_type = infix_type
+
+    def __check_not_frozen(self):
+        if self._frozen:
+            raise TypeError(f"{type(self).__name__} is frozen and cannot be modified")
+
+    def append(self, e):
+        self.__check_not_frozen()
+        super().append(e)
+
+    def extend(self, es):
+        self.__check_not_frozen()
+        super().extend(es)
+
+    def insert(self, i, e):
+        self.__check_not_frozen()
+        super().insert(i, e)
+
+    def remove(self, e):
+        self.__check_not_frozen()
+        super().remove(e)
+
+    def pop(self, i=-1):
+        self.__check_not_frozen()
+        return super().pop(i)
+
+    def clear(self):
+        self.__check_not_frozen()
+        super().clear()
+
+    def reverse(self):
+        self.__check_not_frozen()
+        super().reverse()
+
+    def __setitem__(self, i, e):
+        self.__check_not_frozen()
+        super().__setitem__(i, e)
+
+    def __delitem__(self, i):
+        self.__check_not_frozen()
+        super().__delitem__(i)
+
+    def __iadd__(self, es):
+        self.__check_not_frozen()
+        return super().__iadd__(es)
+
+    def __imul__(self, n):
+        self.__check_not_frozen()
+        return super().__imul__(n)
+
+    def __copy__(self):
+        copied = type(self).__new__(type(self))
+        list.extend(copied, self)
+        copied.__dict__.update(self.__dict__)
+        copied._frozen = False
+        copied._fingerprint = None
+        copied._hash = None
+        return copied
+
+    def __deepcopy__(self, memo):
+        copied = type(self).__new__(type(self))
+        memo[id(self)] = copied
+        list.extend(copied, [deepcopy(e, memo) for e in self])
+        copied.__dict__.update(deepcopy(self.__dict__, memo))
+        copied._frozen = False
+        copied._fingerprint = None
+        copied._hash = None
+        return copied
+
+    def __reduce_ex__(self, protocol):
+        # pickled groups keep their frozen state and fingerprint, e.g., when sent to worker processes
+        return _restore_group, (
+            type(self),
+            list(self),
+            {**self.__dict__, "_hash": None},
+        )
 
     def __lt__(self, other):
         return str(self) < str(other)
@@ -161,10 +317,6 @@ class SequenceGroup(Group):
                 "id": self.id,
             }
 
-    def __hash__(self):
-        temp_tuple_with_infix = tuple(self) + (self.infix_type,)
-        return temp_tuple_with_infix.__hash__()
-
     # Already in sorted order
     def sort(self):
         return SequenceGroup([g.sort() for g in self], self.infix_type, self.id)
@@ -239,6 +391,8 @@ class SequenceGroup(Group):
 
 
 class ParallelGroup(Group):
+    ordered = False
+
     def serialize(self, include_performance=True):
         if include_performance:
             return {
@@ -260,10 +414,6 @@ class ParallelGroup(Group):
                 "id": self.id,
             }
 
-    def __hash__(self):
-        temp_tuple_with_infix = tuple(sorted(self)) + (self.infix_type,)
-        return temp_tuple_with_infix.__hash__()
-
     def sort(self):
         return ParallelGroup(
             sorted([x.sort() for x in self], key=lambda x: repr(x)), id=self.id
@@ -309,6 +459,9 @@ class ParallelGroup(Group):
 
 
 class ChoiceGroup(Group):
+    ordered = False
+    identity_includes_infix_type = False
+
     def serialize(self, include_performance=True):
         if include_performance:
             return {
@@ -326,9 +479,6 @@ class ChoiceGroup(Group):
                 ]
             }
 
-    def __hash__(self):
-        return tuple(sorted(self)).__hash__()
-
     def sort(self):
         return ChoiceGroup(
             sorted([x.sort() for x in self], key=lambda x: repr(x)), id=self.id
@@ -374,6 +524,9 @@ class ChoiceGroup(Group):
 
 
 class FallthroughGroup(Group):
+    ordered = False
+    identity_includes_infix_type = False
+
     def serialize(self, include_performance=True):
         if include_performance:
             return {
@@ -391,9 +544,6 @@ class FallthroughGroup(Group):
                 ]
             }
 
-    def __hash__(self):
-        return tuple(sorted(self)).__hash__()
-
     def sort(self):
         return FallthroughGroup(
             sorted([x.sort() for x in self], key=lambda x: repr(x)), id=self.id
@@ -458,10 +608,6 @@ class LoopGroup(Group):
                 "infix_type": self.infix_type,
             }
 
-    def __hash__(self):
-        temp_tuple_with_infix = tuple(self) + (self.infix_type,)
-        return temp_tuple_with_infix.__hash__()
-
     def sort(self):
         return self
 
@@ -485,10 +631,6 @@ class SkipGroup(Group):
             "infix_type": self.infix_type,
         }
 
-    def __hash__(self):
-        temp_tuple_with_infix = tuple(self) + (self.infix_type,)
-        return temp_tuple_with_infix.__hash__()
-
     def sort(self):
         return self
 
@@ -505,6 +647,8 @@ class SkipGroup(Group):
 
 
 class LeafGroup(Group):
+    ordered = False
+
     def serialize(self, include_performance=True):
         if self[0] == ARTIFICAL_END_NAME:
             return {"end": True}
@@ -522,10 +666,6 @@ class LeafGroup(Group):
         else:
             return {"leaf": sorted(self), "infix_type": self.infix_type, "id": self.id}
 
-    def __hash__(self):
-        temp_tuple_with_infix = tuple(sorted(self)) + (self.infix_type,)
-        return temp_tuple_with_infix.__hash__()
-
     # Sorted by default
     def sort(self):
         return LeafGroup(self, id=self.id)
@@ -543,6 +683,95 @@ class LeafGroup(Group):
         return len([x for x in self])
 
 
+def _group_hash(group: Group, memo: dict) -> int:
+    # memo holds the hashes of unfrozen groups during one hash or equality check, frozen groups cache them
+    if group._hash is not None:
+        return group._hash
+
+    group_hash = memo.get(id(group))
+    if group_hash is None:
+        member_hashes = [_member_hash(e, memo) for e in list.__iter__(group)]
+        if not group.ordered:
+            member_hashes.sort()
+        infix_type = group.infix_type if group.identity_includes_infix_type else None
+        group_hash = hash((type(group).__name__, infix_type, tuple(member_hashes)))
+        memo[id(group)] = group_hash
+        if group._frozen:
+            group._hash = group_hash
+
+    return group_hash
+
+
+def _member_hash(member, memo: dict) -> int:
+    if isinstance(member, Group):
+        return _group_hash(member, memo)
+
+    return hash(member)
+
+
+def _groups_equal(g1: Group, g2: Group, memo: dict) -> bool:
+    if g1 is g2:
+        return True
+
+    # frozen groups reject unequal groups by their cached fingerprints, collisions never make groups equal
+    if g1._frozen and g2._frozen and g1._fingerprint != g2._fingerprint:
+        return False
+
+    if type(g1) is not type(g2) or list.__len__(g1) != list.__len__(g2):
+        return False
+
+    if g1.identity_includes_infix_type and g1.infix_type != g2.infix_type:
+        return False
+
+    if g1.ordered:
+        return all(
+            _members_equal(e1, e2, memo)
+            for e1, e2 in zip(list.__iter__(g1), list.__iter__(g2))
+        )
+
+    members1 = sorted(list.__iter__(g1), key=lambda e: _member_hash(e, memo))
+    members2 = sorted(list.__iter__(g2), key=lambda e: _member_hash(e, memo))
+    if [_member_hash(e, memo) for e in members1] != [
+        _member_hash(e, memo) for e in members2
+    ]:
+        return False
+
+    if all(_members_equal(e1, e2, memo) for e1, e2 in zip(members1, members2)):
+        return True
+
+    # unequal members with equal hashes might be sorted differently
+    for e1 in members1:
+        match = next(
+            (i for i, e2 in enumerate(members2) if _members_equal(e1, e2, memo)), None
+        )
+        if match is None:
+            return False
+        del members2[match]
+
+    return True
+
+
+def _members_equal(e1, e2, memo: dict) -> bool:
+    if isinstance(e1, Group) and isinstance(e2, Group):
+        return _groups_equal(e1, e2, memo)
+
+    return e1 == e2
+
+
+def _member_fingerprint(member) -> bytes:
+    if isinstance(member, Group):
+        return member.fingerprint()
+
+    return blake2b(repr(member).encode(), digest_size=FINGERPRINT_SIZE).digest()
+
+
+def _restore_group(group_type, members, state):
+    group = group_type.__new__(group_type)
+    list.extend(group, members)
+    group.__dict__.update(state)
+    return group
+
+
 def get_compare(G_follows):
     def compare(p1, p2):
         e1 = next(iter(p1))
@@ -600,6 +829,141 @@ def split_graph(G_follows, G_parallel):
 
 
 def split_group(g):
+    """
+    Splits a concurrency graph into its variant by alternating sequence cuts (components of the parallel
+    relation) and parallel cuts (components of the follows relation). Produces the same groups as
+    split_group_networkx, but represents the relations as adjacency bitsets, i.e., a node set is an int
+    and a connected component is found by a few bitwise operations per breadth-first layer.
+    """
+    # a fixed node order makes the order of leaves and parallel branches deterministic
+    nodes = sorted(g.events, key=str)
+    try:
+        follows, parallel = __adjacency_matrices(g, nodes)
+    except KeyError:
+        # the relations contain nodes that are missing in the events
+        nodes = sorted(
+            set(g.events).union(*g.follows).union(*g.concurrency_pairs), key=str
+        )
+        follows, parallel = __adjacency_matrices(g, nodes)
+
+    successors = __bitsets(follows)
+    follows_neighbours = __bitsets(follows | follows.T)
+    parallel_neighbours = __bitsets(parallel | parallel.T)
+
+    v = __split_nodes(
+        (1 << len(nodes)) - 1,
+        nodes,
+        successors,
+        follows_neighbours,
+        parallel_neighbours,
+    )
+    return v.freeze()
+
+
+def __split_nodes(
+    node_set: int,
+    nodes: List,
+    successors: List[int],
+    follows_neighbours: List[int],
+    parallel_neighbours: List[int],
+) -> Group:
+    if node_set & (node_set - 1) == 0:
+        return LeafGroup(__members(node_set, nodes))
+
+    components = __connected_components(node_set, parallel_neighbours)
+    if len(components) > 1:
+        # the components of a sequence cut are totally ordered by the follows relation
+        components = sorted(
+            components,
+            key=cmp_to_key(
+                lambda c1, c2: (
+                    -1 if successors[__lowest_node(c1)] >> __lowest_node(c2) & 1 else 1
+                )
+            ),
+        )
+        group = SequenceGroup()
+    else:
+        components = __connected_components(node_set, follows_neighbours)
+        if len(components) == 1:
+            return LeafGroup(__members(node_set, nodes))
+        group = ParallelGroup()
+
+    for component in components:
+        group.append(
+            __split_nodes(
+                component, nodes, successors, follows_neighbours, parallel_neighbours
+            )
+        )
+
+    return group
+
+
+def __adjacency_matrices(g, nodes: List) -> Tuple[np.ndarray, np.ndarray]:
+    index = {node: i for i, node in enumerate(nodes)}
+    return (
+        __adjacency_matrix(g.follows, index),
+        __adjacency_matrix(map(tuple, g.concurrency_pairs), index),
+    )
+
+
+def __adjacency_matrix(edges: Iterable[Tuple], index: Mapping) -> np.ndarray:
+    edges = list(edges)
+    # the first and the last node of an edge, i.e., self loops may be given as 1-tuples
+    endpoints = np.fromiter(
+        map(index.__getitem__, chain.from_iterable((e[0], e[-1]) for e in edges)),
+        dtype=np.int64,
+        count=2 * len(edges),
+    )
+
+    adjacency = np.zeros((len(index), len(index)), dtype=bool)
+    adjacency[endpoints[0::2], endpoints[1::2]] = True
+    return adjacency
+
+
+def __bitsets(adjacency: np.ndarray) -> List[int]:
+    # bit j of the int of node i is set iff adjacency[i, j]
+    rows = np.packbits(adjacency, axis=1, bitorder="little")
+    return [int.from_bytes(row.tobytes(), "little") for row in rows]
+
+
+def __connected_components(node_set: int, neighbours: List[int]) -> List[int]:
+    components = []
+    remaining = node_set
+    while remaining:
+        component = frontier = remaining & -remaining
+        while frontier:
+            reachable = 0
+            while frontier:
+                node = frontier & -frontier
+                reachable |= neighbours[node.bit_length() - 1]
+                frontier ^= node
+            frontier = reachable & remaining & ~component
+            component |= frontier
+
+        components.append(component)
+        remaining &= ~component
+
+    return components
+
+
+def __lowest_node(node_set: int) -> int:
+    return (node_set & -node_set).bit_length() - 1
+
+
+def __members(node_set: int, nodes: List) -> List:
+    members = []
+    while node_set:
+        node = node_set & -node_set
+        members.append(nodes[node.bit_length() - 1])
+        node_set ^= node
+
+    return members
+
+
+def split_group_networkx(g):
+    """
+    Reference implementation of split_group on networkx graphs
+    """
     G_follows = nx.DiGraph()
     G_follows.add_nodes_from(g.events)
     G_follows.add_edges_from(g.follows)
@@ -614,7 +978,7 @@ def split_group(g):
             G_parallel.add_edge(edge[0], edge[1])
 
     v = split_graph(G_follows, G_parallel)
-    return v
+    return v.freeze()
 
 
 def create_graph_for_cvariant(cvariant):
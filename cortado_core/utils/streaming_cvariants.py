@@ -0,0 +1,179 @@
+import gzip
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List
+
+from lxml import etree
+from pm4py.objects.log.obj import Event, EventLog, Trace
+from pm4py.util import xes_constants
+from pm4py.util.dt_parsing import parser as dt_parser
+from pm4py.util.xes_constants import DEFAULT_TRACEID_KEY
+
+from cortado_core.utils.cvariants import to_filtered_interval_log, variants_from_graphs
+from cortado_core.utils.encoded_cvariants import (
+    compute_case_patterns,
+    pattern_to_cgroups_graph,
+    renamed_activities_of_patterns,
+)
+from cortado_core.utils.encoded_log import EncodedLog, encode_dataframe, encode_traces
+from cortado_core.utils.split_graph import Group
+from cortado_core.utils.timestamp_utils import TimeUnit
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+class StreamingConcurrencyVariants:
+    """
+    Computes concurrency variants of logs that do not fit into memory. Traces are consumed chunk-wise
+    and only reduced to their case fingerprint (see encoded_cvariants.compute_case_patterns) and case id,
+    i.e., memory is bounded by the number of distinct fingerprints and the number of case ids.
+    """
+
+    def __init__(
+        self,
+        time_granularity: TimeUnit = min(TimeUnit),
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.time_granularity = time_granularity
+        self.chunk_size = chunk_size
+        self.activities: Dict[str, int] = {}
+        self.case_ids_per_pattern: Dict[bytes, List[Any]] = {}
+        self.n_cases = 0
+        # number of traces consumed by add_traces, including empty ones
+        self.n_traces = 0
+
+    def add_traces(self, traces: Iterable[Trace]):
+        """
+        Adds traces of an arbitrary iterable, e.g., iterate_xes_traces. Traces without a case id are
+        identified by their position in the stream.
+        """
+        traces = iter(traces)
+        while True:
+            chunk = list(islice(traces, self.chunk_size))
+            if len(chunk) == 0:
+                break
+
+            # empty traces have no variant, they are dropped before the interval log is built
+            non_empty_traces = [
+                Trace(
+                    trace,
+                    attributes={
+                        DEFAULT_TRACEID_KEY: self.n_traces + i,
+                        **trace.attributes,
+                    },
+                )
+                for i, trace in enumerate(chunk)
+                if len(trace) > 0
+            ]
+            self.n_traces += len(chunk)
+            if len(non_empty_traces) == 0:
+                continue
+
+            encoded_chunk = encode_traces(
+                list(to_filtered_interval_log(EventLog(non_empty_traces))),
+                self.activities,
+            )
+            # only the fingerprints of the traces are kept
+            encoded_chunk.traces = None
+            self.add_encoded_log(encoded_chunk)
+
+    def add_dataframes(self, dataframes: Iterable, **dataframe_keys):
+        """
+        Adds pandas/pyarrow dataframes, e.g., the record batches of a parquet reader. All rows of a case
+        must be contained in the same dataframe.
+        """
+        for df in dataframes:
+            self.add_encoded_log(
+                encode_dataframe(df, activities=self.activities, **dataframe_keys)
+            )
+
+    def add_encoded_log(self, encoded_log: EncodedLog):
+        """
+        Adds an encoded log whose activity ids were interned with self.activities
+        """
+        patterns = compute_case_patterns(encoded_log, self.time_granularity)
+        for case_id, pattern in zip(encoded_log.case_ids, patterns):
+            self.case_ids_per_pattern.setdefault(pattern, []).append(case_id)
+
+        self.n_cases += encoded_log.n_cases
+
+    def get_variants(self, use_mp: bool = False, pool=None) -> Dict[Group, List[Any]]:
+        """
+        Returns the variants of all traces added so far together with the case ids of their traces
+        """
+        activities = list(self.activities.keys())
+
+        graphs = {}
+        for pattern, case_ids in self.case_ids_per_pattern.items():
+            graph = pattern_to_cgroups_graph(pattern, activities)
+            graphs.setdefault(graph, []).extend(case_ids)
+
+        names = renamed_activities_of_patterns(self.case_ids_per_pattern, activities)
+
+        return variants_from_graphs(graphs, names, use_mp, pool)
+
+
+def get_concurrency_variants_streaming(
+    traces: Iterable[Trace],
+    time_granularity: TimeUnit = min(TimeUnit),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    use_mp: bool = False,
+    pool=None,
+) -> Dict[Group, List[Any]]:
+    """
+    Computes the concurrency variants of a stream of traces, mapping each variant to the case ids of
+    its traces instead of the traces themselves
+    """
+    streaming_variants = StreamingConcurrencyVariants(time_granularity, chunk_size)
+    streaming_variants.add_traces(traces)
+
+    return streaming_variants.get_variants(use_mp, pool)
+
+
+def iterate_xes_traces(path: str) -> Iterator[Trace]:
+    """
+    Lazily parses the traces of a (gzipped) XES file. Only flat trace and event attributes are read,
+    nested attributes and log level information are skipped.
+    """
+    date_parser = dt_parser.get()
+    open_file = gzip.open if path.endswith(".gz") else open
+
+    with open_file(path, "rb") as file:
+        for _, element in etree.iterparse(file, events=("end",), tag="{*}trace"):
+            trace = Trace()
+            for child in element:
+                if child.tag.endswith(xes_constants.TAG_EVENT):
+                    event = Event()
+                    for attribute in child:
+                        __parse_attribute(attribute, event, date_parser)
+                    trace.append(event)
+                else:
+                    __parse_attribute(child, trace.attributes, date_parser)
+
+            # free the memory of the parsed trace and of its already processed siblings
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+            yield trace
+
+
+def __parse_attribute(element, attributes, date_parser):
+    key = element.get(xes_constants.KEY_KEY)
+    value = element.get(xes_constants.KEY_VALUE)
+    if key is None or value is None:
+        return
+
+    tag = etree.QName(element).localname
+    try:
+        if tag == xes_constants.TAG_DATE:
+            value = date_parser.apply(value)
+        elif tag == xes_constants.TAG_INT:
+            value = int(value)
+        elif tag == xes_constants.TAG_FLOAT:
+            value = float(value)
+        elif tag == xes_constants.TAG_BOOLEAN:
+            value = value.lower() == "true"
+    except (TypeError, ValueError):
+        return
+
+    attributes[key] = value
@@ -14,18 +14,30 @@ from pm4py.objects.petri_net.utils.align_utils import STD_MODEL_LOG_MOVE_COST
 from pm4py.util.typing import AlignmentResult
 
 from cortado_core.models.infix_type import InfixType
-from cortado_core.process_tree_utils.miscellaneous import is_leaf_node, is_subtree
+from cortado_core.process_tree_utils.miscellaneous import (
+    get_index_of_pt_in_children_list,
+    get_root,
+    is_leaf_node,
+)
+from cortado_core.process_tree_utils.reduction import (
+    reduce_loops_with_more_than_two_children,
+)
 from cortado_core.process_tree_utils.to_petri_net_transition_bordered import (
-    apply as pt_to_petri_net,
+    apply_cached as pt_to_petri_net,
+    structural_fingerprint,
 )
 from cortado_core.utils.alignment_utils import (
     alignment_contains_deviation,
     calculate_infix_postfix_prefix_alignment,
     is_log_move,
 )
+from cortado_core.utils.lca_utils import rediscover_subtree_and_modify_pt
 from cortado_core.utils.parallel_alignments import calculate_alignments_parallel
 from cortado_core.utils.trace import TypedTrace, combine_event_logs
 
+# executions of process tree nodes given by their activities, keyed by the identity of the nodes
+NodeActivitySequences = dict[int, tuple[ProcessTree, list[tuple[str, ...]]]]
+
 
 def calculate_sublog_for_lca(
     pt: ProcessTree,
@@ -36,6 +48,7 @@ def calculate_sublog_for_lca(
     trace_to_add,
     infix_type: InfixType,
     pool,
+    sublog_index: Optional["SublogIndex"] = None,
 ) -> EventLog:
     """
     Calculates the sublog given a process tree with its lca.
@@ -49,22 +62,31 @@ def calculate_sublog_for_lca(
     trace_to_add: trace/fragment that is added
     infix_type: type of the trace/fragment that is added
     pool
+    sublog_index: projections of the full traces of the log, if None, the full traces are aligned again
 
     Returns
     -------
 
     """
     not_infix_log, infix_traces = __split_log_by_infix_type(log)
-    sublogs = __calculate_sub_log_for_each_node_regular_traces(
-        pt, not_infix_log, pool=pool
-    )
+    if sublog_index is not None:
+        sublog = sublog_index.sublog(pt, lca)
+        sublogs = {}
+    else:
+        sublogs = __calculate_sub_log_for_each_node_regular_traces(
+            pt, not_infix_log, pool=pool
+        )
+        sublog = sublogs[lca.id] if lca.id in sublogs else EventLog()
     # adding the fitting prefix is important to ensure that we do not add deviations in the alignment that are on
     # the left-hand side of the current deviation
     sublogs = __add_fitting_alignment_prefix_to_sublogs(
         alignment, deviation_i, infix_type, sublogs
     )
 
-    sublog = sublogs[lca.id] if lca.id in sublogs else EventLog()
+    if sublog_index is not None and lca.id in sublogs:
+        sublog = combine_event_logs(sublog, sublogs[lca.id])
+    elif lca.id in sublogs:
+        sublog = sublogs[lca.id]
     sublog.append(trace_to_add)
 
     return combine_event_logs(
@@ -72,6 +94,185 @@ def calculate_sublog_for_lca(
     )
 
 
+def calculate_sublog_for_lca_of_traces(
+    pt: ProcessTree,
+    log: list[TypedTrace],
+    lca: ProcessTree,
+    traces_to_add: list[Trace],
+    fitting_prefix_sublogs: dict[int, EventLog],
+    pool,
+    sublog_index: Optional["SublogIndex"] = None,
+) -> EventLog:
+    """
+    Counterpart of calculate_sublog_for_lca for several traces/fragments that are added at once. Besides the
+    sublog of the log, the sublog contains the fitting alignment prefixes of all deviating traces (see
+    calculate_fitting_prefix_sublogs) and the traces to add.
+    """
+    not_infix_log, infix_traces = __split_log_by_infix_type(log)
+    if sublog_index is not None:
+        sublog = sublog_index.sublog(pt, lca)
+    else:
+        sublogs = __calculate_sub_log_for_each_node_regular_traces(
+            pt, not_infix_log, pool=pool
+        )
+        sublog = sublogs[lca.id] if lca.id in sublogs else EventLog()
+
+    if lca.id in fitting_prefix_sublogs:
+        sublog = combine_event_logs(sublog, EventLog(fitting_prefix_sublogs[lca.id]))
+    for trace_to_add in traces_to_add:
+        sublog.append(trace_to_add)
+
+    return combine_event_logs(
+        sublog, calculate_sublog_for_infix_prefix_postfix_traces(infix_traces, pt, lca)
+    )
+
+
+def calculate_fitting_prefix_sublogs(
+    deviations: list[tuple[AlignmentResult, int, InfixType]],
+) -> dict[int, EventLog]:
+    """
+    Calculates the sublogs of the fitting alignment prefixes of several deviating traces/fragments, a deviation is
+    given by (alignment, index of the deviation in the alignment, infix type)
+    """
+    sublogs = {}
+    for alignment, deviation_i, infix_type in deviations:
+        sublogs = __add_fitting_alignment_prefix_to_sublogs(
+            alignment, deviation_i, infix_type, sublogs
+        )
+
+    return sublogs
+
+
+class SublogIndex:
+    """
+    Projections of the full traces of a log onto every node of a process tree, i.e., the sublogs of the nodes
+    derived from the alignments of the traces. The projections are computed on the first lookup and kept while
+    the tree is repaired. When a subtree is rediscovered, only the projections onto the nodes of the
+    rediscovered subtree are computed by aligning the projections onto the replaced subtree, which fit the
+    rediscovered subtree, against it. The projections onto the remaining nodes do not change. If the tree was
+    modified otherwise, which is detected by its structural fingerprint, all projections are recomputed.
+    """
+
+    def __init__(self, log: list[TypedTrace], pool=None):
+        self.log = EventLog(
+            [t.trace for t in log if t.infix_type == InfixType.NOT_AN_INFIX]
+        )
+        self.pool = pool
+        self.rebuilds = 0
+        self.updates = 0
+        self.__fingerprint = None
+        self.__projections: NodeActivitySequences = {}
+
+    def sublog(self, pt: ProcessTree, node: ProcessTree) -> EventLog:
+        """
+        Returns a new event log containing the projections onto node, pt is the root of the tree
+        """
+        if self.__fingerprint != structural_fingerprint(pt):
+            self.__projections = calculate_activity_sequences_of_nodes(
+                pt, self.log, self.pool
+            )
+            self.__fingerprint = structural_fingerprint(pt)
+            self.rebuilds += 1
+
+        if id(node) not in self.__projections:
+            return EventLog()
+
+        return create_event_log(self.__projections[id(node)][1])
+
+    def add_traces(self, pt: ProcessTree, traces: list[TypedTrace]):
+        """
+        Adds traces that fit pt to the log, pt is the root of the tree
+        """
+        log = EventLog(
+            [t.trace for t in traces if t.infix_type == InfixType.NOT_AN_INFIX]
+        )
+        self.log = combine_event_logs(self.log, log)
+        if self.__fingerprint != structural_fingerprint(pt):
+            return
+
+        for key, (node, projections) in calculate_activity_sequences_of_nodes(
+            pt, log, self.pool
+        ).items():
+            self.__projections.setdefault(key, (node, []))[1].extend(projections)
+
+    def rediscover_subtree(self, subtree: ProcessTree, sublog: EventLog) -> ProcessTree:
+        """
+        Rediscovers the subtree (see rediscover_subtree_and_modify_pt) and updates the projections, returns the
+        root of the modified tree
+        """
+        parent = subtree.parent
+        if parent is not None:
+            index = get_index_of_pt_in_children_list(parent, subtree)
+        root = rediscover_subtree_and_modify_pt(subtree, sublog)
+        if self.__fingerprint is None:
+            return root
+
+        rediscovered_subtree = parent.children[index] if parent is not None else root
+        # necessary, because pt_to_petri_net method is only implemented for 2-loops
+        reduce_loops_with_more_than_two_children(rediscovered_subtree)
+        self.__replace_projections(subtree, rediscovered_subtree)
+        self.__fingerprint = structural_fingerprint(root)
+        self.updates += 1
+
+        return root
+
+    def is_up_to_date(self, pt: ProcessTree) -> bool:
+        """
+        Returns whether the projections were calculated for the current structure of pt, pt is the root of the tree
+        """
+        return self.__fingerprint == structural_fingerprint(pt)
+
+    def restructure_subtree(self, subtree: ProcessTree):
+        """
+        Updates the projections after subtree was restructured in place without changing its language, e.g., by
+        pulling down the lca. Only the projections onto subtree are aligned against it, the projections onto the
+        remaining nodes do not change. Must only be called if the index was up-to-date before the restructuring.
+        """
+        if self.__fingerprint is None:
+            return
+
+        self.__replace_projections(subtree, subtree)
+        self.__fingerprint = structural_fingerprint(get_root(subtree))
+        self.updates += 1
+
+    def __replace_projections(self, subtree: ProcessTree, new_subtree: ProcessTree):
+        _, projections = self.__projections.get(id(subtree), (subtree, []))
+        for node in get_all_nodes(subtree):
+            self.__projections.pop(id(node), None)
+
+        self.__projections.update(
+            calculate_activity_sequences_of_nodes(
+                new_subtree, create_event_log(projections), self.pool
+            )
+        )
+
+
+def calculate_activity_sequences_of_nodes(
+    pt: ProcessTree, log: EventLog, pool=None
+) -> NodeActivitySequences:
+    """
+    Calculates the projections of a log that fits pt onto each node of pt. If pt is a subtree, it is aligned as a
+    tree of its own.
+    """
+    if len(log) == 0:
+        return {}
+
+    parent = pt.parent
+    pt.parent = None
+    try:
+        return __calculate_activity_sequences_regular_traces(pt, log, pool)
+    finally:
+        pt.parent = parent
+
+
+def get_all_nodes(pt: ProcessTree) -> list[ProcessTree]:
+    nodes = [pt]
+    for child in pt.children:
+        nodes.extend(get_all_nodes(child))
+
+    return nodes
+
+
 def calculate_sublog_for_infix_prefix_postfix_traces(
     infixes: list[TypedTrace], process_tree: ProcessTree, lca: ProcessTree
 ):
@@ -220,39 +421,58 @@ def remove_zeros_from_marking(marking):
 
 
 def add_alignment_to_sublogs(alignment, sublogs, allow_deviations=False):
+    for node, sequences in add_alignment_to_activity_sequences(
+        alignment, {}, allow_deviations
+    ).values():
+        if node.id not in sublogs:
+            sublogs[node.id] = EventLog()
+        combine_event_logs(sublogs[node.id], create_event_log(sequences))
+
+    return sublogs
+
+
+def add_alignment_to_activity_sequences(
+    alignment, sequences: NodeActivitySequences, allow_deviations=False
+) -> NodeActivitySequences:
+    """
+    Adds the activities of every execution of a node in the alignment to sequences. The active nodes that execute
+    an activity are found by following the parents of its leaf, i.e., every move takes O(height of the tree).
+    """
     if not allow_deviations:
         assert not alignment_contains_deviation(alignment)
-    currently_active_pt_nodes = {}
+    currently_active_pt_nodes: dict[int, list[str]] = {}
 
     for step in alignment["alignment"]:
         # executed transition always corresponds to a node in the process tree
         current_pt = step[0][1][0]
-        if (current_pt, current_pt.id) in currently_active_pt_nodes:
-            if current_pt.id not in sublogs:
-                sublogs[current_pt.id] = EventLog()
-
-            sublogs[current_pt.id].append(
-                currently_active_pt_nodes[(current_pt, current_pt.id)]
-            )
+        if is_leaf_node(current_pt):
+            activity_name = step[1][1]
+            if activity_name:
+                ancestor = current_pt.parent
+                while ancestor is not None:
+                    if id(ancestor) in currently_active_pt_nodes:
+                        currently_active_pt_nodes[id(ancestor)].append(activity_name)
+                    ancestor = ancestor.parent
+        elif id(current_pt) in currently_active_pt_nodes:
             # every pt node occurs at least twice in an alignment, i.e., start and end. Hence when we observe a pt
             # node for the second time, we know it is closed
             assert step[0][1][1] == "closed"
-            del currently_active_pt_nodes[(current_pt, current_pt.id)]
-        elif not is_leaf_node(current_pt):
-            currently_active_pt_nodes[(current_pt, current_pt.id)] = Trace()
+            sequences.setdefault(id(current_pt), (current_pt, []))[1].append(
+                tuple(currently_active_pt_nodes.pop(id(current_pt)))
+            )
+        else:
+            currently_active_pt_nodes[id(current_pt)] = []
 
-        if is_leaf_node(current_pt):
-            activity_name = step[1][1]
-            if activity_name:
-                for active_node, active_node_obj_id in currently_active_pt_nodes:
-                    if is_subtree(active_node, current_pt):
-                        event = Event()
-                        event["concept:name"] = activity_name
-                        currently_active_pt_nodes[(active_node, active_node.id)].append(
-                            event
-                        )
+    return sequences
 
-    return sublogs
+
+def create_event_log(sequences: list[tuple[str, ...]]) -> EventLog:
+    return EventLog(
+        [
+            Trace([Event({"concept:name": activity}) for activity in sequence])
+            for sequence in sequences
+        ]
+    )
 
 
 def __split_log_by_infix_type(
@@ -296,7 +516,18 @@ def __calculate_sub_log_for_each_node_regular_traces(
     -------
 
     """
-    sublogs: dict[int, EventLog] = {}
+    return {
+        node.id: create_event_log(sequences)
+        for node, sequences in __calculate_activity_sequences_regular_traces(
+            pt, log, pool
+        ).values()
+    }
+
+
+def __calculate_activity_sequences_regular_traces(
+    pt: ProcessTree, log: EventLog, pool: Optional[multiprocessing.pool.Pool]
+) -> NodeActivitySequences:
+    sequences: NodeActivitySequences = {}
     # assumption: log is replayable on process tree without deviations
     net, im, fm = pt_to_petri_net(pt)
     if pool is not None:
@@ -316,9 +547,9 @@ def __calculate_sub_log_for_each_node_regular_traces(
             variant=variants_calculate_alignments.state_equation_a_star,
         )
     for alignment in alignments:
-        sublogs = add_alignment_to_sublogs(alignment, sublogs)
+        sequences = add_alignment_to_activity_sequences(alignment, sequences)
 
-    return sublogs
+    return sequences
 
 
 def __add_fitting_alignment_prefix_to_sublogs(
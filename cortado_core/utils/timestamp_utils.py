@@ -1,10 +1,16 @@
 import datetime
 import functools
 from enum import Enum
+from typing import List, Sequence, Tuple
 
+import numpy as np
 from pm4py.objects.log.util.sampling import sample_log
-from pm4py.objects.log.obj import EventLog
-from pm4py.util.xes_constants import DEFAULT_TIMESTAMP_KEY
+from pm4py.objects.log.obj import EventLog, Trace
+from pm4py.util.xes_constants import DEFAULT_START_TIMESTAMP_KEY, DEFAULT_TIMESTAMP_KEY
+
+EPOCH = datetime.datetime(1970, 1, 1)
+EPOCH_UTC = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+MICROSECOND = datetime.timedelta(microseconds=1)
 
 
 @functools.total_ordering
@@ -63,6 +69,89 @@ def transform_timestamp(timestamp: datetime, granularity: TimeUnit):
         return timestamp
 
 
+def transform_timestamps(timestamps: np.ndarray, granularity: TimeUnit) -> np.ndarray:
+    """
+    Vectorised counterpart of transform_timestamp for int64 microsecond arrays
+    """
+    if granularity is TimeUnit.SEC:
+        unit = "s"
+    elif granularity is TimeUnit.MIN:
+        unit = "m"
+    elif granularity is TimeUnit.HOUR:
+        unit = "h"
+    elif granularity is TimeUnit.DAY:
+        unit = "D"
+    elif granularity is TimeUnit.MONTH:
+        unit = "M"
+    else:
+        return timestamps
+
+    return (
+        timestamps.astype("datetime64[us]")
+        .astype(f"datetime64[{unit}]")
+        .astype("datetime64[us]")
+        .astype(np.int64)
+    )
+
+
+def to_epoch_microseconds(timestamp: datetime.datetime) -> int:
+    """
+    Microseconds since the epoch in UTC, naive timestamps are interpreted as UTC (see to_utc)
+    """
+    if timestamp.tzinfo is None:
+        return (timestamp - EPOCH) // MICROSECOND
+
+    return (timestamp - EPOCH_UTC) // MICROSECOND
+
+
+def transform_log_timestamps(
+    traces: Sequence[Trace], granularity: TimeUnit
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Transforms the start and complete timestamps of all events of an interval log at once and returns them per
+    trace, see get_transformed_timestamps. The arrays are not cached, i.e., they are only valid as long as the
+    traces are not modified.
+    """
+    start_timestamps, complete_timestamps = __transform_events(
+        [event for trace in traces for event in trace], granularity
+    )
+
+    timestamps = []
+    offset = 0
+    for trace in traces:
+        upper = offset + len(trace)
+        timestamps.append(
+            (start_timestamps[offset:upper], complete_timestamps[offset:upper])
+        )
+        offset = upper
+
+    return timestamps
+
+
+def get_transformed_timestamps(
+    trace: Sequence, granularity: TimeUnit
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the start and complete timestamps of the events of an interval trace as int64 microseconds since
+    the epoch, truncated to the time granularity (as transform_timestamp does)
+    """
+    return __transform_events(trace, granularity)
+
+
+def __transform_events(events, granularity: TimeUnit) -> Tuple[np.ndarray, np.ndarray]:
+    timestamps = np.array(
+        [
+            to_epoch_microseconds(event[key])
+            for event in events
+            for key in (DEFAULT_START_TIMESTAMP_KEY, DEFAULT_TIMESTAMP_KEY)
+        ],
+        dtype=np.int64,
+    )
+    timestamps = transform_timestamps(timestamps, granularity)
+
+    return timestamps[0::2], timestamps[1::2]
+
+
 def get_time_granularity(event_log: EventLog):
     sample = sample_log(event_log, 500)
     timestamps = [event[DEFAULT_TIMESTAMP_KEY] for trace in sample for event in trace]
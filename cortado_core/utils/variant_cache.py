@@ -0,0 +1,169 @@
+import json
+import os
+import pickle
+import tempfile
+from hashlib import blake2b
+from typing import Any, Dict, List, Mapping, Optional
+
+import numpy as np
+from pm4py.objects.log.obj import EventLog, Trace
+
+from cortado_core.subprocess_discovery.subtree_mining.treebank import (
+    TreeBankEntry,
+    create_treebank_from_cv_variants,
+)
+from cortado_core.utils.encoded_cvariants import (
+    compute_variant_case_indices,
+    encode_event_log,
+)
+from cortado_core.utils.encoded_log import ARRAY_ATTRIBUTES, EncodedLog
+from cortado_core.utils.split_graph import Group
+from cortado_core.utils.timestamp_utils import TimeUnit
+
+# part of every cache key, i.e., incrementing it invalidates all cached files
+CACHE_FORMAT_VERSION = 1
+VARIANTS_SUFFIX = ".variants.pkl"
+TREEBANK_SUFFIX = ".treebank.pkl"
+
+
+def log_content_hash(encoded_log: EncodedLog, time_granularity: TimeUnit) -> str:
+    """
+    Hashes the activities and (interval) timestamps of all cases together with the time granularity.
+    Case ids and other attributes are not part of the hash, since they do not influence the variants.
+    """
+    h = blake2b(digest_size=16)
+    h.update(f"{CACHE_FORMAT_VERSION}:{time_granularity.name}:".encode())
+    h.update(json.dumps(encoded_log.activities).encode())
+    for attribute in ARRAY_ATTRIBUTES:
+        array = np.ascontiguousarray(getattr(encoded_log, attribute), dtype=np.int64)
+        h.update(attribute.encode())
+        h.update(array.tobytes())
+
+    return h.hexdigest()
+
+
+class VariantCache:
+    """
+    Persistent cache of the concurrency variants (and treebanks) of logs. Every log is stored in a
+    binary file named by its content hash, containing the frozen variants including their graph counts
+    and the indices of the traces per variant. On a cache hit, only the interval conversion and the
+    encoding of the log are computed, the indices are mapped to the traces of the given log.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def get_concurrency_variants(
+        self,
+        log: EventLog,
+        use_mp: bool = False,
+        time_granularity: TimeUnit = min(TimeUnit),
+        pool=None,
+    ) -> Dict[Group, List[Trace]]:
+        encoded_log = encode_event_log(log)
+        key = log_content_hash(encoded_log, time_granularity)
+
+        return self.__get_variants(encoded_log, key, use_mp, time_granularity, pool)
+
+    def create_treebank(
+        self,
+        log: EventLog,
+        time_granularity: TimeUnit = min(TimeUnit),
+        artifical_start: bool = False,
+        add_traces: bool = False,
+        use_mp: bool = False,
+        pool=None,
+    ) -> Mapping[int, TreeBankEntry]:
+        """
+        Cached counterpart of treebank.create_treebank_from_cv_variants applied to the variants of the log
+        """
+        encoded_log = encode_event_log(log)
+        key = log_content_hash(encoded_log, time_granularity)
+        variants = self.__get_variants(encoded_log, key, use_mp, time_granularity, pool)
+        variant_traces = list(variants.values())
+
+        path = self.__path(f"{key}.{int(artifical_start)}", TREEBANK_SUFFIX)
+        entries = self.__load(path)
+        if entries is None:
+            treebank = create_treebank_from_cv_variants(variants, artifical_start)
+            # the treebank orders the variants by their number of traces, keep their positions for the traces
+            positions = {id(traces): i for i, traces in enumerate(variant_traces)}
+            order = sorted(
+                variants.keys(), key=lambda v: len(variants[v]), reverse=True
+            )
+            entries = [
+                (entry, positions[id(variants[variant])])
+                for entry, variant in zip(treebank.values(), order)
+            ]
+            self.__dump(path, entries)
+
+        treebank = {}
+        for entry, position in entries:
+            if add_traces:
+                entry.traces = variant_traces[position]
+            treebank[entry.uid] = entry
+
+        return treebank
+
+    def clear(self):
+        for file_name in os.listdir(self.directory):
+            if file_name.endswith(VARIANTS_SUFFIX) or file_name.endswith(
+                TREEBANK_SUFFIX
+            ):
+                os.remove(os.path.join(self.directory, file_name))
+
+    def __get_variants(
+        self,
+        encoded_log: EncodedLog,
+        key: str,
+        use_mp: bool,
+        time_granularity: TimeUnit,
+        pool,
+    ) -> Dict[Group, List[Trace]]:
+        path = self.__path(key, VARIANTS_SUFFIX)
+        cached_variants = self.__load(path)
+        if cached_variants is None:
+            cached_variants = [
+                (variant, np.asarray(cases, dtype=np.int32))
+                for variant, cases in compute_variant_case_indices(
+                    encoded_log, use_mp, time_granularity, pool
+                ).items()
+            ]
+            self.__dump(path, cached_variants)
+
+        return {
+            variant: [encoded_log.get_trace(case) for case in cases.tolist()]
+            for variant, cases in cached_variants
+        }
+
+    def __path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key + suffix)
+
+    def __load(self, path: str) -> Optional[Any]:
+        try:
+            with open(path, "rb") as file:
+                content = pickle.load(file)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # truncated files or files pickled by other versions of the classes are recomputed
+            self.misses += 1
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        self.hits += 1
+        return content
+
+    def __dump(self, path: str, content: Any):
+        # write to a temporary file first, i.e., concurrent readers never see partially written files
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(file_descriptor, "wb") as file:
+            pickle.dump(content, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)